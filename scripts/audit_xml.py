@@ -1,113 +1,161 @@
 #!/usr/bin/env python3
 """Comprehensive audit of XML elements parsed vs dropped by xml_to_dxf.py converter.
 
-Analyzes all three XML files and compares against what the converter handles.
+Analyzes the XML files given on the command line (or the three reference
+designs by default) and compares against what the converter handles.
 """
 
-import xml.etree.ElementTree as ET
 from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+import argparse
 import sys
 import os
 
+from lxml import etree as ET
+
+
+# huge_tree lifts libxml2's depth/size limits for the large board exports;
+# comments and PIs are dropped so they never show up as BOARD children.
+_PARSER_OPTIONS = dict(
+    huge_tree=True,
+    collect_ids=False,
+    remove_comments=True,
+    remove_pis=True,
+)
+
+# Copper SHAPEs (TRACK/FILL) only carry a LAYER-INDEX besides geometry.
+_COPPER_SHAPE_LAYER_TAGS = frozenset({"LAYER-INDEX"})
+_PAD_SHAPE_TAGS = frozenset({"CIRCLE", "RECTANGLE", "POLYGON"})
+_PAD_KNOWN_CHILDREN = frozenset({
+    "POSE", "LAYER-INDEX", "LAYER-SPECIFIER", "PAD-STACK", "HOLE",
+})
+_INST_KNOWN_CHILDREN = frozenset({"POSE", "DESIGNATOR-TEXT", "LAYER-INDEX"})
+
+# Attributes / children the converter actually reads.
+_PARSED_PAD_ATTRS = frozenset({"NAME", "TYPE", "SIDE"})
+_PARSED_INST_ATTRS = frozenset({"DESIGNATOR", "PACKAGE", "SIDE"})
+_PARSED_TRACK_ATTRS = frozenset({"NET"})
+_PARSED_FILL_ATTRS = frozenset({"NET"})
+_PARSED_VIA_ATTRS = frozenset({"DIAMETER", "HOLE-DIAMETER", "NET"})
+_PARSED_VIA_CHILDREN = frozenset({"POINT", "START-LAYER", "END-LAYER"})
+
 
 def short_name(path):
     """Return just the filename for display."""
     return os.path.basename(path)
 
 
-def audit_file(xml_path):
-    """Perform comprehensive audit of a single XML file."""
-    tree = ET.parse(xml_path)
-    root = tree.getroot()
-    board = root.find("BOARD")
-    schematic = root.find("SCHEMATIC")
-    results = {}
+def _new_board_state():
+    """Return the accumulators filled in by the per-tag BOARD child handlers."""
+    return {
+        "board_shape_by_layer": defaultdict(int),
+        "board_shape_layer_type": defaultdict(int),
+        "board_shape_geom": Counter(),
+        "board_shape_lines_count": 0,
+        "board_shape_arcs_count": 0,
+        "packages": {},
+        "inst_count": 0,
+        "inst_attribs": Counter(),
+        "inst_children_other": Counter(),
+        "inst_pin_net_count": 0,
+        "track_attribs": Counter(),
+        "track_shape_count": 0,
+        "track_shape_geom": Counter(),
+        "fill_attribs": Counter(),
+        "fill_children": Counter(),
+        "fill_shape_geom": Counter(),
+        "via_attribs": Counter(),
+        "via_children": Counter(),
+        "manufacturing_rules_attribs": None,
+    }
 
-    # ── 1. Count ALL direct children of BOARD by tag name ──
-    board_children = Counter()
-    for child in board:
-        board_children[child.tag] += 1
-    results["board_children"] = dict(board_children)
 
-    # ── 2. Board-level SHAPE analysis ──
-    board_shape_info = []
-    for shape in board.findall("SHAPE"):
-        info = {}
-        layer_spec = shape.find("LAYER-SPECIFIER")
-        layer_idx = shape.find("LAYER-INDEX")
-        if layer_spec is not None:
-            info["layer_type"] = "LAYER-SPECIFIER"
-            info["layer_name"] = layer_spec.get("NAME", "?")
-            info["layer_side"] = layer_spec.get("SIDE", "?")
-            info["sub_name"] = layer_spec.get("SUB-NAME", None)
-        elif layer_idx is not None:
-            info["layer_type"] = "LAYER-INDEX"
-            info["layer_index"] = layer_idx.get("INDEX", "?")
-            info["layer_side"] = layer_idx.get("SIDE", "?")
+def _split_shape_children(shape):
+    """Return (layer_spec, layer_idx, geom_tags) from one pass over a SHAPE.
+
+    layer_spec / layer_idx are the first LAYER-SPECIFIER / LAYER-INDEX
+    children (or None); geom_tags lists every other child tag in order.
+    """
+    layer_spec = None
+    layer_idx = None
+    geom_tags = []
+    for child in shape:
+        tag = child.tag
+        if tag == "LAYER-SPECIFIER":
+            if layer_spec is None:
+                layer_spec = child
+        elif tag == "LAYER-INDEX":
+            if layer_idx is None:
+                layer_idx = child
         else:
-            info["layer_type"] = "NONE"
-
-        # Geometry children
-        geom_types = []
-        for child in shape:
-            if child.tag not in ("LAYER-SPECIFIER", "LAYER-INDEX"):
-                geom_types.append(child.tag)
-        info["geometry"] = geom_types
-        board_shape_info.append(info)
-
-    # Summarize board shapes
-    board_shape_by_layer = Counter()
-    board_shape_geom = Counter()
-    board_shape_layer_type = Counter()
-    for s in board_shape_info:
-        key = s.get("layer_name", s.get("layer_index", "UNKNOWN"))
-        board_shape_by_layer[key] += 1
-        board_shape_layer_type[s["layer_type"]] += 1
-        for g in s["geometry"]:
-            board_shape_geom[g] += 1
-
-    results["board_shapes_by_layer"] = dict(board_shape_by_layer)
-    results["board_shapes_geom_types"] = dict(board_shape_geom)
-    results["board_shapes_layer_types"] = dict(board_shape_layer_type)
-
-    # ── 3. PACKAGE analysis ──
-    pkg_info = {}
-    for pkg in board.findall("PACKAGE"):
-        name = pkg.get("NAME")
-        pad_shapes = Counter()
-        pad_attribs = Counter()
-        pad_children_other = Counter()
-        for pad in pkg.findall("PAD"):
+            geom_tags.append(tag)
+    return layer_spec, layer_idx, geom_tags
+
+
+def _audit_board_shape(shape, state):
+    """Tally layer and geometry info for a board-level SHAPE."""
+    layer_spec, layer_idx, geom_types = _split_shape_children(shape)
+    if layer_spec is not None:
+        layer_type = "LAYER-SPECIFIER"
+        layer_key = layer_spec.get("NAME", "?")
+    elif layer_idx is not None:
+        layer_type = "LAYER-INDEX"
+        layer_key = layer_idx.get("INDEX", "?")
+    else:
+        layer_type = "NONE"
+        layer_key = "UNKNOWN"
+    state["board_shape_by_layer"][layer_key] += 1
+    state["board_shape_layer_type"][layer_type] += 1
+    state["board_shape_geom"].update(geom_types)
+
+    # The converter only parses POLYGON from board-level SHAPEs; count the
+    # shapes that contain a LINE / ARC (not the LINE / ARC children).
+    if "LINE" in geom_types:
+        state["board_shape_lines_count"] += 1
+    if "ARC" in geom_types:
+        state["board_shape_arcs_count"] += 1
+
+
+def _audit_package(pkg, state):
+    """Record PAD and SHAPE details for a PACKAGE."""
+    name = pkg.get("NAME")
+    num_pads = 0
+    num_shapes = 0
+    # Increment-only tallies use defaultdict(int), whose C default_factory
+    # is cheaper than Counter.__missing__; Counter is kept where bulk
+    # update() counting is used.
+    pad_shapes = defaultdict(int)
+    pad_attribs = Counter()
+    pad_children_other = defaultdict(int)
+    pkg_shape_by_layer = defaultdict(int)
+    pkg_shape_geom = Counter()
+    pkg_shape_layer_type = defaultdict(int)
+    pkg_other_children = defaultdict(int)
+
+    for elem in pkg:
+        elem_tag = elem.tag
+        if elem_tag == "PAD":
+            num_pads += 1
             # Count shape types
             has_shape = False
-            for child in pad:
-                if child.tag == "CIRCLE":
-                    pad_shapes["CIRCLE"] += 1
-                    has_shape = True
-                elif child.tag == "RECTANGLE":
-                    pad_shapes["RECTANGLE"] += 1
-                    has_shape = True
-                elif child.tag == "POLYGON":
-                    pad_shapes["POLYGON"] += 1
+            for child in elem:
+                tag = child.tag
+                if tag in _PAD_SHAPE_TAGS:
+                    pad_shapes[tag] += 1
                     has_shape = True
-                elif child.tag in ("POSE", "LAYER-INDEX", "LAYER-SPECIFIER", "PAD-STACK", "HOLE"):
+                elif tag in _PAD_KNOWN_CHILDREN:
                     pass  # Known children
                 else:
-                    pad_children_other[child.tag] += 1
+                    pad_children_other[tag] += 1
             if not has_shape:
                 pad_shapes["NO_SHAPE"] += 1
 
             # Count pad attributes
-            for attr in pad.attrib:
-                pad_attribs[attr] += 1
-
-        # SHAPE children of PACKAGE
-        pkg_shape_by_layer = Counter()
-        pkg_shape_geom = Counter()
-        pkg_shape_layer_type = Counter()
-        for shape in pkg.findall("SHAPE"):
-            layer_spec = shape.find("LAYER-SPECIFIER")
-            layer_idx = shape.find("LAYER-INDEX")
+            pad_attribs.update(elem.attrib.keys())
+
+        elif elem_tag == "SHAPE":
+            num_shapes += 1
+            layer_spec, layer_idx, geom_types = _split_shape_children(elem)
             if layer_spec is not None:
                 pkg_shape_layer_type["LAYER-SPECIFIER"] += 1
                 lname = layer_spec.get("NAME", "?")
@@ -118,129 +166,215 @@ def audit_file(xml_path):
             else:
                 pkg_shape_layer_type["NONE"] += 1
                 pkg_shape_by_layer["UNKNOWN"] += 1
+            pkg_shape_geom.update(geom_types)
+
+        else:
+            # Other PACKAGE children besides PAD and SHAPE
+            pkg_other_children[elem_tag] += 1
+
+    state["packages"][name] = {
+        "num_pads": num_pads,
+        "pad_shapes": dict(pad_shapes),
+        "pad_attribs": dict(pad_attribs),
+        "pad_children_other": dict(pad_children_other),
+        "num_shapes": num_shapes,
+        "shape_by_layer": dict(pkg_shape_by_layer),
+        "shape_geom": dict(pkg_shape_geom),
+        "shape_layer_type": dict(pkg_shape_layer_type),
+        "other_children": dict(pkg_other_children),
+    }
 
-            for child in shape:
-                if child.tag not in ("LAYER-SPECIFIER", "LAYER-INDEX"):
-                    pkg_shape_geom[child.tag] += 1
-
-        # Other PACKAGE children besides PAD and SHAPE
-        pkg_other_children = Counter()
-        for child in pkg:
-            if child.tag not in ("PAD", "SHAPE"):
-                pkg_other_children[child.tag] += 1
-
-        pkg_info[name] = {
-            "num_pads": len(pkg.findall("PAD")),
-            "pad_shapes": dict(pad_shapes),
-            "pad_attribs": dict(pad_attribs),
-            "pad_children_other": dict(pad_children_other),
-            "num_shapes": len(pkg.findall("SHAPE")),
-            "shape_by_layer": dict(pkg_shape_by_layer),
-            "shape_geom": dict(pkg_shape_geom),
-            "shape_layer_type": dict(pkg_shape_layer_type),
-            "other_children": dict(pkg_other_children),
-        }
-    results["packages"] = pkg_info
+
+def _audit_inst(inst, state):
+    """Record attributes, unexpected children and PIN-NETs for an INST."""
+    state["inst_count"] += 1
+    state["inst_attribs"].update(inst.attrib.keys())
+    inst_children_other = state["inst_children_other"]
+    for child in inst:
+        tag = child.tag
+        if tag not in _INST_KNOWN_CHILDREN:
+            inst_children_other[tag] += 1
+        # Check for PIN-NET inside INST
+        if tag == "PIN-NET":
+            state["inst_pin_net_count"] += 1
+
+
+def _audit_track(track, state):
+    """Record attributes and shape geometry for a TRACK."""
+    state["track_attribs"].update(track.attrib.keys())
+    track_shape_geom = state["track_shape_geom"]
+    for shape in track.findall("SHAPE"):
+        state["track_shape_count"] += 1
+        for child in shape:
+            tag = child.tag
+            if tag not in _COPPER_SHAPE_LAYER_TAGS:
+                track_shape_geom[tag] += 1
+
+
+def _audit_fill(fill, state):
+    """Record attributes, children and shape geometry for a FILL."""
+    state["fill_attribs"].update(fill.attrib.keys())
+    fill_children = state["fill_children"]
+    fill_shape_geom = state["fill_shape_geom"]
+    for child in fill:
+        tag = child.tag
+        fill_children[tag] += 1
+        if tag == "SHAPE":
+            for sc in child:
+                sc_tag = sc.tag
+                if sc_tag not in _COPPER_SHAPE_LAYER_TAGS:
+                    fill_shape_geom[sc_tag] += 1
+
+
+def _audit_via(via, state):
+    """Record attributes and children for a VIA."""
+    state["via_attribs"].update(via.attrib.keys())
+    state["via_children"].update(child.tag for child in via)
+
+
+def _audit_manufacturing_rules(mfg, state):
+    """Record the attributes of the first MANUFACTURING-RULES element."""
+    if state["manufacturing_rules_attribs"] is None:
+        state["manufacturing_rules_attribs"] = dict(mfg.attrib)
+
+
+# BOARD child tag -> handler(element, state)
+_BOARD_HANDLERS = {
+    "SHAPE": _audit_board_shape,
+    "PACKAGE": _audit_package,
+    "INST": _audit_inst,
+    "TRACK": _audit_track,
+    "FILL": _audit_fill,
+    "VIA": _audit_via,
+    "MANUFACTURING-RULES": _audit_manufacturing_rules,
+}
+
+# Known direct children of BOARD; iterparse is subscribed to these only.
+_BOARD_CHILD_TAGS = frozenset({
+    "BOARD-BOUNDARY",
+    "STACKUP",
+    "PACKAGE",
+    "INST",
+    "SHAPE",
+    "TRACK",
+    "FILL",
+    "VIA",
+    "NET",
+    "ANETCLASS",
+    "MANUFACTURING-RULES",
+    "ALTIUM-RULES",
+    "LAYER-INDEX",
+})
+_ITERPARSE_TAGS = _BOARD_CHILD_TAGS | {"BOARD", "SCHEMATIC"}
+
+
+def audit_file(xml_path):
+    """Perform comprehensive audit of a single XML file."""
+    results = {}
+
+    # ── 1. Stream BOARD's direct children, dispatching on tag ──
+    # Each child is handled as soon as its end tag arrives and then freed,
+    # so memory stays bounded by the largest single child instead of the
+    # whole document.
+    # libxml2 only reports the tags we subscribe to; any other BOARD child
+    # is tallied when it gets pruned (or when BOARD itself ends).
+    # SCHEMATIC is only audited for its direct child tags, so those are
+    # tallied and dropped as soon as they are complete.
+    board_children = Counter()
+    schematic_children = Counter()
+    schematic = None
+    state = _new_board_state()
+    context = ET.iterparse(
+        xml_path, events=("start", "end"), tag=_ITERPARSE_TAGS, **_PARSER_OPTIONS
+    )
+    for event, elem in context:
+        if event == "start":
+            if elem.tag == "SCHEMATIC" and schematic is None:
+                schematic = elem
+            continue
+        parent = elem.getparent()
+        if parent is None:
+            continue
+        tag = elem.tag
+        if schematic is not None:
+            if elem is schematic:
+                schematic_children.update(child.tag for child in elem)
+                elem.clear()
+                schematic = None
+                continue
+            # Everything before the last child (still being parsed) is done.
+            while len(schematic) > 1:
+                schematic_children[schematic[0].tag] += 1
+                del schematic[0]
+        if tag == "BOARD":
+            for child in elem:
+                if child.tag not in _BOARD_CHILD_TAGS:
+                    board_children[child.tag] += 1
+            elem.clear()
+            continue
+        if parent.tag != "BOARD":
+            continue
+        board_children[tag] += 1
+        handler = _BOARD_HANDLERS.get(tag)
+        if handler is not None:
+            handler(elem, state)
+        elem.clear()
+        while elem.getprevious() is not None:
+            skipped = parent[0].tag
+            if skipped not in _BOARD_CHILD_TAGS:
+                board_children[skipped] += 1
+            del parent[0]
+    results["board_children"] = dict(board_children)
+
+    root = context.root
+
+    # ── 2. Board-level SHAPE analysis ──
+    results["board_shapes_by_layer"] = dict(state["board_shape_by_layer"])
+    results["board_shapes_geom_types"] = dict(state["board_shape_geom"])
+    results["board_shapes_layer_types"] = dict(state["board_shape_layer_type"])
+
+    # ── 3. PACKAGE analysis ──
+    results["packages"] = state["packages"]
 
     # ── 4. INST analysis ──
-    inst_children_other = Counter()
-    inst_attribs = Counter()
-    inst_count = 0
-    for inst in board.findall("INST"):
-        inst_count += 1
-        for attr in inst.attrib:
-            inst_attribs[attr] += 1
-        for child in inst:
-            if child.tag not in ("POSE", "DESIGNATOR-TEXT", "LAYER-INDEX"):
-                inst_children_other[child.tag] += 1
-
-    results["inst_count"] = inst_count
-    results["inst_attribs"] = dict(inst_attribs)
-    results["inst_children_other"] = dict(inst_children_other)
-
-    # Check for PIN-NET inside INST
-    pin_net_count = 0
-    for inst in board.findall("INST"):
-        for pn in inst.findall("PIN-NET"):
-            pin_net_count += 1
-    results["inst_pin_net_count"] = pin_net_count
+    results["inst_count"] = state["inst_count"]
+    results["inst_attribs"] = dict(state["inst_attribs"])
+    results["inst_children_other"] = dict(state["inst_children_other"])
+    results["inst_pin_net_count"] = state["inst_pin_net_count"]
 
     # ── 5. Attribute analysis for TRACK, FILL, VIA, PAD ──
-    track_attribs = Counter()
-    track_shape_count = 0
-    track_shape_geom = Counter()
-    for track in board.findall("TRACK"):
-        for attr in track.attrib:
-            track_attribs[attr] += 1
-        for shape in track.findall("SHAPE"):
-            track_shape_count += 1
-            for child in shape:
-                if child.tag not in ("LAYER-INDEX",):
-                    track_shape_geom[child.tag] += 1
-    results["track_count"] = len(board.findall("TRACK"))
-    results["track_attribs"] = dict(track_attribs)
-    results["track_shape_count"] = track_shape_count
-    results["track_shape_geom"] = dict(track_shape_geom)
-
-    fill_attribs = Counter()
-    fill_children = Counter()
-    fill_shape_geom = Counter()
-    for fill in board.findall("FILL"):
-        for attr in fill.attrib:
-            fill_attribs[attr] += 1
-        for child in fill:
-            fill_children[child.tag] += 1
-            if child.tag == "SHAPE":
-                for sc in child:
-                    if sc.tag not in ("LAYER-INDEX",):
-                        fill_shape_geom[sc.tag] += 1
-    results["fill_count"] = len(board.findall("FILL"))
-    results["fill_attribs"] = dict(fill_attribs)
-    results["fill_children"] = dict(fill_children)
-    results["fill_shape_geom"] = dict(fill_shape_geom)
-
-    via_attribs = Counter()
-    via_children = Counter()
-    for via in board.findall("VIA"):
-        for attr in via.attrib:
-            via_attribs[attr] += 1
-        for child in via:
-            via_children[child.tag] += 1
-    results["via_count"] = len(board.findall("VIA"))
-    results["via_attribs"] = dict(via_attribs)
-    results["via_children"] = dict(via_children)
+    results["track_count"] = board_children.get("TRACK", 0)
+    results["track_attribs"] = dict(state["track_attribs"])
+    results["track_shape_count"] = state["track_shape_count"]
+    results["track_shape_geom"] = dict(state["track_shape_geom"])
+
+    results["fill_count"] = board_children.get("FILL", 0)
+    results["fill_attribs"] = dict(state["fill_attribs"])
+    results["fill_children"] = dict(state["fill_children"])
+    results["fill_shape_geom"] = dict(state["fill_shape_geom"])
+
+    results["via_count"] = board_children.get("VIA", 0)
+    results["via_attribs"] = dict(state["via_attribs"])
+    results["via_children"] = dict(state["via_children"])
 
     # ── 6. Board-level LINE shapes (not inside POLYGON) ──
-    # The converter only parses POLYGON from board-level SHAPEs; check for LINE
-    board_shape_lines = 0
-    board_shape_arcs = 0
-    for shape in board.findall("SHAPE"):
-        if shape.find("LINE") is not None:
-            board_shape_lines += 1
-        if shape.find("ARC") is not None:
-            board_shape_arcs += 1
-    results["board_shape_lines_count"] = board_shape_lines
-    results["board_shape_arcs_count"] = board_shape_arcs
+    results["board_shape_lines_count"] = state["board_shape_lines_count"]
+    results["board_shape_arcs_count"] = state["board_shape_arcs_count"]
 
     # ── 7. SCHEMATIC section ──
-    schematic_children = Counter()
-    if schematic is not None:
-        for child in schematic:
-            schematic_children[child.tag] += 1
     results["schematic_children"] = dict(schematic_children)
 
     # ── Extra: NET elements at board level ──
-    results["net_count"] = len(board.findall("NET"))
+    results["net_count"] = board_children.get("NET", 0)
 
     # ── Extra: ANETCLASS elements ──
-    results["anetclass_count"] = len(board.findall("ANETCLASS"))
+    results["anetclass_count"] = board_children.get("ANETCLASS", 0)
 
     # ── Extra: MANUFACTURING-RULES ──
-    mfg = board.find("MANUFACTURING-RULES")
-    results["manufacturing_rules_attribs"] = dict(mfg.attrib) if mfg is not None else None
+    results["manufacturing_rules_attribs"] = state["manufacturing_rules_attribs"]
 
     # ── Extra: ALTIUM-RULES ──
-    results["altium_rules_count"] = len(board.findall("ALTIUM-RULES"))
+    results["altium_rules_count"] = board_children.get("ALTIUM-RULES", 0)
 
     # ── Extra: Root-level PROJECT attributes ──
     results["project_attribs"] = dict(root.attrib)
@@ -254,17 +388,76 @@ def audit_file(xml_path):
     return results
 
 
+def _board_child_count(tag):
+    return lambda r: r["board_children"].get(tag, 0)
+
+
+def _board_shape_geom_count(geom):
+    return lambda r: r["board_shapes_geom_types"].get(geom, 0)
+
+
+# Summary matrix row path -> per-file count; rows not listed show "-".
+_SUMMARY_ROW_COUNTS = {
+    "BOARD/BOARD-BOUNDARY": _board_child_count("BOARD-BOUNDARY"),
+    "BOARD/STACKUP": _board_child_count("STACKUP"),
+    "BOARD/MANUFACTURING-RULES": _board_child_count("MANUFACTURING-RULES"),
+    "BOARD/ALTIUM-RULES": _board_child_count("ALTIUM-RULES"),
+    "BOARD/LAYER-INDEX": _board_child_count("LAYER-INDEX"),
+    "BOARD/NET": lambda r: r["net_count"],
+    "BOARD/ANETCLASS": lambda r: r["anetclass_count"],
+    "BOARD/PACKAGE": _board_child_count("PACKAGE"),
+    "BOARD/INST": lambda r: r["inst_count"],
+    "BOARD/INST/PIN-NET": lambda r: r["inst_pin_net_count"],
+    "BOARD/SHAPE (POLYGON)": _board_shape_geom_count("POLYGON"),
+    "BOARD/SHAPE (LINE)": _board_shape_geom_count("LINE"),
+    "BOARD/SHAPE (ARC)": _board_shape_geom_count("ARC"),
+    "BOARD/TRACK": lambda r: r["track_count"],
+    "BOARD/FILL": lambda r: r["fill_count"],
+    "BOARD/VIA": lambda r: r["via_count"],
+    "SCHEMATIC/*": lambda r: sum(r["schematic_children"].values()),
+}
+
+
+def collect_key_unions(all_results, keys):
+    """Union the keys of each named per-file counter across all results."""
+    unions = {k: set() for k in keys}
+    for r in all_results.values():
+        for k in keys:
+            unions[k].update(r[k].keys())
+    return unions
+
+
 def print_separator():
     print("=" * 120)
 
 
 def print_audit(files):
-    all_results = {}
     for f in files:
         print(f"Parsing: {f}")
-        all_results[f] = audit_file(f)
-
-    names = [short_name(f) for f in files]
+    # Files are independent, so audit them in parallel worker processes.
+    workers = min(len(files), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        all_results = dict(zip(files, executor.map(audit_file, files)))
+
+    short_names = {f: short_name(f) for f in files}
+    # Per-file column headers, truncated to the 20- and 15-wide columns.
+    file_columns_20 = "".join(f"{short_names[f][:20]:>20} " for f in files)
+    file_columns_15 = "".join(f"{short_names[f][:15]:>15} " for f in files)
+    unions = collect_key_unions(all_results, (
+        "board_children",
+        "board_shapes_by_layer",
+        "board_shapes_geom_types",
+        "board_shapes_layer_types",
+        "inst_attribs",
+        "inst_children_other",
+        "track_attribs",
+        "track_shape_geom",
+        "fill_attribs",
+        "fill_children",
+        "fill_shape_geom",
+        "via_attribs",
+        "via_children",
+    ))
 
     print()
     print_separator()
@@ -275,9 +468,7 @@ def print_audit(files):
     print()
     print("1. BOARD DIRECT CHILDREN (tag counts)")
     print("-" * 120)
-    all_tags = set()
-    for r in all_results.values():
-        all_tags.update(r["board_children"].keys())
+    all_tags = unions["board_children"]
     all_tags = sorted(all_tags)
 
     # Converter status for each tag
@@ -313,22 +504,15 @@ def print_audit(files):
         "NET": "Net name declarations",
     }
 
-    print(f"{'Tag':<25} {'Converter Status':<50} ", end="")
-    for n in names:
-        print(f"{n[:20]:>20} ", end="")
-    print()
-    print(f"{'---':<25} {'---':<50} ", end="")
-    for _ in names:
-        print(f"{'---':>20} ", end="")
-    print()
+    print(f"{'Tag':<25} {'Converter Status':<50} " + file_columns_20)
+    print(f"{'---':<25} {'---':<50} " + f"{'---':>20} " * len(files))
 
     for tag in all_tags:
         status = converter_status.get(tag, "DROPPED (unknown)")
-        print(f"{tag:<25} {status:<50} ", end="")
-        for f in files:
-            count = all_results[f]["board_children"].get(tag, 0)
-            print(f"{count:>20} ", end="")
-        print()
+        print(
+            f"{tag:<25} {status:<50} " +
+            "".join(f"{all_results[f]['board_children'].get(tag, 0):>20} " for f in files)
+        )
 
     print()
     print("Data lost for DROPPED elements:")
@@ -344,26 +528,19 @@ def print_audit(files):
 
     print()
     print("2a. By LAYER-SPECIFIER NAME:")
-    all_layer_names = set()
-    for r in all_results.values():
-        all_layer_names.update(r["board_shapes_by_layer"].keys())
+    all_layer_names = unions["board_shapes_by_layer"]
     all_layer_names = sorted(all_layer_names)
 
-    print(f"{'Layer Name':<30} ", end="")
-    for n in names:
-        print(f"{n[:20]:>20} ", end="")
-    print()
+    print(f"{'Layer Name':<30} " + file_columns_20)
     for ln in all_layer_names:
-        print(f"{ln:<30} ", end="")
-        for f in files:
-            print(f"{all_results[f]['board_shapes_by_layer'].get(ln, 0):>20} ", end="")
-        print()
+        print(
+            f"{ln:<30} " +
+            "".join(f"{all_results[f]['board_shapes_by_layer'].get(ln, 0):>20} " for f in files)
+        )
 
     print()
     print("2b. Geometry types inside board-level SHAPEs:")
-    all_geom = set()
-    for r in all_results.values():
-        all_geom.update(r["board_shapes_geom_types"].keys())
+    all_geom = unions["board_shapes_geom_types"]
     all_geom = sorted(all_geom)
 
     geom_status = {
@@ -372,39 +549,35 @@ def print_audit(files):
         "ARC": "DROPPED - converter only parses POLYGON from board shapes",
     }
 
-    print(f"{'Geom Type':<15} {'Converter Status':<60} ", end="")
-    for n in names:
-        print(f"{n[:20]:>20} ", end="")
-    print()
+    print(
+        f"{'Geom Type':<15} {'Converter Status':<60} " +
+        file_columns_20
+    )
     for g in all_geom:
         status = geom_status.get(g, "DROPPED (unknown geometry)")
-        print(f"{g:<15} {status:<60} ", end="")
-        for f in files:
-            print(f"{all_results[f]['board_shapes_geom_types'].get(g, 0):>20} ", end="")
-        print()
+        print(
+            f"{g:<15} {status:<60} " +
+            "".join(f"{all_results[f]['board_shapes_geom_types'].get(g, 0):>20} " for f in files)
+        )
 
     print()
     print("2c. Layer specifier type (LAYER-SPECIFIER vs LAYER-INDEX):")
-    all_lt = set()
-    for r in all_results.values():
-        all_lt.update(r["board_shapes_layer_types"].keys())
+    all_lt = unions["board_shapes_layer_types"]
 
-    print(f"{'Type':<20} ", end="")
-    for n in names:
-        print(f"{n[:20]:>20} ", end="")
-    print()
+    print(f"{'Type':<20} " + file_columns_20)
     for lt in sorted(all_lt):
         conv_note = "PARSED" if lt == "LAYER-SPECIFIER" else "DROPPED (board shapes with LAYER-INDEX = copper shapes not handled)"
-        print(f"{lt:<20} ", end="")
-        for f in files:
-            print(f"{all_results[f]['board_shapes_layer_types'].get(lt, 0):>20} ", end="")
-        print(f"  <- {conv_note}")
+        print(
+            f"{lt:<20} " +
+            "".join(f"{all_results[f]['board_shapes_layer_types'].get(lt, 0):>20} " for f in files) +
+            f"  <- {conv_note}"
+        )
 
     print()
     print(f"Board-level SHAPE elements containing LINE (dropped by converter):")
     print(f"{'File':<50} {'LINE count':>15} {'ARC count':>15}")
     for f in files:
-        print(f"{short_name(f):<50} {all_results[f]['board_shape_lines_count']:>15} {all_results[f]['board_shape_arcs_count']:>15}")
+        print(f"{short_names[f]:<50} {all_results[f]['board_shape_lines_count']:>15} {all_results[f]['board_shape_arcs_count']:>15}")
 
     # ── Section 3: PACKAGE analysis ──
     print()
@@ -415,9 +588,9 @@ def print_audit(files):
     for f in files:
         pkgs = all_results[f]["packages"]
         if not pkgs:
-            print(f"\n  {short_name(f)}: No packages")
+            print(f"\n  {short_names[f]}: No packages")
             continue
-        print(f"\n  {short_name(f)}: {len(pkgs)} package(s)")
+        print(f"\n  {short_names[f]}: {len(pkgs)} package(s)")
         for pname, pinfo in pkgs.items():
             print(f"\n    Package '{pname}':")
             print(f"      PADs: {pinfo['num_pads']} total")
@@ -425,8 +598,7 @@ def print_audit(files):
             print(f"        PAD attributes found: {list(pinfo['pad_attribs'].keys())}")
 
             # Identify unparsed PAD attributes
-            parsed_pad_attrs = {"NAME", "TYPE", "SIDE"}
-            unparsed_pad_attrs = set(pinfo["pad_attribs"].keys()) - parsed_pad_attrs
+            unparsed_pad_attrs = pinfo["pad_attribs"].keys() - _PARSED_PAD_ATTRS
             if unparsed_pad_attrs:
                 print(f"        ** DROPPED PAD attributes: {sorted(unparsed_pad_attrs)}")
                 for attr in sorted(unparsed_pad_attrs):
@@ -461,24 +633,20 @@ def print_audit(files):
     print("4. INST ELEMENT ANALYSIS")
     print("-" * 120)
 
-    print(f"\n{'Attribute/Child':<30} {'Converter Status':<30} ", end="")
-    for n in names:
-        print(f"{n[:20]:>20} ", end="")
-    print()
+    print(
+        f"\n{'Attribute/Child':<30} {'Converter Status':<30} " +
+        file_columns_20
+    )
 
-    inst_attrs_all = set()
-    inst_children_all = set()
-    for r in all_results.values():
-        inst_attrs_all.update(r["inst_attribs"].keys())
-        inst_children_all.update(r["inst_children_other"].keys())
+    inst_attrs_all = unions["inst_attribs"]
+    inst_children_all = unions["inst_children_other"]
 
-    parsed_inst_attrs = {"DESIGNATOR", "PACKAGE", "SIDE"}
     for attr in sorted(inst_attrs_all):
-        status = "PARSED" if attr in parsed_inst_attrs else "DROPPED"
-        print(f"attr:{attr:<25} {status:<30} ", end="")
-        for f in files:
-            print(f"{all_results[f]['inst_attribs'].get(attr, 0):>20} ", end="")
-        print()
+        status = "PARSED" if attr in _PARSED_INST_ATTRS else "DROPPED"
+        print(
+            f"attr:{attr:<25} {status:<30} " +
+            "".join(f"{all_results[f]['inst_attribs'].get(attr, 0):>20} " for f in files)
+        )
         if status == "DROPPED":
             notes = {
                 "HEIGHT": "Component height above board (useful for 3D/clearance)",
@@ -486,14 +654,13 @@ def print_audit(files):
             print(f"  -> Data lost: {notes.get(attr, 'Unknown')}")
 
     # Known parsed children
-    known_inst_children = {"POSE", "DESIGNATOR-TEXT", "LAYER-INDEX"}
     print(f"\n  Parsed INST children: POSE, DESIGNATOR-TEXT, LAYER-INDEX")
     print(f"  Additional INST children found (DROPPED):")
     for child_tag in sorted(inst_children_all):
-        print(f"    {child_tag:<25} ", end="")
-        for f in files:
-            print(f"{all_results[f]['inst_children_other'].get(child_tag, 0):>20} ", end="")
-        print()
+        print(
+            f"    {child_tag:<25} " +
+            "".join(f"{all_results[f]['inst_children_other'].get(child_tag, 0):>20} " for f in files)
+        )
         notes = {
             "PIN-NET": "Pin-to-net mapping for the instance (net connectivity data)",
         }
@@ -501,7 +668,7 @@ def print_audit(files):
 
     print(f"\n  PIN-NET elements inside INSTs:")
     for f in files:
-        print(f"    {short_name(f)}: {all_results[f]['inst_pin_net_count']} PIN-NET elements")
+        print(f"    {short_names[f]}: {all_results[f]['inst_pin_net_count']} PIN-NET elements")
 
     # ── Section 5: Unparsed attributes ──
     print()
@@ -510,38 +677,30 @@ def print_audit(files):
     print("-" * 120)
 
     print("\n  TRACK attributes:")
-    parsed_track_attrs = {"NET"}
-    track_attrs_all = set()
-    for r in all_results.values():
-        track_attrs_all.update(r["track_attribs"].keys())
+    track_attrs_all = unions["track_attribs"]
     for attr in sorted(track_attrs_all):
-        status = "PARSED" if attr in parsed_track_attrs else "DROPPED"
-        print(f"    {attr:<25} {status:<20} ", end="")
-        for f in files:
-            print(f"{all_results[f]['track_attribs'].get(attr, 0):>20} ", end="")
-        print()
+        status = "PARSED" if attr in _PARSED_TRACK_ATTRS else "DROPPED"
+        print(
+            f"    {attr:<25} {status:<20} " +
+            "".join(f"{all_results[f]['track_attribs'].get(attr, 0):>20} " for f in files)
+        )
 
     print(f"\n  TRACK shape geometry types:")
-    track_geom_all = set()
-    for r in all_results.values():
-        track_geom_all.update(r["track_shape_geom"].keys())
+    track_geom_all = unions["track_shape_geom"]
     for g in sorted(track_geom_all):
-        print(f"    {g:<25} ", end="")
-        for f in files:
-            print(f"{all_results[f]['track_shape_geom'].get(g, 0):>20} ", end="")
-        print()
+        print(
+            f"    {g:<25} " +
+            "".join(f"{all_results[f]['track_shape_geom'].get(g, 0):>20} " for f in files)
+        )
 
     print("\n  FILL attributes:")
-    parsed_fill_attrs = {"NET"}
-    fill_attrs_all = set()
-    for r in all_results.values():
-        fill_attrs_all.update(r["fill_attribs"].keys())
+    fill_attrs_all = unions["fill_attribs"]
     for attr in sorted(fill_attrs_all):
-        status = "PARSED" if attr in parsed_fill_attrs else "DROPPED"
-        print(f"    {attr:<25} {status:<20} ", end="")
-        for f in files:
-            print(f"{all_results[f]['fill_attribs'].get(attr, 0):>20} ", end="")
-        print()
+        status = "PARSED" if attr in _PARSED_FILL_ATTRS else "DROPPED"
+        print(
+            f"    {attr:<25} {status:<20} " +
+            "".join(f"{all_results[f]['fill_attribs'].get(attr, 0):>20} " for f in files)
+        )
         if status == "DROPPED":
             notes = {
                 "REMOVE-ISLANDS": "Whether to remove unconnected copper islands in pour",
@@ -551,37 +710,30 @@ def print_audit(files):
             print(f"      -> Data lost: {notes.get(attr, 'Unknown fill attribute')}")
 
     print(f"\n  FILL children by tag:")
-    fill_children_all = set()
-    for r in all_results.values():
-        fill_children_all.update(r["fill_children"].keys())
+    fill_children_all = unions["fill_children"]
     for tag in sorted(fill_children_all):
         parsed = "PARSED" if tag == "SHAPE" else "DROPPED"
-        print(f"    {tag:<25} {parsed:<20} ", end="")
-        for f in files:
-            print(f"{all_results[f]['fill_children'].get(tag, 0):>20} ", end="")
-        print()
+        print(
+            f"    {tag:<25} {parsed:<20} " +
+            "".join(f"{all_results[f]['fill_children'].get(tag, 0):>20} " for f in files)
+        )
 
     print(f"\n  FILL shape geometry types:")
-    fill_geom_all = set()
-    for r in all_results.values():
-        fill_geom_all.update(r["fill_shape_geom"].keys())
+    fill_geom_all = unions["fill_shape_geom"]
     for g in sorted(fill_geom_all):
-        print(f"    {g:<25} ", end="")
-        for f in files:
-            print(f"{all_results[f]['fill_shape_geom'].get(g, 0):>20} ", end="")
-        print()
+        print(
+            f"    {g:<25} " +
+            "".join(f"{all_results[f]['fill_shape_geom'].get(g, 0):>20} " for f in files)
+        )
 
     print("\n  VIA attributes:")
-    parsed_via_attrs = {"DIAMETER", "HOLE-DIAMETER", "NET"}
-    via_attrs_all = set()
-    for r in all_results.values():
-        via_attrs_all.update(r["via_attribs"].keys())
+    via_attrs_all = unions["via_attribs"]
     for attr in sorted(via_attrs_all):
-        status = "PARSED" if attr in parsed_via_attrs else "DROPPED"
-        print(f"    {attr:<25} {status:<20} ", end="")
-        for f in files:
-            print(f"{all_results[f]['via_attribs'].get(attr, 0):>20} ", end="")
-        print()
+        status = "PARSED" if attr in _PARSED_VIA_ATTRS else "DROPPED"
+        print(
+            f"    {attr:<25} {status:<20} " +
+            "".join(f"{all_results[f]['via_attribs'].get(attr, 0):>20} " for f in files)
+        )
         if status == "DROPPED":
             notes = {
                 "TYPE": "Via type (e.g., through, blind, buried)",
@@ -589,16 +741,13 @@ def print_audit(files):
             print(f"      -> Data lost: {notes.get(attr, 'Unknown via attribute')}")
 
     print(f"\n  VIA children by tag:")
-    via_children_all = set()
-    for r in all_results.values():
-        via_children_all.update(r["via_children"].keys())
-    parsed_via_children = {"POINT", "START-LAYER", "END-LAYER"}
+    via_children_all = unions["via_children"]
     for tag in sorted(via_children_all):
-        status = "PARSED" if tag in parsed_via_children else "DROPPED"
-        print(f"    {tag:<25} {status:<20} ", end="")
-        for f in files:
-            print(f"{all_results[f]['via_children'].get(tag, 0):>20} ", end="")
-        print()
+        status = "PARSED" if tag in _PARSED_VIA_CHILDREN else "DROPPED"
+        print(
+            f"    {tag:<25} {status:<20} " +
+            "".join(f"{all_results[f]['via_children'].get(tag, 0):>20} " for f in files)
+        )
 
     # ── Section 6: Board-level LINE shapes ──
     print()
@@ -614,7 +763,7 @@ def print_audit(files):
         poly_count = r["board_shapes_geom_types"].get("POLYGON", 0)
         line_count = r["board_shapes_geom_types"].get("LINE", 0)
         arc_count = r["board_shapes_geom_types"].get("ARC", 0)
-        print(f"  {short_name(f)}:")
+        print(f"  {short_names[f]}:")
         print(f"    Total board SHAPEs: {total_shapes}")
         print(f"    With POLYGON (parsed): {poly_count}")
         print(f"    With LINE (DROPPED): {line_count}")
@@ -633,9 +782,9 @@ def print_audit(files):
         r = all_results[f]
         sch = r["schematic_children"]
         if not sch:
-            print(f"  {short_name(f)}: No SCHEMATIC section")
+            print(f"  {short_names[f]}: No SCHEMATIC section")
         else:
-            print(f"  {short_name(f)}: SCHEMATIC children: {sch}")
+            print(f"  {short_names[f]}: SCHEMATIC children: {sch}")
 
     # ── Summary table ──
     print()
@@ -674,67 +823,43 @@ def print_audit(files):
         ("SCHEMATIC/*", "Dropped", "Schematic data", "Symbol defs, sheets, wires, net connections"),
     ]
 
-    print(f"{'Element Path':<40} {'Status':<10} {'Purpose':<30} ", end="")
-    for n in names:
-        print(f"{n[:15]:>15} ", end="")
-    print(f"  {'Data Lost if Dropped'}")
-    print("-" * 200)
+    # The matrix is assembled in memory and written in one go.
+    out = [
+        f"{'Element Path':<40} {'Status':<10} {'Purpose':<30} " +
+        file_columns_15 +
+        f"  {'Data Lost if Dropped'}",
+        "-" * 200,
+    ]
 
     for path, status, purpose, lost in rows:
-        print(f"{path:<40} {status:<10} {purpose:<30} ", end="")
-        # Try to get counts
+        line = [f"{path:<40} {status:<10} {purpose:<30} "]
+        extractor = _SUMMARY_ROW_COUNTS.get(path)
         for f in files:
-            r = all_results[f]
-            count = "-"
-            tag = path.split("/")[-1].split(" ")[0].split(":")[0]
-            if tag == "BOARD-BOUNDARY":
-                count = str(r["board_children"].get("BOARD-BOUNDARY", 0))
-            elif tag == "STACKUP":
-                count = str(r["board_children"].get("STACKUP", 0))
-            elif tag == "MANUFACTURING-RULES":
-                count = str(r["board_children"].get("MANUFACTURING-RULES", 0))
-            elif tag == "ALTIUM-RULES":
-                count = str(r["board_children"].get("ALTIUM-RULES", 0))
-            elif path == "BOARD/LAYER-INDEX":
-                count = str(r["board_children"].get("LAYER-INDEX", 0))
-            elif tag == "NET":
-                count = str(r["net_count"])
-            elif tag == "ANETCLASS":
-                count = str(r["anetclass_count"])
-            elif path == "BOARD/PACKAGE":
-                count = str(r["board_children"].get("PACKAGE", 0))
-            elif path == "BOARD/INST":
-                count = str(r["inst_count"])
-            elif path == "BOARD/INST/PIN-NET":
-                count = str(r["inst_pin_net_count"])
-            elif tag == "TRACK":
-                count = str(r["track_count"])
-            elif tag == "FILL":
-                count = str(r["fill_count"])
-            elif tag == "VIA":
-                count = str(r["via_count"])
-            elif "SHAPE" in path and "POLYGON" in path and "PACKAGE" not in path:
-                count = str(r["board_shapes_geom_types"].get("POLYGON", 0))
-            elif "SHAPE" in path and "LINE" in path and "PACKAGE" not in path:
-                count = str(r["board_shapes_geom_types"].get("LINE", 0))
-            elif "SHAPE" in path and "ARC" in path and "PACKAGE" not in path:
-                count = str(r["board_shapes_geom_types"].get("ARC", 0))
-            elif "SCHEMATIC" in path:
-                count = str(sum(r["schematic_children"].values())) if r["schematic_children"] else "0"
-            print(f"{count:>15} ", end="")
-        print(f"  {lost}")
+            count = str(extractor(all_results[f])) if extractor else "-"
+            line.append(f"{count:>15} ")
+        line.append(f"  {lost}")
+        out.append("".join(line))
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+_DEFAULT_FILES = [
+    "/Users/bgupta/src/JITX/dummy-dir/test_py_comp/designs/test_py_comp.main.test_py_comp/xml/test_py_comp.main.test_py_comp.xml",
+    "/Users/bgupta/src/JITX/dummy-dir/test_py_comp/designs/test_py_comp.main.test_py_reg/xml/test_py_comp.main.test_py_reg.xml",
+    "/Users/bgupta/Downloads/All-GaN-HPA-Board.xml",
+]
 
 
 def main():
-    files = [
-        "/Users/bgupta/src/JITX/dummy-dir/test_py_comp/designs/test_py_comp.main.test_py_comp/xml/test_py_comp.main.test_py_comp.xml",
-        "/Users/bgupta/src/JITX/dummy-dir/test_py_comp/designs/test_py_comp.main.test_py_reg/xml/test_py_comp.main.test_py_reg.xml",
-        "/Users/bgupta/Downloads/All-GaN-HPA-Board.xml",
-    ]
-    for f in files:
-        if not os.path.exists(f):
+    parser = argparse.ArgumentParser(description="Audit XML elements parsed vs dropped by the converter.")
+    parser.add_argument("files", nargs="*", help="JITX XML files to audit (defaults to the reference designs)")
+    args = parser.parse_args()
+    files = args.files or _DEFAULT_FILES
+
+    missing = [f for f in files if not os.path.exists(f)]
+    if missing:
+        for f in missing:
             print(f"ERROR: File not found: {f}", file=sys.stderr)
-            sys.exit(1)
+        sys.exit(1)
 
     print_audit(files)
 
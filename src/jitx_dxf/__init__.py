@@ -1,12 +1,30 @@
 """jitx-dxf: Convert between JITX board designs and DXF format."""
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
 __version__ = "0.1.0"
 
-from .dxf_reader import classify_entities, read_dxf
-from .dxf_writer import convert
-from .jitx_codegen import generate_board_code
-from .models import BoardData
-from .xml_parser import parse_xml
+if TYPE_CHECKING:
+    from .dxf_reader import classify_entities, read_dxf
+    from .dxf_writer import convert
+    from .jitx_codegen import generate_board_code, write_board_code
+    from .models import BoardData
+    from .xml_parser import parse_xml
+
+# Public name → submodule. Submodules are imported on first attribute access
+# (PEP 562) so each CLI command only loads the modules it actually uses.
+_LAZY_EXPORTS: dict[str, str] = {
+    "BoardData": ".models",
+    "classify_entities": ".dxf_reader",
+    "convert": ".dxf_writer",
+    "generate_board_code": ".jitx_codegen",
+    "parse_xml": ".xml_parser",
+    "read_dxf": ".dxf_reader",
+    "write_board_code": ".jitx_codegen",
+}
 
 __all__ = [
     "BoardData",
@@ -15,4 +33,18 @@ __all__ = [
     "generate_board_code",
     "parse_xml",
     "read_dxf",
+    "write_board_code",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -91,6 +91,7 @@ def _cmd_import(args: argparse.Namespace) -> None:
         generate_cutouts_snippet,
         generate_holes_snippet,
         generate_outline_snippet,
+        write_board_code,
     )
 
     input_path = Path(args.input)
@@ -135,6 +136,25 @@ def _cmd_import(args: argparse.Namespace) -> None:
         if classified.cutouts or classified.holes:
             print()
             print(generate_cutouts_snippet(classified, recenter=recenter))
+    elif args.output:
+        output_path = Path(args.output)
+        # Stream into a sibling temp file and move it into place only once
+        # generation succeeds, so a failure never leaves a truncated module
+        tmp_path = output_path.with_name(output_path.name + ".tmp")
+        try:
+            with tmp_path.open("w") as f:
+                write_board_code(
+                    f,
+                    classified,
+                    class_name=args.class_name,
+                    module_name=input_path.name,
+                    recenter=recenter,
+                )
+            tmp_path.replace(output_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        print(f"  Written to:   {output_path}", file=sys.stderr)
     else:
         code = generate_board_code(
             classified,
@@ -142,13 +162,7 @@ def _cmd_import(args: argparse.Namespace) -> None:
             module_name=input_path.name,
             recenter=recenter,
         )
-
-        if args.output:
-            output_path = Path(args.output)
-            output_path.write_text(code)
-            print(f"  Written to:   {output_path}", file=sys.stderr)
-        else:
-            print(code)
+        print(code)
 
 
 def main() -> None:
@@ -6,12 +6,20 @@ Uses ezdxf to parse DXF entities and classifies them by PCB role
 
 from __future__ import annotations
 
+import functools
+import itertools
 import math
+import os
 import re
 from collections import defaultdict
+from dataclasses import dataclass, field
 from pathlib import Path
 
 import ezdxf
+from ezdxf import recover
+from ezdxf.addons import iterdxf
+from ezdxf.lldxf.const import DXF12, DXF13, DXF14, DXF2000
+from ezdxf.sections.headervars import HEADER_VAR_MAP
 
 from .models import (
     ArcPathSegment,
@@ -25,10 +33,12 @@ from .models import (
 )
 from .path_assembler import (
     assemble_closed_paths,
+    edge_bands,
     lwpolyline_to_closed_path,
     path_area,
     path_bounding_box,
-    point_in_path,
+    path_edges,
+    point_in_edge_bands,
 )
 
 # ezdxf INSUNITS codes → unit names
@@ -58,6 +68,18 @@ _UNIT_TO_MM: dict[str, float] = {
     "yd": 914.4,
 }
 
+# Files larger than this are inventoried by streaming the modelspace with
+# ezdxf's iterdxf add-on rather than loading the whole document
+_STREAM_THRESHOLD_BYTES = 50 * 1024 * 1024
+
+# $INSUNITS ezdxf assumes for a file without a HEADER section, which it
+# loads with a default header
+_DEFAULT_INSUNITS: int = HEADER_VAR_MAP["$INSUNITS"].default
+
+# Number of containment queries above which the outline's edges are split
+# into horizontal bands, so each ray cast only scans nearby edges
+_EDGE_BAND_MIN_QUERIES = 32
+
 # Layer name patterns for classification
 _LAYER_PATTERNS: dict[str, list[str]] = {
     "outline": ["outline", "board", "boundary", "profile", "edge", "border"],
@@ -68,55 +90,123 @@ _LAYER_PATTERNS: dict[str, list[str]] = {
     "annotation": ["dim", "dimension", "note", "text", "anno"],
 }
 
+# One compiled alternation per role, tried in _LAYER_PATTERNS order so the
+# first matching role still wins
+_LAYER_REGEXES: list[tuple[str, re.Pattern[str]]] = [
+    (role, re.compile("|".join(map(re.escape, patterns))))
+    for role, patterns in _LAYER_PATTERNS.items()
+]
+
 
-def read_dxf(dxf_path: str) -> DxfInventory:
+def read_dxf(dxf_path: str, *, doc: ezdxf.document.Drawing | None = None) -> DxfInventory:
     """Read a DXF file and return an inventory of its contents.
 
+    Files larger than 50 MB are streamed entity by entity instead of loaded.
+    The version and units are reported as a full load would report them.
+
     Args:
         dxf_path: Path to the DXF file.
+        doc: Already-loaded document for dxf_path, to avoid parsing it again.
 
     Returns:
         DxfInventory with file metadata, layer counts, entity counts, and bounding box.
     """
-    doc = ezdxf.readfile(dxf_path)
-    msp = doc.modelspace()
+    if doc is None and os.path.getsize(dxf_path) > _STREAM_THRESHOLD_BYTES:
+        inventory = _read_dxf_streaming(dxf_path)
+        if inventory is not None:
+            return inventory
+
+    if doc is None:
+        doc = _read_doc(dxf_path)
+    layers, entity_counts, bbox = _scan_modelspace(doc.modelspace())
+
+    return DxfInventory(
+        filepath=dxf_path,
+        dxf_version=doc.dxfversion,
+        units=_detect_units(doc),
+        layers=layers,
+        entity_counts=entity_counts,
+        bounding_box=bbox,
+    )
+
+
+def _read_dxf_streaming(dxf_path: str) -> DxfInventory | None:
+    """Inventory a large DXF by streaming its modelspace instead of loading it.
+
+    Returns None if ezdxf's iterdxf add-on cannot stream the file, so the
+    caller can fall back to a full load.
+    """
+    try:
+        stream = iterdxf.opendxf(dxf_path)
+    except Exception:
+        return None
+    try:
+        layers, entity_counts, bbox = _scan_modelspace(stream.modelspace())
+        dxf_version = _loaded_dxf_version(stream.dxfversion)
+        has_header = "HEADER" in stream.sections
+    finally:
+        stream.close()
+
+    insunits = _read_header_insunits(dxf_path) if has_header else _DEFAULT_INSUNITS
+    return DxfInventory(
+        filepath=dxf_path,
+        dxf_version=dxf_version,
+        units=_INSUNITS_MAP.get(insunits),
+        layers=layers,
+        entity_counts=entity_counts,
+        bounding_box=bbox,
+    )
+
 
-    # Collect layer entity counts
+def _loaded_dxf_version(version: str) -> str:
+    """Return the version ezdxf reports after loading a file written as version.
+
+    ezdxf upgrades pre-R12 files to R12 and R13/R14 files to R2000 on load.
+    """
+    if version < DXF12:
+        return DXF12
+    if version in (DXF13, DXF14):
+        return DXF2000
+    return version
+
+
+def _scan_modelspace(
+    entities,
+) -> tuple[dict[str, int], dict[str, int], tuple[Point, Point] | None]:
+    """Count entities per layer and per type, and compute their bounding box."""
     layer_counts: dict[str, int] = defaultdict(int)
     entity_counts: dict[str, int] = defaultdict(int)
 
-    all_x: list[float] = []
-    all_y: list[float] = []
+    xmin = ymin = math.inf
+    xmax = ymax = -math.inf
 
-    for entity in msp:
+    for entity in entities:
         etype = entity.dxftype()
-        layer = entity.dxf.layer
-        layer_counts[layer] += 1
+        layer_counts[entity.dxf.layer] += 1
         entity_counts[etype] += 1
 
-        # Collect coordinates for bounding box
-        _collect_entity_coords(entity, all_x, all_y)
+        # Extend the running bounding box
+        bounds_fn = _ENTITY_BOUNDS.get(etype)
+        bounds = bounds_fn(entity) if bounds_fn is not None else None
+        if bounds is not None:
+            xmin = min(xmin, bounds[0])
+            xmax = max(xmax, bounds[1])
+            ymin = min(ymin, bounds[2])
+            ymax = max(ymax, bounds[3])
 
     bbox = None
-    if all_x and all_y:
-        bbox = (Point(min(all_x), min(all_y)), Point(max(all_x), max(all_y)))
+    if xmin <= xmax:
+        bbox = (Point(xmin, ymin), Point(xmax, ymax))
 
-    units = _detect_units(doc)
-
-    return DxfInventory(
-        filepath=dxf_path,
-        dxf_version=doc.dxfversion,
-        units=units,
-        layers=dict(layer_counts),
-        entity_counts=dict(entity_counts),
-        bounding_box=bbox,
-    )
+    return dict(layer_counts), dict(entity_counts), bbox
 
 
 def classify_entities(
     dxf_path: str,
     layer_map: dict[str, str] | None = None,
     unit: str | None = None,
+    *,
+    doc: ezdxf.document.Drawing | None = None,
 ) -> ClassifiedEntities:
     """Read a DXF file and classify entities by PCB role.
 
@@ -125,59 +215,53 @@ def classify_entities(
         layer_map: Optional mapping of DXF layer names to PCB roles
             ("outline", "cutout", "hole", "keepout", "soldermask", "annotation").
         unit: Force unit interpretation ("mm", "in", "mil"). Auto-detect if None.
+        doc: Already-loaded document for dxf_path, to avoid parsing it again.
 
     Returns:
         ClassifiedEntities with board outline, cutouts, holes, etc.
     """
-    doc = ezdxf.readfile(dxf_path)
+    if doc is None:
+        doc = _read_doc(dxf_path)
     msp = doc.modelspace()
 
-    # Determine unit scale
-    unit_scale = _resolve_unit_scale(doc, unit, msp)
-
-    # Parse all entities, grouped by layer
-    layer_lines: dict[str, list[tuple[Point, Point]]] = defaultdict(list)
-    layer_arcs: dict[str, list[ArcPathSegment]] = defaultdict(list)
-    layer_lwpolys: dict[str, list[ClosedPath]] = defaultdict(list)
-    circles: list[DxfCircle] = []
-    texts: list[DxfText] = []
-    hatches: list[DxfHatch] = []
-
+    # Single pass over the modelspace: keep the entities we parse and, unless
+    # the unit is forced, track the raw extent for the unit heuristic.
+    entities: list[tuple] = []
+    xmin = ymin = math.inf
+    xmax = ymax = -math.inf
     for entity in msp:
         etype = entity.dxftype()
-        layer = entity.dxf.layer
-
-        if etype == "LINE":
-            p1 = Point(entity.dxf.start.x * unit_scale, entity.dxf.start.y * unit_scale)
-            p2 = Point(entity.dxf.end.x * unit_scale, entity.dxf.end.y * unit_scale)
-            layer_lines[layer].append((p1, p2))
-
-        elif etype == "ARC":
-            arc = _parse_arc_entity(entity, unit_scale)
-            layer_arcs[layer].append(arc)
+        handler = _ENTITY_HANDLERS.get(etype)
+        if handler is not None:
+            entities.append((handler, etype, entity.dxf.layer, entity))
+        if not unit:
+            bounds_fn = _ENTITY_BOUNDS.get(etype)
+            bounds = bounds_fn(entity) if bounds_fn is not None else None
+            if bounds is not None:
+                xmin = min(xmin, bounds[0])
+                xmax = max(xmax, bounds[1])
+                ymin = min(ymin, bounds[2])
+                ymax = max(ymax, bounds[3])
 
-        elif etype == "LWPOLYLINE":
-            path = _parse_lwpolyline(entity, unit_scale)
-            if path is not None:
-                layer_lwpolys[layer].append(path)
-
-        elif etype == "CIRCLE":
-            c = Point(entity.dxf.center.x * unit_scale, entity.dxf.center.y * unit_scale)
-            circles.append(DxfCircle(center=c, radius=entity.dxf.radius * unit_scale, layer=layer))
-
-        elif etype in ("TEXT", "MTEXT"):
-            texts.append(_parse_text_entity(entity, unit_scale))
+    raw_extent = 0.0
+    if xmin <= xmax:
+        raw_extent = max(xmax - xmin, ymax - ymin)
 
-        elif etype == "HATCH":
-            hatch = _parse_hatch_entity(entity, unit_scale)
-            if hatch is not None:
-                hatches.append(hatch)
+    # Determine unit scale
+    unit_scale = _resolve_unit_scale(doc, unit, raw_extent)
 
-        # SPLINE and other unsupported types are silently skipped
+    # Parse all entities, grouped by layer
+    parsed = _ParsedEntities()
+    for handler, etype, layer, entity in entities:
+        handler(entity, etype, layer, unit_scale, parsed)
 
     # Assemble LINE/ARC segments into closed paths (per layer)
+    layer_lines = parsed.layer_lines
+    layer_arcs = parsed.layer_arcs
     all_paths: list[ClosedPath] = []
-    all_layers = set(layer_lines.keys()) | set(layer_arcs.keys())
+    # Layers in first-seen order (lines, then arcs) so the path order is
+    # stable from run to run
+    all_layers = dict.fromkeys(itertools.chain(layer_lines, layer_arcs))
     for layer in all_layers:
         lines = layer_lines.get(layer, [])
         arcs = layer_arcs.get(layer, [])
@@ -185,20 +269,33 @@ def classify_entities(
         all_paths.extend(paths)
 
     # Add LWPOLYLINE closed paths
-    for layer, polys in layer_lwpolys.items():
+    for layer, polys in parsed.layer_lwpolys.items():
         all_paths.extend(polys)
 
     # Classify everything
     if layer_map:
         return _classify_by_layer_map(
-            all_paths, circles, texts, hatches, layer_map, unit_scale
+            all_paths, parsed.circles, parsed.texts, parsed.hatches, layer_map, unit_scale
         )
     else:
         return _classify_by_heuristics(
-            all_paths, circles, texts, hatches, unit_scale
+            all_paths, parsed.circles, parsed.texts, parsed.hatches, unit_scale
         )
 
 
+def _read_doc(dxf_path: str) -> ezdxf.document.Drawing:
+    """Load a DXF document, falling back to ezdxf's recover mode if it is malformed.
+
+    Recover mode is much slower, so it is only used when the normal reader
+    rejects the file's structure.
+    """
+    try:
+        return ezdxf.readfile(dxf_path)
+    except ezdxf.DXFStructureError:
+        doc, _auditor = recover.readfile(dxf_path)
+        return doc
+
+
 def _detect_units(doc: ezdxf.document.Drawing) -> str | None:
     """Detect the unit system from a DXF document."""
     try:
@@ -210,10 +307,30 @@ def _detect_units(doc: ezdxf.document.Drawing) -> str | None:
     return None
 
 
+def _read_header_insunits(dxf_path: str) -> int:
+    """Read $INSUNITS from an ASCII DXF's HEADER section without loading the file.
+
+    Returns 0 (unitless) if the variable is missing or the header can't be read.
+    """
+    try:
+        with open(dxf_path, encoding="latin-1") as f:
+            for code in f:
+                value = f.readline().strip()
+                code = code.strip()
+                if code == "0" and value == "ENDSEC":
+                    break
+                if code == "9" and value == "$INSUNITS":
+                    f.readline()  # group code 70
+                    return int(f.readline().strip())
+    except (OSError, ValueError):
+        pass
+    return 0
+
+
 def _resolve_unit_scale(
     doc: ezdxf.document.Drawing,
     forced_unit: str | None,
-    msp,
+    raw_extent: float,
 ) -> float:
     """Determine the unit-to-mm conversion factor.
 
@@ -221,20 +338,12 @@ def _resolve_unit_scale(
     1. Forced unit from user
     2. DXF header $INSUNITS (with sanity check)
     3. Bounding box heuristic
+
+    ``raw_extent`` is the larger side of the unscaled modelspace bounding box.
     """
     if forced_unit:
         return _UNIT_TO_MM.get(forced_unit, 1.0)
 
-    # Compute raw bounding box extent for heuristic validation
-    xs: list[float] = []
-    ys: list[float] = []
-    for entity in msp:
-        _collect_entity_coords(entity, xs, ys)
-
-    raw_extent = 0.0
-    if xs and ys:
-        raw_extent = max(max(xs) - min(xs), max(ys) - min(ys))
-
     detected = _detect_units(doc)
     if detected and detected in _UNIT_TO_MM:
         scale = _UNIT_TO_MM[detected]
@@ -254,104 +363,134 @@ def _resolve_unit_scale(
     return 1.0
 
 
-def _collect_entity_coords(entity, xs: list[float], ys: list[float]) -> None:
-    """Extract representative coordinates from a DXF entity for bounding box."""
-    etype = entity.dxftype()
-    if etype == "LINE":
-        xs.extend([entity.dxf.start.x, entity.dxf.end.x])
-        ys.extend([entity.dxf.start.y, entity.dxf.end.y])
-    elif etype == "CIRCLE":
-        cx, cy = entity.dxf.center.x, entity.dxf.center.y
-        r = entity.dxf.radius
-        xs.extend([cx - r, cx + r])
-        ys.extend([cy - r, cy + r])
-    elif etype == "ARC":
-        cx, cy = entity.dxf.center.x, entity.dxf.center.y
-        r = entity.dxf.radius
-        xs.extend([cx - r, cx + r])
-        ys.extend([cy - r, cy + r])
-    elif etype == "LWPOLYLINE":
-        for x, y, *_ in entity.get_points(format="xyseb"):
-            xs.append(x)
-            ys.append(y)
-    elif etype == "SPLINE":
-        try:
-            for pt in entity.control_points:
-                xs.append(pt[0])
-                ys.append(pt[1])
-        except Exception:
-            pass
+def _line_bounds(entity) -> tuple[float, float, float, float]:
+    """Return the raw (xmin, xmax, ymin, ymax) of a LINE."""
+    dxf = entity.dxf
+    start, end = dxf.start, dxf.end
+    return (
+        min(start.x, end.x), max(start.x, end.x),
+        min(start.y, end.y), max(start.y, end.y),
+    )
+
+
+def _circle_bounds(entity) -> tuple[float, float, float, float]:
+    """Return the raw (xmin, xmax, ymin, ymax) of a CIRCLE or ARC's full circle."""
+    dxf = entity.dxf
+    center = dxf.center
+    cx, cy = center.x, center.y
+    r = dxf.radius
+    return (cx - r, cx + r, cy - r, cy + r)
+
+
+def _lwpolyline_bounds(entity) -> tuple[float, float, float, float] | None:
+    """Return the raw (xmin, xmax, ymin, ymax) of an LWPOLYLINE's vertices."""
+    xs: list[float] = []
+    ys: list[float] = []
+    for x, y in entity.get_points(format="xy"):
+        xs.append(x)
+        ys.append(y)
+    if not xs:
+        return None
+    return (min(xs), max(xs), min(ys), max(ys))
+
+
+def _spline_bounds(entity) -> tuple[float, float, float, float] | None:
+    """Return the raw (xmin, xmax, ymin, ymax) of a SPLINE's control points."""
+    try:
+        points = list(entity.control_points)
+    except Exception:
+        return None
+    if not points:
+        return None
+    xs = [pt[0] for pt in points]
+    ys = [pt[1] for pt in points]
+    return (min(xs), max(xs), min(ys), max(ys))
+
+
+# DXF type → raw bounding box extractor; other types don't contribute
+_ENTITY_BOUNDS = {
+    "LINE": _line_bounds,
+    "CIRCLE": _circle_bounds,
+    "ARC": _circle_bounds,
+    "LWPOLYLINE": _lwpolyline_bounds,
+    "SPLINE": _spline_bounds,
+}
 
 
 def _parse_arc_entity(entity, unit_scale: float) -> ArcPathSegment:
     """Parse a DXF ARC entity into an ArcPathSegment."""
-    cx = entity.dxf.center.x * unit_scale
-    cy = entity.dxf.center.y * unit_scale
-    r = entity.dxf.radius * unit_scale
-    sa = entity.dxf.start_angle
-    ea = entity.dxf.end_angle
-
-    sp = Point(
-        cx + r * math.cos(math.radians(sa)),
-        cy + r * math.sin(math.radians(sa)),
-    )
-    ep = Point(
-        cx + r * math.cos(math.radians(ea)),
-        cy + r * math.sin(math.radians(ea)),
-    )
+    dxf = entity.dxf
+    center = dxf.center
+    cx = center.x * unit_scale
+    cy = center.y * unit_scale
+    r = dxf.radius * unit_scale
+    return _arc_path_segment(cx, cy, r, dxf.start_angle, dxf.end_angle)
+
+
+def _arc_path_segment(
+    cx: float, cy: float, r: float, sa: float, ea: float
+) -> ArcPathSegment:
+    """Build an ArcPathSegment from scaled center/radius and angles in degrees.
+
+    DXF arcs run counterclockwise from sa to ea, so the end angle is stored
+    as sa plus the CCW sweep.
+    """
+    sa_rad = math.radians(sa)
+    ea_rad = math.radians(ea)
+    sp = Point(cx + r * math.cos(sa_rad), cy + r * math.sin(sa_rad))
+    ep = Point(cx + r * math.cos(ea_rad), cy + r * math.sin(ea_rad))
 
     return ArcPathSegment(
         center=Point(cx, cy),
         radius=r,
         start_angle=sa,
-        end_angle=ea,
+        end_angle=sa + (ea - sa) % 360,
         start_point=sp,
         end_point=ep,
     )
 
 
-def _parse_lwpolyline(entity, unit_scale: float) -> ClosedPath | None:
+def _parse_lwpolyline(entity, layer: str, unit_scale: float) -> ClosedPath | None:
     """Parse a DXF LWPOLYLINE entity. Returns a ClosedPath if closed, else None."""
     if not entity.closed:
         return None
 
-    raw_points = list(entity.get_points(format="xyseb"))
-    points = [(p[0] * unit_scale, p[1] * unit_scale) for p in raw_points]
-    # Bulge is the 4th element in xyseb format (index 3 after x,y,start_width)
-    # Actually in xyseb: x=0, y=1, s=start_width=2, e=end_width=3, b=bulge=4
-    bulges = [p[4] if len(p) > 4 else 0.0 for p in raw_points]
+    # Only x, y and bulge are needed; widths are ignored
+    points: list[tuple[float, float]] = []
+    bulges: list[float] = []
+    for x, y, b in entity.get_points(format="xyb"):
+        points.append((x * unit_scale, y * unit_scale))
+        bulges.append(b)
 
-    return lwpolyline_to_closed_path(points, bulges, entity.dxf.layer)
+    return lwpolyline_to_closed_path(points, bulges, layer)
 
 
-def _parse_text_entity(entity, unit_scale: float) -> DxfText:
+def _parse_text_entity(entity, etype: str, layer: str, unit_scale: float) -> DxfText:
     """Parse a DXF TEXT or MTEXT entity."""
-    etype = entity.dxftype()
-
+    dxf = entity.dxf
     if etype == "MTEXT":
         content = entity.text
-        pos = entity.dxf.insert
-        height = entity.dxf.char_height
-        rotation = getattr(entity.dxf, "rotation", 0.0)
+        height = dxf.char_height
     else:
-        content = entity.dxf.text
-        pos = entity.dxf.insert
-        height = entity.dxf.height
-        rotation = getattr(entity.dxf, "rotation", 0.0)
+        content = dxf.text
+        height = dxf.height
+    pos = dxf.insert
+    rotation = getattr(dxf, "rotation", 0.0)
 
     return DxfText(
         content=content,
         position=Point(pos.x * unit_scale, pos.y * unit_scale),
         height=height * unit_scale,
         rotation=rotation,
-        layer=entity.dxf.layer,
+        layer=layer,
     )
 
 
-def _parse_hatch_entity(entity, unit_scale: float) -> DxfHatch | None:
+def _parse_hatch_entity(entity, layer: str, unit_scale: float) -> DxfHatch | None:
     """Parse a DXF HATCH entity."""
     try:
-        is_solid = entity.dxf.hatch_style == 0 or entity.dxf.pattern_name == "SOLID"
+        dxf = entity.dxf
+        is_solid = dxf.hatch_style == 0 or dxf.pattern_name == "SOLID"
     except Exception:
         is_solid = False
 
@@ -366,38 +505,30 @@ def _parse_hatch_entity(entity, unit_scale: float) -> DxfHatch | None:
                     pts = [(v[0] * unit_scale, v[1] * unit_scale) for v in verts]
                     bulges = [v[2] if len(v) > 2 else 0.0 for v in verts]
                     boundary_paths.append(
-                        lwpolyline_to_closed_path(pts, bulges, entity.dxf.layer)
+                        lwpolyline_to_closed_path(pts, bulges, layer)
                     )
             elif hasattr(bpath, "edges"):
                 # Edge boundary — collect line/arc edges
                 lines = []
                 arcs = []
                 for edge in bpath.edges:
-                    if edge.EDGE_TYPE == "LineEdge":
-                        p1 = Point(edge.start[0] * unit_scale, edge.start[1] * unit_scale)
-                        p2 = Point(edge.end[0] * unit_scale, edge.end[1] * unit_scale)
+                    edge_type = edge.EDGE_TYPE
+                    if edge_type == "LineEdge":
+                        start, end = edge.start, edge.end
+                        p1 = Point(start[0] * unit_scale, start[1] * unit_scale)
+                        p2 = Point(end[0] * unit_scale, end[1] * unit_scale)
                         lines.append((p1, p2))
-                    elif edge.EDGE_TYPE == "ArcEdge":
-                        cx = edge.center[0] * unit_scale
-                        cy = edge.center[1] * unit_scale
-                        r = edge.radius * unit_scale
-                        sa = edge.start_angle
-                        ea = edge.end_angle
-                        sp = Point(
-                            cx + r * math.cos(math.radians(sa)),
-                            cy + r * math.sin(math.radians(sa)),
-                        )
-                        ep = Point(
-                            cx + r * math.cos(math.radians(ea)),
-                            cy + r * math.sin(math.radians(ea)),
-                        )
-                        arcs.append(ArcPathSegment(
-                            center=Point(cx, cy), radius=r,
-                            start_angle=sa, end_angle=ea,
-                            start_point=sp, end_point=ep,
+                    elif edge_type == "ArcEdge":
+                        center = edge.center
+                        arcs.append(_arc_path_segment(
+                            center[0] * unit_scale,
+                            center[1] * unit_scale,
+                            edge.radius * unit_scale,
+                            edge.start_angle,
+                            edge.end_angle,
                         ))
                 if lines or arcs:
-                    paths = assemble_closed_paths(lines, arcs, source_layer=entity.dxf.layer)
+                    paths = assemble_closed_paths(lines, arcs, source_layer=layer)
                     boundary_paths.extend(paths)
     except Exception:
         return None
@@ -408,20 +539,104 @@ def _parse_hatch_entity(entity, unit_scale: float) -> DxfHatch | None:
     return DxfHatch(
         boundary_paths=boundary_paths,
         is_solid=is_solid,
-        layer=entity.dxf.layer,
+        layer=layer,
+    )
+
+
+@dataclass
+class _ParsedEntities:
+    """Entities parsed by classify_entities, with path pieces grouped by layer."""
+    layer_lines: dict[str, list[tuple[Point, Point]]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+    layer_arcs: dict[str, list[ArcPathSegment]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+    layer_lwpolys: dict[str, list[ClosedPath]] = field(
+        default_factory=lambda: defaultdict(list)
     )
+    circles: list[DxfCircle] = field(default_factory=list)
+    texts: list[DxfText] = field(default_factory=list)
+    hatches: list[DxfHatch] = field(default_factory=list)
+
+
+def _handle_line(
+    entity, etype: str, layer: str, unit_scale: float, parsed: _ParsedEntities
+) -> None:
+    """Collect a LINE as a segment on its layer."""
+    dxf = entity.dxf
+    start, end = dxf.start, dxf.end
+    p1 = Point(start.x * unit_scale, start.y * unit_scale)
+    p2 = Point(end.x * unit_scale, end.y * unit_scale)
+    parsed.layer_lines[layer].append((p1, p2))
+
+
+def _handle_arc(
+    entity, etype: str, layer: str, unit_scale: float, parsed: _ParsedEntities
+) -> None:
+    """Collect an ARC as a segment on its layer."""
+    parsed.layer_arcs[layer].append(_parse_arc_entity(entity, unit_scale))
+
+
+def _handle_lwpolyline(
+    entity, etype: str, layer: str, unit_scale: float, parsed: _ParsedEntities
+) -> None:
+    """Collect a closed LWPOLYLINE as a path on its layer."""
+    path = _parse_lwpolyline(entity, layer, unit_scale)
+    if path is not None:
+        parsed.layer_lwpolys[layer].append(path)
+
+
+def _handle_circle(
+    entity, etype: str, layer: str, unit_scale: float, parsed: _ParsedEntities
+) -> None:
+    """Collect a CIRCLE."""
+    dxf = entity.dxf
+    center = dxf.center
+    c = Point(center.x * unit_scale, center.y * unit_scale)
+    parsed.circles.append(DxfCircle(center=c, radius=dxf.radius * unit_scale, layer=layer))
+
+
+def _handle_text(
+    entity, etype: str, layer: str, unit_scale: float, parsed: _ParsedEntities
+) -> None:
+    """Collect a TEXT or MTEXT entity."""
+    parsed.texts.append(_parse_text_entity(entity, etype, layer, unit_scale))
+
+
+def _handle_hatch(
+    entity, etype: str, layer: str, unit_scale: float, parsed: _ParsedEntities
+) -> None:
+    """Collect a HATCH with at least one usable boundary."""
+    hatch = _parse_hatch_entity(entity, layer, unit_scale)
+    if hatch is not None:
+        parsed.hatches.append(hatch)
+
+
+# DXF type → parser used by classify_entities; SPLINE and other unsupported
+# types are silently skipped
+_ENTITY_HANDLERS = {
+    "LINE": _handle_line,
+    "ARC": _handle_arc,
+    "LWPOLYLINE": _handle_lwpolyline,
+    "CIRCLE": _handle_circle,
+    "TEXT": _handle_text,
+    "MTEXT": _handle_text,
+    "HATCH": _handle_hatch,
+}
 
 
+@functools.lru_cache(maxsize=256)
 def _classify_layer(layer_name: str) -> str | None:
     """Classify a DXF layer name by matching against known patterns.
 
-    Returns a role string or None if no match.
+    Returns a role string or None if no match. Results are cached since a
+    drawing has few distinct layers but many paths and circles per layer.
     """
     lower = layer_name.lower()
-    for role, patterns in _LAYER_PATTERNS.items():
-        for pattern in patterns:
-            if pattern in lower:
-                return role
+    for role, regex in _LAYER_REGEXES:
+        if regex.search(lower):
+            return role
     return None
 
 
@@ -503,27 +718,43 @@ def _classify_by_heuristics(
         else:
             unresolved_circles.append(circle)
 
+    # Bounding boxes of the unresolved paths serve both the outline search
+    # and the containment tests below
+    unresolved_bbs = [path_bounding_box(path) for path in unresolved_paths]
+
     # Pick outline from candidates or largest unresolved path
+    outline_bb: tuple[Point, Point] | None = None
     if outline_candidates:
         result.outline = max(outline_candidates, key=lambda p: abs(path_area(p)))
     elif unresolved_paths:
-        # Largest closed path is the board outline
-        largest_idx = max(range(len(unresolved_paths)),
-                         key=lambda i: abs(path_area(unresolved_paths[i])))
+        # Largest closed path is the board outline; its box is already known
+        largest_idx = _largest_path_index(unresolved_paths)
         result.outline = unresolved_paths.pop(largest_idx)
+        outline_bb = unresolved_bbs.pop(largest_idx)
 
     # Classify remaining items relative to outline
     if result.outline:
-        for path in unresolved_paths:
-            bb = path_bounding_box(path)
-            center = Point((bb[0].x + bb[1].x) / 2, (bb[0].y + bb[1].y) / 2)
-            if point_in_path(center, result.outline):
+        # Flatten the outline once; every query below is a single point.
+        # With many queries, bucket the edges by y so each ray cast only
+        # scans the band it falls in.
+        if outline_bb is None:
+            outline_bb = path_bounding_box(result.outline)
+        outline_edges = path_edges(result.outline)
+        num_bands = 1
+        if len(unresolved_paths) + len(unresolved_circles) > _EDGE_BAND_MIN_QUERIES:
+            num_bands = len(outline_edges) // 4
+        outline_bands = edge_bands(outline_edges, num_bands)
+        for path, bb in zip(unresolved_paths, unresolved_bbs):
+            cx = (bb[0].x + bb[1].x) / 2
+            cy = (bb[0].y + bb[1].y) / 2
+            if _point_in_outline(cx, cy, outline_bb, outline_bands):
                 result.cutouts.append(path)
             else:
                 result.unclassified_paths.append(path)
 
         for circle in unresolved_circles:
-            if point_in_path(circle.center, result.outline):
+            center = circle.center
+            if _point_in_outline(center.x, center.y, outline_bb, outline_bands):
                 result.holes.append(circle)
             else:
                 result.unclassified_circles.append(circle)
@@ -534,3 +765,26 @@ def _classify_by_heuristics(
     result.texts = texts
     result.hatches = hatches
     return result
+
+
+def _largest_path_index(paths: list[ClosedPath]) -> int:
+    """Return the index of the path with the largest |area|, first one on ties.
+
+    Every area is computed: a path that winds more than once can have a
+    larger |area| than its bounding box, so box areas cannot prune the scan.
+    """
+    areas = [abs(path_area(path)) for path in paths]
+    return areas.index(max(areas))
+
+
+def _point_in_outline(
+    x: float,
+    y: float,
+    outline_bb: tuple[Point, Point],
+    outline_bands: tuple,
+) -> bool:
+    """Test a point against the outline, rejecting it early outside the outline's bbox."""
+    lo, hi = outline_bb
+    if not (lo.x <= x <= hi.x and lo.y <= y <= hi.y):
+        return False
+    return point_in_edge_bands(x, y, outline_bands)
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import functools
+import itertools
 import math
 import sys
+from collections.abc import Iterable, Set
+from dataclasses import dataclass, field
 
 from ezdxf import units as ezdxf_units
 from ezdxf.document import Drawing
@@ -23,11 +27,17 @@ from .models import (
     Point,
     PolygonPad,
     PolygonShape,
-    Pose,
     RectanglePad,
     Via,
 )
-from .transforms import transform_angle, transform_point
+from .transforms import (
+    Affine,
+    compose_affine,
+    pose_affine,
+    transform_angle,
+    transform_points,
+    transform_xy,
+)
 from .xml_parser import parse_xml
 
 
@@ -115,30 +125,45 @@ def _collect_layers(data: BoardData) -> set[str]:
     if data.instances:
         layers.add("Components")
 
-    for idx, name in data.layer_names.items():
-        layers.add(f"Copper_{name}")
-    for track in data.tracks:
-        layers.add(copper_layer_name(track.layer_index, data.layer_names, "Copper"))
-    for fill in data.fills:
-        layers.add(copper_layer_name(fill.layer_index, data.layer_names, "Copper"))
+    layers.update(f"Copper_{name}" for name in data.layer_names.values())
+    copper_indices = {track.layer_index for track in data.tracks}
+    copper_indices.update(fill.layer_index for fill in data.fills)
+    layers.update(
+        copper_layer_name(idx, data.layer_names, "Copper") for idx in copper_indices
+    )
+
+    # Packages with any drilled pad, checked once per package rather than
+    # once per instance
+    hole_pkg_names = {
+        name
+        for name, pkg in data.packages.items()
+        if any(
+            p.hole_radius > 0
+            for p in itertools.chain(pkg.pads, pkg.rectangle_pads, pkg.polygon_pads)
+        )
+    }
 
+    # A package's own layers depend only on the instance side, so each
+    # (package, side) pair is expanded once no matter how many instances
+    # share it
+    seen_pkg_sides: set[tuple[str, str]] = set()
     for inst in data.instances:
         pkg = data.packages.get(inst.package_name)
         if pkg is None:
             continue
-        pad_layer = f"Pads_{inst.side}"
-        if pkg.pads or pkg.rectangle_pads or pkg.polygon_pads:
-            layers.add(pad_layer)
-        if any(p.hole_radius > 0 for p in pkg.pads) or \
-           any(p.hole_radius > 0 for p in pkg.rectangle_pads) or \
-           any(p.hole_radius > 0 for p in pkg.polygon_pads):
-            layers.add("Drill")
-        for poly in pkg.polygons:
-            resolved = resolve_side(poly.side, inst.side)
-            layers.add(get_dxf_layer(poly.layer_name, resolved))
-        for ls in pkg.lines:
-            resolved = resolve_side(ls.side, inst.side)
-            layers.add(get_dxf_layer(ls.layer_name, resolved))
+        pkg_side = (inst.package_name, inst.side)
+        if pkg_side not in seen_pkg_sides:
+            seen_pkg_sides.add(pkg_side)
+            if pkg.pads or pkg.rectangle_pads or pkg.polygon_pads:
+                layers.add(f"Pads_{inst.side}")
+            if inst.package_name in hole_pkg_names:
+                layers.add("Drill")
+            for poly in pkg.polygons:
+                resolved = resolve_side(poly.side, inst.side)
+                layers.add(get_dxf_layer(poly.layer_name, resolved))
+            for ls in pkg.lines:
+                resolved = resolve_side(ls.side, inst.side)
+                layers.add(get_dxf_layer(ls.layer_name, resolved))
         for ts in inst.shapes_text:
             layers.add(get_dxf_layer(ts.layer_name, ts.side))
         for poly in inst.shapes_polygon:
@@ -146,10 +171,10 @@ def _collect_layers(data: BoardData) -> set[str]:
         for ls in inst.shapes_line:
             layers.add(get_dxf_layer(ls.layer_name, ls.side))
 
-    for shape in data.board_shapes:
-        layers.add(get_dxf_layer(shape.layer_name, shape.side))
-    for ls in data.board_line_shapes:
-        layers.add(get_dxf_layer(ls.layer_name, ls.side))
+    layers.update(
+        get_dxf_layer(shape.layer_name, shape.side) for shape in data.board_shapes
+    )
+    layers.update(get_dxf_layer(ls.layer_name, ls.side) for ls in data.board_line_shapes)
 
     return layers
 
@@ -179,23 +204,40 @@ def setup_layers(doc: Drawing, data: BoardData) -> None:
 
 # ─── DXF Emission Helpers ─────────────────────────────────────────────────
 
+# Degrees to radians, and degrees to a quarter of the angle in radians
+# (the bulge of an arc segment is tan(included / 4))
+_DEG2RAD = math.pi / 180.0
+_DEG2RAD_QUARTER = math.pi / 720.0
+
+
+@functools.cache
+def _layer_attribs(layer: str) -> dict[str, str]:
+    """Return a shared ``{"layer": layer}`` dxfattribs dict.
+
+    ezdxf's add_* methods copy dxfattribs before building an entity, so one
+    dict per layer can be reused for every entity on it.  Never mutate the
+    returned dict.
+    """
+    return {"layer": layer}
+
 
 def _add_wide_line(
     msp: Modelspace,
     p1: tuple[float, float],
     p2: tuple[float, float],
     width: float,
-    layer: str,
+    dxfattribs: dict[str, str],
 ) -> None:
     """Emit a line with physical width as a 2-vertex LWPOLYLINE.
 
     Uses per-vertex start/end width (xyseb format) for maximum viewer
-    compatibility — some DXF viewers ignore const_width.
+    compatibility — some DXF viewers ignore const_width. ``dxfattribs`` is
+    copied by ezdxf, so callers may share one dict across many lines.
     """
     # xyseb format: x, y, start_width, end_width, bulge
     msp.add_lwpolyline(
         [(p1[0], p1[1], width, width, 0.0), (p2[0], p2[1], width, width, 0.0)],
-        dxfattribs={"layer": layer},
+        dxfattribs=dxfattribs,
         format="xyseb",
     )
 
@@ -207,11 +249,11 @@ def _add_wide_arc(
     start_angle: float,
     end_angle: float,
     width: float,
-    layer: str,
+    dxfattribs: dict[str, str],
 ) -> None:
     """Emit an arc with physical width as a 2-vertex LWPOLYLINE with bulge."""
-    sa_rad = math.radians(start_angle)
-    ea_rad = math.radians(end_angle)
+    sa_rad = start_angle * _DEG2RAD
+    ea_rad = end_angle * _DEG2RAD
     p1x = center[0] + radius * math.cos(sa_rad)
     p1y = center[1] + radius * math.sin(sa_rad)
     p2x = center[0] + radius * math.cos(ea_rad)
@@ -221,11 +263,11 @@ def _add_wide_arc(
     if included <= 0:
         included += 360.0
     # Bulge = tan(included_angle / 4), positive for CCW
-    bulge = math.tan(math.radians(included) / 4.0)
+    bulge = math.tan(included * _DEG2RAD_QUARTER)
     # xyseb format: x, y, start_width, end_width, bulge
     msp.add_lwpolyline(
         [(p1x, p1y, width, width, bulge), (p2x, p2y, width, width, 0.0)],
-        dxfattribs={"layer": layer},
+        dxfattribs=dxfattribs,
         format="xyseb",
     )
 
@@ -238,7 +280,7 @@ def emit_board_outline(msp: Modelspace, data: BoardData) -> None:
         msp.add_line(
             start=(line.p1.x, line.p1.y),
             end=(line.p2.x, line.p2.y),
-            dxfattribs={"layer": "BoardOutline"},
+            dxfattribs=_layer_attribs("BoardOutline"),
         )
     for arc in data.boundary_arcs:
         msp.add_arc(
@@ -246,139 +288,191 @@ def emit_board_outline(msp: Modelspace, data: BoardData) -> None:
             radius=arc.radius,
             start_angle=arc.start_angle,
             end_angle=arc.end_angle,
-            dxfattribs={"layer": "BoardOutline"},
+            dxfattribs=_layer_attribs("BoardOutline"),
         )
 
 
 def _emit_drill_hole(
-    msp: Modelspace, center: Point, hole_radius: float, inst_pose: Pose
+    msp: Modelspace, x: float, y: float, hole_radius: float, inst_affine: Affine
 ) -> None:
-    """Emit a drill hole circle on the Drill layer if hole_radius > 0."""
+    """Emit a drill hole circle at package-local (x, y) on the Drill layer if hole_radius > 0."""
     if hole_radius <= 0.0:
         return
-    board_pt = transform_point(center, inst_pose)
     msp.add_circle(
-        center=(board_pt.x, board_pt.y),
+        center=transform_xy(x, y, inst_affine),
         radius=hole_radius,
-        dxfattribs={"layer": "Drill"},
+        dxfattribs=_layer_attribs("Drill"),
     )
 
 
 def emit_pads(
-    msp: Modelspace, pads: list[CirclePad], pose: Pose, side: str
+    msp: Modelspace, pads: list[CirclePad], inst_affine: Affine, side: str
 ) -> None:
-    layer = f"Pads_{side}"
+    attribs = _layer_attribs(f"Pads_{side}")
+    a, b, c, d, tx, ty = inst_affine
     for pad in pads:
-        board_pt = transform_point(pad.center, pose)
+        x, y = pad.center.x, pad.center.y
         msp.add_circle(
-            center=(board_pt.x, board_pt.y),
+            center=(a * x + b * y + tx, c * x + d * y + ty),
             radius=pad.radius,
-            dxfattribs={"layer": layer},
+            dxfattribs=attribs,
+        )
+
+
+def _rectangle_pad_outline(pad: RectanglePad) -> list[tuple[float, float]]:
+    """Return a rectangle pad's corners in package-local coordinates."""
+    # Build rectangle corners in rect-local coordinates
+    hw = pad.width / 2.0
+    hh = pad.height / 2.0
+    corners = ((-hw, -hh), (hw, -hh), (hw, hh), (-hw, hh))
+    # Transform: rect-local -> pad-local (via rect_pose) -> package-local (via pad_pose)
+    affine = compose_affine(pose_affine(pad.rect_pose), pose_affine(pad.pad_pose))
+    return [transform_xy(x, y, affine) for x, y in corners]
+
+
+def _polygon_pad_outline(pad: PolygonPad) -> list[tuple[float, float]]:
+    """Return a polygon pad's vertices in package-local coordinates."""
+    return transform_points(pad.points, pose_affine(pad.pose))
+
+
+def _emit_pad_outlines(
+    msp: Modelspace,
+    outlines: list[list[tuple[float, float]]],
+    inst_affine: Affine,
+    side: str,
+) -> None:
+    """Emit package-local pad outlines as closed polylines in board coordinates."""
+    attribs = _layer_attribs(f"Pads_{side}")
+    a, b, c, d, tx, ty = inst_affine
+    for outline in outlines:
+        msp.add_lwpolyline(
+            [(a * x + b * y + tx, c * x + d * y + ty) for x, y in outline],
+            close=True,
+            dxfattribs=attribs,
         )
 
 
 def emit_rectangle_pads(
     msp: Modelspace,
     rectangle_pads: list[RectanglePad],
-    inst_pose: Pose,
+    inst_affine: Affine,
     side: str,
 ) -> None:
-    layer = f"Pads_{side}"
-    for pad in rectangle_pads:
-        # Build rectangle corners in rect-local coordinates
-        hw = pad.width / 2.0
-        hh = pad.height / 2.0
-        corners = [
-            Point(-hw, -hh),
-            Point(hw, -hh),
-            Point(hw, hh),
-            Point(-hw, hh),
-        ]
-        # Transform: rect-local -> pad-local (via rect_pose) -> package-local (via pad_pose) -> board (via inst_pose)
-        transformed = []
-        for pt in corners:
-            pad_pt = transform_point(pt, pad.rect_pose)
-            pkg_pt = transform_point(pad_pt, pad.pad_pose)
-            board_pt = transform_point(pkg_pt, inst_pose)
-            transformed.append((board_pt.x, board_pt.y))
-        msp.add_lwpolyline(transformed, close=True, dxfattribs={"layer": layer})
+    outlines = [_rectangle_pad_outline(pad) for pad in rectangle_pads]
+    _emit_pad_outlines(msp, outlines, inst_affine, side)
 
 
 def emit_polygon_pads(
     msp: Modelspace,
     polygon_pads: list[PolygonPad],
-    inst_pose: Pose,
+    inst_affine: Affine,
     side: str,
 ) -> None:
-    layer = f"Pads_{side}"
-    for pad in polygon_pads:
-        transformed = []
-        for pt in pad.points:
-            pkg_pt = transform_point(pt, pad.pose)
-            board_pt = transform_point(pkg_pt, inst_pose)
-            transformed.append((board_pt.x, board_pt.y))
-        if len(transformed) < 2:
-            continue
-        msp.add_lwpolyline(
-            transformed,
-            close=True,
-            dxfattribs={"layer": layer},
-        )
+    outlines = [_polygon_pad_outline(pad) for pad in polygon_pads if len(pad.points) >= 2]
+    _emit_pad_outlines(msp, outlines, inst_affine, side)
 
 
 def emit_pad_drill_holes(
-    msp: Modelspace, pkg: Package, inst_pose: Pose
+    msp: Modelspace, pkg: Package, inst_affine: Affine
 ) -> None:
     """Emit drill holes on the Drill layer for all through-hole pads in a package."""
     for pad in pkg.pads:
-        _emit_drill_hole(msp, pad.center, pad.hole_radius, inst_pose)
+        _emit_drill_hole(msp, pad.center.x, pad.center.y, pad.hole_radius, inst_affine)
     for pad in pkg.rectangle_pads:
-        _emit_drill_hole(msp, Point(pad.pad_pose.x, pad.pad_pose.y), pad.hole_radius, inst_pose)
+        _emit_drill_hole(msp, pad.pad_pose.x, pad.pad_pose.y, pad.hole_radius, inst_affine)
     for pad in pkg.polygon_pads:
-        _emit_drill_hole(msp, Point(pad.pose.x, pad.pose.y), pad.hole_radius, inst_pose)
+        _emit_drill_hole(msp, pad.pose.x, pad.pose.y, pad.hole_radius, inst_affine)
 
 
 def emit_polygon(
     msp: Modelspace,
     points: list[Point],
     layer: str,
-    pose: Pose | None = None,
+    affine: Affine | None = None,
 ) -> None:
-    transformed = []
-    for pt in points:
-        if pose is not None:
-            bpt = transform_point(pt, pose)
-            transformed.append((bpt.x, bpt.y))
-        else:
-            transformed.append((pt.x, pt.y))
-    if len(transformed) < 2:
+    if len(points) < 2:
         return
+    if affine is not None:
+        transformed = transform_points(points, affine)
+    else:
+        transformed = [(pt.x, pt.y) for pt in points]
     msp.add_lwpolyline(
         transformed,
         close=True,
-        dxfattribs={"layer": layer},
+        dxfattribs=_layer_attribs(layer),
     )
 
 
 def emit_line_shape(
-    msp: Modelspace, line_shape: LineShape, pose: Pose | None = None, layer: str | None = None,
+    msp: Modelspace, line_shape: LineShape, affine: Affine | None = None, layer: str | None = None,
 ) -> None:
     if layer is None:
         layer = get_dxf_layer(line_shape.layer_name, line_shape.side)
-    p1 = line_shape.line.p1
-    p2 = line_shape.line.p2
-    if pose is not None:
-        p1 = transform_point(p1, pose)
-        p2 = transform_point(p2, pose)
-    _add_wide_line(msp, (p1.x, p1.y), (p2.x, p2.y), line_shape.line.width, layer)
+    line = line_shape.line
+    if affine is not None:
+        p1, p2 = transform_points([line.p1, line.p2], affine)
+    else:
+        p1, p2 = (line.p1.x, line.p1.y), (line.p2.x, line.p2.y)
+    _add_wide_line(msp, p1, p2, line.width, _layer_attribs(layer))
+
+
+# Package shapes with their DXF layers resolved for one placement side:
+# (polygon, layer) pairs and (line shape, layer) pairs, filtered layers dropped
+type _ResolvedShapes = tuple[list[tuple[PolygonShape, str]], list[tuple[LineShape, str]]]
+
+
+@dataclass
+class _PackageTemplate:
+    """Package geometry prepared once and reused by every instance of the package."""
+    # Rectangle then polygon pad outlines, in package-local coordinates
+    pad_outlines: list[list[tuple[float, float]]]
+    # Layer-resolved package shapes per (instance side, layer filter)
+    shapes_by_side: dict[tuple[str, frozenset[str] | None], _ResolvedShapes] = field(
+        default_factory=dict
+    )
+
+
+def _bake_package(pkg: Package) -> _PackageTemplate:
+    """Compose each pad's own poses once, leaving only the instance pose per placement."""
+    outlines = [_rectangle_pad_outline(pad) for pad in pkg.rectangle_pads]
+    outlines.extend(
+        _polygon_pad_outline(pad) for pad in pkg.polygon_pads if len(pad.points) >= 2
+    )
+    return _PackageTemplate(pad_outlines=outlines)
+
+
+def _resolve_package_shapes(
+    pkg: Package, inst_side: str, layer_filter: Set[str] | None
+) -> _ResolvedShapes:
+    """Resolve package shape layers for an instance side, skipping filtered layers."""
+    polygons = []
+    for poly in pkg.polygons:
+        layer = get_dxf_layer(poly.layer_name, resolve_side(poly.side, inst_side))
+        if layer_filter is None or layer in layer_filter:
+            polygons.append((poly, layer))
+    lines = []
+    for line_shape in pkg.lines:
+        layer = get_dxf_layer(line_shape.layer_name, resolve_side(line_shape.side, inst_side))
+        if layer_filter is None or layer in layer_filter:
+            lines.append((line_shape, layer))
+    return polygons, lines
 
 
 def emit_instance(
     msp: Modelspace,
     inst: Instance,
     packages: dict[str, Package],
-    layer_filter: set[str] | None,
+    layer_filter: Set[str] | None,
+    templates: dict[str, _PackageTemplate] | None = None,
 ) -> None:
+    """Emit one placed instance.
+
+    ``templates`` caches per-package pad outlines and layer-resolved shapes
+    across calls; pass the same dict for every instance of a board so
+    repeated packages are only prepared once. Resolved shapes are keyed by
+    side and ``layer_filter``, so calls with different filters stay correct;
+    pass a frozenset (as convert does) to avoid freezing it on every call.
+    """
     pkg = packages.get(inst.package_name)
     if pkg is None:
         print(
@@ -388,39 +482,47 @@ def emit_instance(
         )
         return
 
+    template = templates.get(inst.package_name) if templates is not None else None
+    if template is None:
+        template = _bake_package(pkg)
+        if templates is not None:
+            templates[inst.package_name] = template
+
+    # Instance pose as an affine map, computed once and shared by every
+    # package-local vertex below
+    inst_affine = pose_affine(inst.pose)
+
     if layer_filter is None or "Components" in layer_filter:
         msp.add_point(
             location=(inst.pose.x, inst.pose.y),
-            dxfattribs={"layer": "Components"},
+            dxfattribs=_layer_attribs("Components"),
         )
 
     pad_layer = f"Pads_{inst.side}"
     if layer_filter is None or pad_layer in layer_filter:
-        emit_pads(msp, pkg.pads, inst.pose, inst.side)
-        emit_rectangle_pads(msp, pkg.rectangle_pads, inst.pose, inst.side)
-        emit_polygon_pads(msp, pkg.polygon_pads, inst.pose, inst.side)
+        emit_pads(msp, pkg.pads, inst_affine, inst.side)
+        _emit_pad_outlines(msp, template.pad_outlines, inst_affine, inst.side)
 
     if layer_filter is None or "Drill" in layer_filter:
-        emit_pad_drill_holes(msp, pkg, inst.pose)
+        emit_pad_drill_holes(msp, pkg, inst_affine)
 
-    for poly in pkg.polygons:
-        resolved_side = resolve_side(poly.side, inst.side)
-        layer = get_dxf_layer(poly.layer_name, resolved_side)
-        if layer_filter is None or layer in layer_filter:
-            emit_polygon(msp, poly.points, layer, inst.pose)
+    if layer_filter is not None and not isinstance(layer_filter, frozenset):
+        layer_filter = frozenset(layer_filter)
+    shapes = template.shapes_by_side.get((inst.side, layer_filter))
+    if shapes is None:
+        shapes = _resolve_package_shapes(pkg, inst.side, layer_filter)
+        template.shapes_by_side[(inst.side, layer_filter)] = shapes
+    polygons, lines = shapes
 
-    for line_shape in pkg.lines:
-        resolved_side = resolve_side(line_shape.side, inst.side)
-        layer = get_dxf_layer(line_shape.layer_name, resolved_side)
-        if layer_filter is None or layer in layer_filter:
-            emit_line_shape(msp, line_shape, inst.pose, layer)
+    for poly, layer in polygons:
+        emit_polygon(msp, poly.points, layer, inst_affine)
+
+    for line_shape, layer in lines:
+        emit_line_shape(msp, line_shape, inst_affine, layer)
 
     if layer_filter is None or "Components" in layer_filter:
         if inst.designator_text is not None:
             dt = inst.designator_text
-            text_board_pt = transform_point(
-                Point(x=dt.pose.x, y=dt.pose.y), inst.pose
-            )
             text_rotation = transform_angle(dt.pose.angle, inst.pose)
             msp.add_text(
                 dt.string,
@@ -428,7 +530,7 @@ def emit_instance(
                 dxfattribs={
                     "layer": "Components",
                     "rotation": text_rotation,
-                    "insert": (text_board_pt.x, text_board_pt.y),
+                    "insert": transform_xy(dt.pose.x, dt.pose.y, inst_affine),
                 },
             )
 
@@ -455,57 +557,107 @@ def emit_instance(
         if layer_filter is None or layer in layer_filter:
             _add_wide_line(
                 msp, (ls.line.p1.x, ls.line.p1.y), (ls.line.p2.x, ls.line.p2.y),
-                ls.line.width, layer,
+                ls.line.width, _layer_attribs(layer),
             )
 
 
+def _split_tracks(
+    tracks: list[CopperShape],
+) -> tuple[list[CopperLine], list[CopperArc], list[CopperPolygon]]:
+    """Bucket tracks by concrete type in a single pass, preserving order."""
+    buckets: dict[type, list[CopperShape]] = {
+        CopperLine: [],
+        CopperArc: [],
+        CopperPolygon: [],
+    }
+    for track in tracks:
+        bucket = buckets.get(type(track))
+        if bucket is not None:
+            bucket.append(track)
+    return buckets[CopperLine], buckets[CopperArc], buckets[CopperPolygon]
+
+
+def _copper_layer_attribs(
+    layer_indices: Iterable[int],
+    layer_names: dict[int, str],
+    layer_filter: Set[str] | None,
+) -> dict[int, dict[str, str] | None]:
+    """Resolve each copper layer index once to a shared dxfattribs dict.
+
+    Indices whose layer is excluded by ``layer_filter`` map to None.
+    """
+    attribs: dict[int, dict[str, str] | None] = {}
+    for index in layer_indices:
+        layer = copper_layer_name(index, layer_names, "Copper")
+        if layer_filter is None or layer in layer_filter:
+            attribs[index] = _layer_attribs(layer)
+        else:
+            attribs[index] = None
+    return attribs
+
+
 def emit_tracks(
     msp: Modelspace,
-    tracks: list[CopperShape],
+    track_lines: list[CopperLine],
+    track_arcs: list[CopperArc],
+    track_polygons: list[CopperPolygon],
     layer_names: dict[int, str],
-    layer_filter: set[str] | None,
+    layer_filter: Set[str] | None,
 ) -> None:
-    for track in tracks:
-        layer = copper_layer_name(track.layer_index, layer_names, "Copper")
-        if layer_filter is not None and layer not in layer_filter:
+    attribs_by_index = _copper_layer_attribs(
+        {t.layer_index for t in itertools.chain(track_lines, track_arcs, track_polygons)},
+        layer_names,
+        layer_filter,
+    )
+    for track in track_polygons:
+        attribs = attribs_by_index[track.layer_index]
+        if attribs is None:
             continue
-        if isinstance(track, CopperPolygon):
-            pts = [(p.x, p.y) for p in track.points]
-            if len(pts) < 2:
-                continue
-            msp.add_lwpolyline(pts, close=True, dxfattribs={"layer": layer})
-        elif isinstance(track, CopperLine):
-            _add_wide_line(
-                msp, (track.p1.x, track.p1.y), (track.p2.x, track.p2.y),
-                track.width, layer,
-            )
-        elif isinstance(track, CopperArc):
-            _add_wide_arc(
-                msp, (track.center.x, track.center.y), track.radius,
-                track.start_angle, track.end_angle, track.width, layer,
-            )
+        pts = [(p.x, p.y) for p in track.points]
+        if len(pts) < 2:
+            continue
+        msp.add_lwpolyline(pts, close=True, dxfattribs=attribs)
+    for track in track_lines:
+        attribs = attribs_by_index[track.layer_index]
+        if attribs is None:
+            continue
+        _add_wide_line(
+            msp, (track.p1.x, track.p1.y), (track.p2.x, track.p2.y),
+            track.width, attribs,
+        )
+    for track in track_arcs:
+        attribs = attribs_by_index[track.layer_index]
+        if attribs is None:
+            continue
+        _add_wide_arc(
+            msp, (track.center.x, track.center.y), track.radius,
+            track.start_angle, track.end_angle, track.width, attribs,
+        )
 
 
 def emit_fills(
     msp: Modelspace,
     fills: list[CopperPolygon],
     layer_names: dict[int, str],
-    layer_filter: set[str] | None,
+    layer_filter: Set[str] | None,
 ) -> None:
+    attribs_by_index = _copper_layer_attribs(
+        {fill.layer_index for fill in fills}, layer_names, layer_filter
+    )
     for fill in fills:
-        layer = copper_layer_name(fill.layer_index, layer_names, "Copper")
-        if layer_filter is not None and layer not in layer_filter:
+        attribs = attribs_by_index[fill.layer_index]
+        if attribs is None:
             continue
         pts = [(p.x, p.y) for p in fill.points]
         if len(pts) < 2:
             continue
-        msp.add_lwpolyline(pts, close=True, dxfattribs={"layer": layer})
+        msp.add_lwpolyline(pts, close=True, dxfattribs=attribs)
 
 
 def emit_vias(
     msp: Modelspace,
     vias: list[Via],
-    layer_filter: set[str] | None,
+    layer_filter: Set[str] | None,
 ) -> None:
     for via in vias:
         # Via pad (annular ring) on Vias layer
@@ -513,21 +665,21 @@ def emit_vias(
             msp.add_circle(
                 center=(via.center.x, via.center.y),
                 radius=via.diameter / 2.0,
-                dxfattribs={"layer": "Vias"},
+                dxfattribs=_layer_attribs("Vias"),
             )
         # Drill hole on Drill layer
         if layer_filter is None or "Drill" in layer_filter:
             msp.add_circle(
                 center=(via.center.x, via.center.y),
                 radius=via.hole_diameter / 2.0,
-                dxfattribs={"layer": "Drill"},
+                dxfattribs=_layer_attribs("Drill"),
             )
 
 
 def emit_board_shapes(
     msp: Modelspace,
     shapes: list[PolygonShape],
-    layer_filter: set[str] | None,
+    layer_filter: Set[str] | None,
 ) -> None:
     for shape in shapes:
         layer = get_dxf_layer(shape.layer_name, shape.side)
@@ -538,37 +690,34 @@ def emit_board_shapes(
 def emit_board_line_shapes(
     msp: Modelspace,
     line_shapes: list[LineShape],
-    layer_filter: set[str] | None,
+    layer_filter: Set[str] | None,
 ) -> None:
     for ls in line_shapes:
         layer = get_dxf_layer(ls.layer_name, ls.side)
         if layer_filter is None or layer in layer_filter:
             _add_wide_line(
                 msp, (ls.line.p1.x, ls.line.p1.y), (ls.line.p2.x, ls.line.p2.y),
-                ls.line.width, layer,
+                ls.line.width, _layer_attribs(layer),
             )
 
 
 # ─── Main Conversion ─────────────────────────────────────────────────────
 
 
-def convert(
-    xml_path: str,
-    dxf_path: str,
-    layers: set[str] | None = None,
+def _print_summary(
+    data: BoardData,
+    track_lines: list[CopperLine],
+    track_arcs: list[CopperArc],
+    track_polygons: list[CopperPolygon],
 ) -> None:
-    data = parse_xml(xml_path)
-
-    n_track_lines = sum(1 for t in data.tracks if isinstance(t, CopperLine))
-    n_track_arcs = sum(1 for t in data.tracks if isinstance(t, CopperArc))
-    n_track_polys = sum(1 for t in data.tracks if isinstance(t, CopperPolygon))
+    """Print a summary of the parsed board to stdout."""
     print(f"Parsed: {len(data.boundary_lines)} boundary lines, "
           f"{len(data.boundary_arcs)} boundary arcs, "
           f"{len(data.packages)} packages, "
           f"{len(data.instances)} instances, "
           f"{len(data.board_shapes)} board polygon shapes, "
           f"{len(data.board_line_shapes)} board line shapes, "
-          f"{len(data.tracks)} tracks ({n_track_lines} line, {n_track_arcs} arc, {n_track_polys} polygon), "
+          f"{len(data.tracks)} tracks ({len(track_lines)} line, {len(track_arcs)} arc, {len(track_polygons)} polygon), "
           f"{len(data.fills)} fills, "
           f"{len(data.vias)} vias")
 
@@ -585,22 +734,49 @@ def convert(
     if data.layer_names:
         print(f"  Stackup layers: {data.layer_names}")
 
+
+def convert(
+    xml_path: str,
+    dxf_path: str,
+    layers: set[str] | None = None,
+    verbose: bool = True,
+) -> None:
+    """Convert a JITX board XML file to DXF.
+
+    Args:
+        xml_path: Path to the JITX XML board export.
+        dxf_path: Path of the DXF file to write.
+        layers: Optional set of DXF layer names to emit (default: all).
+        verbose: If True, print a parse summary and the output path to stdout.
+    """
+    data = parse_xml(xml_path)
+    # Frozen once so emit_instance can key its per-package caches on it
+    layer_filter = frozenset(layers) if layers is not None else None
+
+    track_lines, track_arcs, track_polygons = _split_tracks(data.tracks)
+    if verbose:
+        _print_summary(data, track_lines, track_arcs, track_polygons)
+
     doc = ezdxf_new("R2010")
     doc.units = ezdxf_units.MM
     setup_layers(doc, data)
     msp = doc.modelspace()
 
-    if layers is None or "BoardOutline" in layers:
+    if layer_filter is None or "BoardOutline" in layer_filter:
         emit_board_outline(msp, data)
 
+    templates: dict[str, _PackageTemplate] = {}
     for inst in data.instances:
-        emit_instance(msp, inst, data.packages, layers)
+        emit_instance(msp, inst, data.packages, layer_filter, templates)
 
-    emit_tracks(msp, data.tracks, data.layer_names, layers)
-    emit_fills(msp, data.fills, data.layer_names, layers)
-    emit_vias(msp, data.vias, layers)
-    emit_board_shapes(msp, data.board_shapes, layers)
-    emit_board_line_shapes(msp, data.board_line_shapes, layers)
+    emit_tracks(
+        msp, track_lines, track_arcs, track_polygons, data.layer_names, layer_filter
+    )
+    emit_fills(msp, data.fills, data.layer_names, layer_filter)
+    emit_vias(msp, data.vias, layer_filter)
+    emit_board_shapes(msp, data.board_shapes, layer_filter)
+    emit_board_line_shapes(msp, data.board_line_shapes, layer_filter)
 
     doc.saveas(dxf_path)
-    print(f"Written: {dxf_path}")
+    if verbose:
+        print(f"Written: {dxf_path}")
@@ -6,8 +6,10 @@ cutouts, mounting holes, keepouts, and annotations.
 
 from __future__ import annotations
 
+import io
 import math
 from textwrap import dedent, indent
+from typing import TextIO
 
 from .models import (
     ArcPathSegment,
@@ -37,43 +39,68 @@ def generate_board_code(
     Returns:
         A string containing valid Python code.
     """
+    buf = io.StringIO()
+    write_board_code(buf, classified, class_name, module_name, recenter)
+    return buf.getvalue()
+
+
+def write_board_code(
+    out: TextIO,
+    classified: ClassifiedEntities,
+    class_name: str = "ImportedBoard",
+    module_name: str | None = None,
+    recenter: bool = True,
+) -> None:
+    """Write a complete JITX Board class Python file to a text stream.
+
+    Lines are written as they are generated, so large outlines are never
+    held in memory as a whole.
+
+    Args:
+        out: Writable text stream, e.g. an open file.
+        classified: Classified DXF entities.
+        class_name: Name of the generated Board class.
+        module_name: Optional module name for the file header comment.
+        recenter: If True, re-center the board outline to the origin.
+    """
+    # Outline bounding box, computed once for both recentering and the
+    # rectangle shortcut in _outline_expression
+    outline_bb = path_bounding_box(classified.outline) if classified.outline else None
     offset = Point(0, 0)
-    if recenter and classified.outline:
-        bb = path_bounding_box(classified.outline)
-        offset = Point(
-            -(bb[0].x + bb[1].x) / 2.0,
-            -(bb[0].y + bb[1].y) / 2.0,
-        )
+    if recenter and outline_bb is not None:
+        offset = _recenter_offset(outline_bb)
 
-    lines: list[str] = []
+    write = out.write
 
     # File header
     if module_name:
-        lines.append(f'"""Board definition imported from {module_name}."""')
+        write(f'"""Board definition imported from {module_name}."""\n')
     else:
-        lines.append('"""Board definition imported from DXF."""')
-    lines.append("")
+        write('"""Board definition imported from DXF."""\n')
+    write("\n")
 
     # Imports
-    lines.append("from jitx.board import Board")
+    write("from jitx.board import Board\n")
 
     needs_arc_polygon = False
     needs_polygon = False
     needs_circle = False
 
+    outline_has_arcs = False
     if classified.outline:
-        has_arcs = any(isinstance(s, ArcPathSegment) for s in classified.outline.segments)
-        has_lines = any(isinstance(s, LinePathSegment) for s in classified.outline.segments)
-        if has_arcs:
+        outline_has_arcs, outline_has_lines = _segment_kinds(classified.outline)
+        if outline_has_arcs:
             needs_arc_polygon = True
-        elif has_lines:
+        elif outline_has_lines:
             needs_polygon = True
 
     if classified.cutouts or classified.holes:
         needs_circle = any(True for _ in classified.holes)
 
-    for path in classified.cutouts:
-        if any(isinstance(s, ArcPathSegment) for s in path.segments):
+    # Scan each cutout once; the flags also pick its expression form below
+    cutout_has_arcs = [_segment_kinds(path)[0] for path in classified.cutouts]
+    for has_arcs in cutout_has_arcs:
+        if has_arcs:
             needs_arc_polygon = True
         else:
             needs_polygon = True
@@ -87,62 +114,36 @@ def generate_board_code(
         shape_imports.append("Circle")
 
     if shape_imports:
-        lines.append(f"from jitx.shapes.primitive import {', '.join(sorted(shape_imports))}")
+        write(f"from jitx.shapes.primitive import {', '.join(sorted(shape_imports))}\n")
 
-    lines.append("")
-    lines.append("")
+    write("\n")
+    write("\n")
 
     # Class definition
-    lines.append(f"class {class_name}(Board):")
+    write(f"class {class_name}(Board):\n")
 
     # Board outline
     if classified.outline:
-        outline_expr = _outline_expression(classified.outline, offset, indent_level=1)
-        lines.append(f"    board_shape = {outline_expr}")
+        outline_expr = _outline_expression(
+            classified.outline, offset, indent_level=1, has_arcs=outline_has_arcs, bb=outline_bb
+        )
+        write(f"    board_shape = {outline_expr}\n")
     else:
-        lines.append("    board_shape = None  # No outline detected in DXF")
-
-    # Cutouts
-    if classified.cutouts:
-        lines.append("")
-        lines.append("    cutouts = [")
-        for cutout in classified.cutouts:
-            expr = _path_expression(cutout, offset, indent_level=2)
-            lines.append(f"        {expr},")
-        lines.append("    ]")
-
-    # Holes as cutouts
-    if classified.holes:
-        if not classified.cutouts:
-            lines.append("")
-            lines.append("    cutouts = [")
-        else:
-            # Extend existing cutouts list — re-open before the closing bracket
-            # Actually, just add holes to the cutouts list above
-            pass
-
-        # If cutouts list wasn't opened yet
-        if not classified.cutouts:
-            for hole in classified.holes:
-                cx = _fmt(hole.center.x + offset.x)
-                cy = _fmt(hole.center.y + offset.y)
-                r = _fmt(hole.radius)
-                lines.append(f"        Circle(radius={r}).at({cx}, {cy}),")
-            lines.append("    ]")
-        else:
-            # Insert holes before the closing bracket
-            # Remove the last "]" line and re-add
-            last = lines.pop()  # removes "    ]"
-            for hole in classified.holes:
-                cx = _fmt(hole.center.x + offset.x)
-                cy = _fmt(hole.center.y + offset.y)
-                r = _fmt(hole.radius)
-                lines.append(f"        Circle(radius={r}).at({cx}, {cy}),")
-            lines.append(last)  # re-add "    ]"
-
-    lines.append("")
+        write("    board_shape = None  # No outline detected in DXF\n")
 
-    return "\n".join(lines)
+    # Cutouts, followed by holes as circular cutouts in the same list
+    if classified.cutouts or classified.holes:
+        write("\n")
+        write("    cutouts = [\n")
+        for cutout, has_arcs in zip(classified.cutouts, cutout_has_arcs):
+            expr = _path_expression(cutout, offset, indent_level=2, has_arcs=has_arcs)
+            write(f"        {expr},\n")
+        for hole in classified.holes:
+            cx = _fmt(hole.center.x + offset.x)
+            cy = _fmt(hole.center.y + offset.y)
+            r = _fmt(hole.radius)
+            write(f"        Circle(radius={r}).at({cx}, {cy}),\n")
+        write("    ]\n")
 
 
 def generate_outline_snippet(classified: ClassifiedEntities, recenter: bool = True) -> str:
@@ -150,15 +151,10 @@ def generate_outline_snippet(classified: ClassifiedEntities, recenter: bool = Tr
     if not classified.outline:
         return "# No outline detected in DXF"
 
-    offset = Point(0, 0)
-    if recenter:
-        bb = path_bounding_box(classified.outline)
-        offset = Point(
-            -(bb[0].x + bb[1].x) / 2.0,
-            -(bb[0].y + bb[1].y) / 2.0,
-        )
+    bb = path_bounding_box(classified.outline)
+    offset = _recenter_offset(bb) if recenter else Point(0, 0)
 
-    return f"board_shape = {_outline_expression(classified.outline, offset, indent_level=0)}"
+    return f"board_shape = {_outline_expression(classified.outline, offset, indent_level=0, bb=bb)}"
 
 
 def generate_cutouts_snippet(classified: ClassifiedEntities, recenter: bool = True) -> str:
@@ -168,11 +164,7 @@ def generate_cutouts_snippet(classified: ClassifiedEntities, recenter: bool = Tr
 
     offset = Point(0, 0)
     if recenter and classified.outline:
-        bb = path_bounding_box(classified.outline)
-        offset = Point(
-            -(bb[0].x + bb[1].x) / 2.0,
-            -(bb[0].y + bb[1].y) / 2.0,
-        )
+        offset = _recenter_offset(path_bounding_box(classified.outline))
 
     parts: list[str] = []
     parts.append("cutouts = [")
@@ -195,11 +187,7 @@ def generate_holes_snippet(classified: ClassifiedEntities, recenter: bool = True
 
     offset = Point(0, 0)
     if recenter and classified.outline:
-        bb = path_bounding_box(classified.outline)
-        offset = Point(
-            -(bb[0].x + bb[1].x) / 2.0,
-            -(bb[0].y + bb[1].y) / 2.0,
-        )
+        offset = _recenter_offset(path_bounding_box(classified.outline))
 
     parts: list[str] = []
     for hole in classified.holes:
@@ -210,9 +198,28 @@ def generate_holes_snippet(classified: ClassifiedEntities, recenter: bool = True
     return "\n".join(parts)
 
 
-def _outline_expression(path: ClosedPath, offset: Point, indent_level: int) -> str:
-    """Generate a shape expression for the board outline."""
-    bb = path_bounding_box(path)
+def _recenter_offset(bb: tuple[Point, Point]) -> Point:
+    """Return the offset that moves the center of a bounding box to the origin."""
+    return Point(
+        -(bb[0].x + bb[1].x) / 2.0,
+        -(bb[0].y + bb[1].y) / 2.0,
+    )
+
+
+def _outline_expression(
+    path: ClosedPath,
+    offset: Point,
+    indent_level: int,
+    has_arcs: bool | None = None,
+    bb: tuple[Point, Point] | None = None,
+) -> str:
+    """Generate a shape expression for the board outline.
+
+    ``has_arcs`` and ``bb`` may be passed when the caller has already
+    scanned the path or computed its bounding box.
+    """
+    if bb is None:
+        bb = path_bounding_box(path)
     w = bb[1].x - bb[0].x
     h = bb[1].y - bb[0].y
 
@@ -222,7 +229,8 @@ def _outline_expression(path: ClosedPath, offset: Point, indent_level: int) -> s
         cy = _fmt((bb[0].y + bb[1].y) / 2.0 + offset.y)
         return f"Polygon([({_fmt(-w/2)}, {_fmt(-h/2)}), ({_fmt(w/2)}, {_fmt(-h/2)}), ({_fmt(w/2)}, {_fmt(h/2)}), ({_fmt(-w/2)}, {_fmt(h/2)})])"
 
-    has_arcs = any(isinstance(s, ArcPathSegment) for s in path.segments)
+    if has_arcs is None:
+        has_arcs = _segment_kinds(path)[0]
 
     if has_arcs:
         return _arc_polygon_expression(path, offset, indent_level)
@@ -232,11 +240,12 @@ def _outline_expression(path: ClosedPath, offset: Point, indent_level: int) -> s
 
 def _polygon_expression(path: ClosedPath, offset: Point, indent_level: int) -> str:
     """Generate a Polygon expression from a path with only line segments."""
+    ox, oy = offset.x, offset.y
     points: list[str] = []
     for seg in path.segments:
         if isinstance(seg, LinePathSegment):
-            x = _fmt(seg.start.x + offset.x)
-            y = _fmt(seg.start.y + offset.y)
+            x = _fmt(seg.start.x + ox)
+            y = _fmt(seg.start.y + oy)
             points.append(f"({x}, {y})")
 
     if len(points) <= 6:
@@ -251,21 +260,22 @@ def _polygon_expression(path: ClosedPath, offset: Point, indent_level: int) -> s
 def _arc_polygon_expression(path: ClosedPath, offset: Point, indent_level: int) -> str:
     """Generate an ArcPolyline expression from a path with arcs."""
     pad = "    " * (indent_level + 1)
+    ox, oy = offset.x, offset.y
     elements: list[str] = []
 
     for seg in path.segments:
         if isinstance(seg, LinePathSegment):
-            x = _fmt(seg.start.x + offset.x)
-            y = _fmt(seg.start.y + offset.y)
+            x = _fmt(seg.start.x + ox)
+            y = _fmt(seg.start.y + oy)
             elements.append(f"({x}, {y})")
         elif isinstance(seg, ArcPathSegment):
             # Emit the start point, then the arc
-            sx = _fmt(seg.start_point.x + offset.x)
-            sy = _fmt(seg.start_point.y + offset.y)
+            sx = _fmt(seg.start_point.x + ox)
+            sy = _fmt(seg.start_point.y + oy)
             elements.append(f"({sx}, {sy})")
 
-            cx = _fmt(seg.center.x + offset.x)
-            cy = _fmt(seg.center.y + offset.y)
+            cx = _fmt(seg.center.x + ox)
+            cy = _fmt(seg.center.y + oy)
             r = _fmt(seg.radius)
             sa = _fmt(seg.start_angle)
             ea = _fmt(seg.end_angle)
@@ -275,24 +285,39 @@ def _arc_polygon_expression(path: ClosedPath, offset: Point, indent_level: int)
     return f"ArcPolyline([\n{pad}{inner},\n{'    ' * indent_level}])"
 
 
-def _path_expression(path: ClosedPath, offset: Point, indent_level: int) -> str:
+def _path_expression(
+    path: ClosedPath, offset: Point, indent_level: int, has_arcs: bool | None = None
+) -> str:
     """Generate a shape expression for a cutout or other path."""
-    has_arcs = any(isinstance(s, ArcPathSegment) for s in path.segments)
+    if has_arcs is None:
+        has_arcs = _segment_kinds(path)[0]
     if has_arcs:
         return _arc_polygon_expression(path, offset, indent_level)
     else:
         return _polygon_expression(path, offset, indent_level)
 
 
+def _segment_kinds(path: ClosedPath) -> tuple[bool, bool]:
+    """Return ``(has_arcs, has_lines)`` for a path in a single pass."""
+    has_arcs = has_lines = False
+    for seg in path.segments:
+        if isinstance(seg, ArcPathSegment):
+            has_arcs = True
+        elif isinstance(seg, LinePathSegment):
+            has_lines = True
+        if has_arcs and has_lines:
+            break
+    return has_arcs, has_lines
+
+
 def _is_axis_aligned_rectangle(path: ClosedPath) -> bool:
     """Check if a path is an axis-aligned rectangle (4 line segments, 90° turns)."""
     if len(path.segments) != 4:
         return False
-    if not all(isinstance(s, LinePathSegment) for s in path.segments):
-        return False
 
     for seg in path.segments:
-        assert isinstance(seg, LinePathSegment)
+        if not isinstance(seg, LinePathSegment):
+            return False
         dx = abs(seg.end.x - seg.start.x)
         dy = abs(seg.end.y - seg.start.y)
         if dx > 1e-6 and dy > 1e-6:
@@ -302,14 +327,10 @@ def _is_axis_aligned_rectangle(path: ClosedPath) -> bool:
 
 def _fmt(value: float) -> str:
     """Format a float for code generation, trimming unnecessary decimals."""
-    if abs(value) < 1e-6:
-        return "0.0"
-    # Round to 4 decimal places (0.1 μm precision)
-    rounded = round(value, 4)
-    if rounded == int(rounded):
-        return f"{int(rounded)}.0"
-    # Strip trailing zeros but keep at least one decimal
-    s = f"{rounded:.4f}".rstrip("0")
-    if s.endswith("."):
+    # Round to 4 decimal places (0.1 μm precision), then strip trailing
+    # zeros but keep at least one decimal
+    s = f"{value:.4f}".rstrip("0")
+    if s[-1] == ".":
         s += "0"
-    return s
+    # Values that round to zero from below format as "-0.0"
+    return "0.0" if s == "-0.0" else s
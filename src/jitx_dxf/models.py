@@ -5,13 +5,13 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Point:
     x: float
     y: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Pose:
     x: float
     y: float
@@ -19,14 +19,14 @@ class Pose:
     flip_x: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class LineSegment:
     p1: Point
     p2: Point
     width: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ArcSegment:
     center: Point
     radius: float
@@ -35,7 +35,7 @@ class ArcSegment:
     width: float
 
 
-@dataclass
+@dataclass(slots=True)
 class CirclePad:
     name: str
     center: Point  # local coordinates within package
@@ -44,7 +44,7 @@ class CirclePad:
     hole_radius: float = 0.0  # drill hole radius for TH pads (0 = SMD)
 
 
-@dataclass
+@dataclass(slots=True)
 class RectanglePad:
     name: str
     width: float
@@ -55,7 +55,7 @@ class RectanglePad:
     hole_radius: float = 0.0  # drill hole radius for TH pads (0 = SMD)
 
 
-@dataclass
+@dataclass(slots=True)
 class PolygonPad:
     name: str
     points: list[Point]  # pad shape vertices in pad-local coordinates
@@ -64,21 +64,21 @@ class PolygonPad:
     hole_radius: float = 0.0  # drill hole radius for TH pads (0 = SMD)
 
 
-@dataclass
+@dataclass(slots=True)
 class PolygonShape:
     points: list[Point]
     layer_name: str  # "SILKSCREEN" or "COURTYARD"
     side: str  # "Top" or "Bottom"
 
 
-@dataclass
+@dataclass(slots=True)
 class LineShape:
     line: LineSegment
     layer_name: str
     side: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TextShape:
     string: str
     size: float
@@ -97,7 +97,7 @@ class Package:
     lines: list[LineShape]
 
 
-@dataclass
+@dataclass(slots=True)
 class DesignatorText:
     string: str
     size: float
@@ -105,7 +105,7 @@ class DesignatorText:
     pose: Pose  # relative to instance pose
 
 
-@dataclass
+@dataclass(slots=True)
 class Instance:
     designator: str
     package_name: str
@@ -117,21 +117,21 @@ class Instance:
     shapes_line: list[LineShape] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class CopperShape:
     """A copper shape on a conductor layer, identified by layer index."""
     layer_index: int  # stackup layer index (0=top, N=bottom)
     net: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CopperLine(CopperShape):
     p1: Point = field(default_factory=lambda: Point(0, 0))
     p2: Point = field(default_factory=lambda: Point(0, 0))
     width: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class CopperArc(CopperShape):
     center: Point = field(default_factory=lambda: Point(0, 0))
     radius: float = 0.0
@@ -140,12 +140,12 @@ class CopperArc(CopperShape):
     width: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class CopperPolygon(CopperShape):
     points: list[Point] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class Via:
     center: Point
     diameter: float  # pad diameter
@@ -172,21 +172,23 @@ class BoardData:
 # --- DXF Reader intermediate types ---
 
 
-@dataclass
+@dataclass(slots=True)
 class PathSegment:
     """A segment of a path: either a line or an arc."""
 
 
-@dataclass
+@dataclass(slots=True)
 class LinePathSegment(PathSegment):
     start: Point = field(default_factory=lambda: Point(0, 0))
     end: Point = field(default_factory=lambda: Point(0, 0))
 
 
-@dataclass
+@dataclass(slots=True)
 class ArcPathSegment(PathSegment):
     center: Point = field(default_factory=lambda: Point(0, 0))
     radius: float = 0.0
+    # end_angle - start_angle is the signed sweep from start_point to
+    # end_point (positive = CCW); end_angle is not reduced modulo 360
     start_angle: float = 0.0  # degrees
     end_angle: float = 0.0  # degrees
     start_point: Point = field(default_factory=lambda: Point(0, 0))
@@ -200,14 +202,14 @@ class ClosedPath:
     source_layer: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class DxfCircle:
     center: Point = field(default_factory=lambda: Point(0, 0))
     radius: float = 0.0
     layer: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class DxfText:
     content: str = ""
     position: Point = field(default_factory=lambda: Point(0, 0))
@@ -216,7 +218,7 @@ class DxfText:
     layer: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class DxfHatch:
     boundary_paths: list[ClosedPath] = field(default_factory=list)
     is_solid: bool = False
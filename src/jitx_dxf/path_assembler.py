@@ -22,9 +22,27 @@ from .models import (
 # Type alias for a hashable point key (rounded to tolerance grid)
 type _PointKey = tuple[int, int]
 
+# Flattened (x1, y1, x2, y2) edge used for repeated ray casts
+type _Edge = tuple[float, float, float, float]
+
+# (y_min, y_max, bands) from edge_bands: edges bucketed by horizontal band
+type _EdgeBands = tuple[float, float, list[list[_Edge]]]
+
 # Precision multiplier for point hashing (1/tolerance)
 _GRID_INV = 1000  # default: 0.001 mm tolerance
 
+# Cardinal directions as (angle_deg, cos, sin) for arc bounding boxes
+_CARDINALS = tuple(
+    (angle, math.cos(math.radians(angle)), math.sin(math.radians(angle)))
+    for angle in (0.0, 90.0, 180.0, 270.0)
+)
+
+# Grid cells surrounding a point key; endpoints within tolerance of each
+# other can round into neighbouring cells
+_NEIGHBOR_OFFSETS = tuple(
+    (dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy
+)
+
 
 def _point_key(p: Point, grid_inv: int = _GRID_INV) -> _PointKey:
     """Hash a point to a grid cell for tolerance-based matching."""
@@ -76,13 +94,22 @@ def assemble_closed_paths(
         return []
 
     # Build adjacency: point_key -> list of (segment_index, is_start_endpoint)
+    # Endpoint keys are hashed once here and reused by the walk.
     adjacency: dict[_PointKey, list[tuple[int, bool]]] = defaultdict(list)
+    endpoints: list[tuple[Point, Point]] = []
+    endpoint_keys: list[tuple[_PointKey, _PointKey]] = []
     for i, seg in enumerate(segments):
         start, end = _segment_endpoints(seg)
-        adjacency[_point_key(start, grid_inv)].append((i, True))
-        adjacency[_point_key(end, grid_inv)].append((i, False))
-
-    used = [False] * len(segments)
+        start_key = _point_key(start, grid_inv)
+        end_key = _point_key(end, grid_inv)
+        endpoints.append((start, end))
+        endpoint_keys.append((start_key, end_key))
+        adjacency[start_key].append((i, True))
+        adjacency[end_key].append((i, False))
+
+    # One flag byte per segment (1 = on a loop, in the current walk, or pruned)
+    used = bytearray(len(segments))
+    _prune_dangling(endpoint_keys, adjacency, used)
     paths: list[ClosedPath] = []
 
     for start_idx in range(len(segments)):
@@ -90,69 +117,123 @@ def assemble_closed_paths(
             continue
 
         # Try to build a closed loop starting from this segment
-        loop = _walk_loop(segments, adjacency, used, start_idx, grid_inv)
+        loop = _walk_loop(
+            endpoints, endpoint_keys, adjacency, used, start_idx, tolerance
+        )
         if loop is not None:
-            paths.append(ClosedPath(segments=loop, source_layer=source_layer))
+            oriented = [
+                _flip_segment(segments[idx]) if flipped else segments[idx]
+                for idx, flipped in loop
+            ]
+            paths.append(ClosedPath(segments=oriented, source_layer=source_layer))
 
     return paths
 
 
+def _prune_dangling(
+    endpoint_keys: list[tuple[_PointKey, _PointKey]],
+    adjacency: dict[_PointKey, list[tuple[int, bool]]],
+    used: bytearray,
+) -> None:
+    """Mark segments that cannot lie on any closed loop as used.
+
+    A segment with an endpoint no other segment touches is a spur; removing
+    it may expose the next one, so spurs are peeled back until every
+    remaining endpoint is shared. Walks then never start on, or detour into,
+    an open branch. An endpoint only counts as unshared when the surrounding
+    grid cells are empty too, since the walk also matches across them.
+    """
+    degree = {key: len(incident) for key, incident in adjacency.items()}
+    stack = [key for key, count in degree.items() if count == 1]
+    while stack:
+        key = stack.pop()
+        if degree[key] != 1 or _has_neighbor(degree, key):
+            continue
+        for seg_idx, is_start in adjacency[key]:
+            if not used[seg_idx]:
+                break
+        used[seg_idx] = 1
+        degree[key] = 0
+        start_key, end_key = endpoint_keys[seg_idx]
+        other_key = end_key if is_start else start_key
+        degree[other_key] -= 1
+        stack.append(other_key)
+        kx, ky = other_key
+        for dx, dy in _NEIGHBOR_OFFSETS:
+            if degree.get((kx + dx, ky + dy)) == 1:
+                stack.append((kx + dx, ky + dy))
+
+
+def _has_neighbor(degree: dict[_PointKey, int], key: _PointKey) -> bool:
+    """Return True if any grid cell around key still has a live endpoint."""
+    kx, ky = key
+    return any(degree.get((kx + dx, ky + dy)) for dx, dy in _NEIGHBOR_OFFSETS)
+
+
 def _walk_loop(
-    segments: list[PathSegment],
+    endpoints: list[tuple[Point, Point]],
+    endpoint_keys: list[tuple[_PointKey, _PointKey]],
     adjacency: dict[_PointKey, list[tuple[int, bool]]],
-    used: list[bool],
+    used: bytearray,
     start_idx: int,
-    grid_inv: int,
-) -> list[PathSegment] | None:
+    tolerance: float,
+) -> list[tuple[int, bool]] | None:
     """Walk from a starting segment to find a closed loop.
 
-    Returns the list of segments forming the loop, or None if no loop found.
+    Endpoints are matched by grid cell first. Only when the current cell
+    offers no way on are the neighbouring cells probed, comparing true
+    distances against the tolerance.
+
+    Returns the loop as (segment_index, flipped) pairs in walk order, or
+    None if no loop found. Segments are only flipped once a loop closes.
     """
-    chain: list[PathSegment] = []
-    current_idx = start_idx
+    chain: list[tuple[int, bool]] = [(start_idx, False)]
+    used[start_idx] = 1
 
     # We start at the start-point of the first segment
-    seg = segments[current_idx]
-    start_pt, end_pt = _segment_endpoints(seg)
-    loop_start_key = _point_key(start_pt, grid_inv)
+    loop_start_key, current_key = endpoint_keys[start_idx]
 
-    chain.append(seg)
-    used[current_idx] = True
-    current_key = _point_key(end_pt, grid_inv)
-
-    max_steps = len(segments)
+    max_steps = len(endpoint_keys)
     for _ in range(max_steps):
-        if current_key == loop_start_key and len(chain) > 1:
-            return chain  # Closed loop found!
-
         # Find next unused segment connected at current_key
         next_seg = _find_next(adjacency, used, current_key)
+        if next_seg is None:
+            last_idx, last_flipped = chain[-1]
+            point = endpoints[last_idx][0 if last_flipped else 1]
+            if len(chain) > 1 and _within(point, endpoints[start_idx][0], tolerance):
+                return chain  # Closed across a grid-cell boundary
+            next_seg = _find_near(
+                endpoints, adjacency, used, current_key, point, tolerance
+            )
         if next_seg is None:
             # Dead end — mark segments as unused so they can be retried
             # from a different starting direction
-            for s in chain:
-                idx = segments.index(s)
-                used[idx] = False
+            for idx, _flipped in chain:
+                used[idx] = 0
             return None
 
         seg_idx, entering_at_start = next_seg
-        used[seg_idx] = True
-        seg = segments[seg_idx]
+        used[seg_idx] = 1
+        seg_start_key, seg_end_key = endpoint_keys[seg_idx]
 
-        # Orient the segment: if we entered at the end, flip it
-        if not entering_at_start:
-            seg = _flip_segment(seg)
+        # Orient the segment: if we entered at the end, it is walked flipped
+        if entering_at_start:
+            current_key = seg_end_key
+        else:
+            current_key = seg_start_key
+        chain.append((seg_idx, not entering_at_start))
 
-        chain.append(seg)
-        _, end_pt = _segment_endpoints(seg)
-        current_key = _point_key(end_pt, grid_inv)
+        # Closure is only possible once a segment has been added, so the
+        # check sits after the append instead of guarding on len(chain)
+        if current_key == loop_start_key:
+            return chain  # Closed loop found!
 
     return None  # Exceeded max steps
 
 
 def _find_next(
     adjacency: dict[_PointKey, list[tuple[int, bool]]],
-    used: list[bool],
+    used: bytearray,
     key: _PointKey,
 ) -> tuple[int, bool] | None:
     """Find the next unused segment connected at the given point key.
@@ -165,6 +246,37 @@ def _find_next(
     return None
 
 
+def _find_near(
+    endpoints: list[tuple[Point, Point]],
+    adjacency: dict[_PointKey, list[tuple[int, bool]]],
+    used: bytearray,
+    key: _PointKey,
+    point: Point,
+    tolerance: float,
+) -> tuple[int, bool] | None:
+    """Find an unused segment with an endpoint in a cell next to key.
+
+    Two endpoints closer than the tolerance can still round into adjacent
+    grid cells; candidates there are accepted by true distance.
+
+    Returns (segment_index, entering_at_start) or None.
+    """
+    kx, ky = key
+    for dx, dy in _NEIGHBOR_OFFSETS:
+        for seg_idx, is_start in adjacency.get((kx + dx, ky + dy), ()):
+            if used[seg_idx]:
+                continue
+            other = endpoints[seg_idx][0 if is_start else 1]
+            if _within(point, other, tolerance):
+                return (seg_idx, is_start)
+    return None
+
+
+def _within(p: Point, q: Point, tolerance: float) -> bool:
+    """Return True if two points are no further apart than tolerance."""
+    return math.hypot(p.x - q.x, p.y - q.y) <= tolerance
+
+
 def _flip_segment(seg: PathSegment) -> PathSegment:
     """Return a new segment with start/end reversed."""
     if isinstance(seg, LinePathSegment):
@@ -198,13 +310,13 @@ def lwpolyline_to_closed_path(
         A ClosedPath representing the polyline.
     """
     segments: list[PathSegment] = []
-    n = len(points)
-
-    for i in range(n):
-        p1 = Point(points[i][0], points[i][1])
-        p2 = Point(points[(i + 1) % n][0], points[(i + 1) % n][1])
-        bulge = bulges[i] if i < len(bulges) else 0.0
+    # One Point per vertex, shared by the segments ending and starting there
+    vertices = [Point(p[0], p[1]) for p in points]
+    # Vertices without a bulge value are straight segments
+    if len(bulges) < len(vertices):
+        bulges = [*bulges, *[0.0] * (len(vertices) - len(bulges))]
 
+    for p1, p2, bulge in zip(vertices, vertices[1:] + vertices[:1], bulges):
         if abs(bulge) < 1e-10:
             segments.append(LinePathSegment(start=p1, end=p2))
         else:
@@ -242,19 +354,17 @@ def _bulge_to_arc(p1: Point, p2: Point, bulge: float) -> ArcPathSegment:
     nx = -dy / chord
     ny = dx / chord
 
-    # Distance from midpoint to center
-    d = radius - abs(s)
-    if bulge > 0:
-        cx = mx + d * nx
-        cy = my + d * ny
-    else:
-        cx = mx - d * nx
-        cy = my - d * ny
+    # Signed distance from midpoint to center (toward the left for CCW)
+    d = (radius - abs(s)) * math.copysign(1.0, bulge)
+    cx = mx + d * nx
+    cy = my + d * ny
 
     center = Point(cx, cy)
 
     start_angle = math.degrees(math.atan2(p1.y - cy, p1.x - cx))
-    end_angle = math.degrees(math.atan2(p2.y - cy, p2.x - cx))
+    # Carry the traversal direction in the angles: the end is the start plus
+    # the signed included angle, rather than p2's own atan2 angle
+    end_angle = start_angle + math.degrees(4.0 * math.atan(bulge))
 
     return ArcPathSegment(
         center=center,
@@ -271,45 +381,58 @@ def path_bounding_box(path: ClosedPath) -> tuple[Point, Point]:
 
     Returns (min_point, max_point).
     """
-    xs: list[float] = []
-    ys: list[float] = []
+    xmin = ymin = math.inf
+    xmax = ymax = -math.inf
 
     for seg in path.segments:
         if isinstance(seg, LinePathSegment):
-            xs.extend([seg.start.x, seg.end.x])
-            ys.extend([seg.start.y, seg.end.y])
+            start, end = seg.start, seg.end
         elif isinstance(seg, ArcPathSegment):
-            xs.extend([seg.start_point.x, seg.end_point.x])
-            ys.extend([seg.start_point.y, seg.end_point.y])
+            start, end = seg.start_point, seg.end_point
             # Check if arc crosses any axis-aligned extremes
-            _arc_bbox_extend(seg, xs, ys)
+            for x, y in _arc_extremes(seg):
+                xmin = min(xmin, x)
+                xmax = max(xmax, x)
+                ymin = min(ymin, y)
+                ymax = max(ymax, y)
+        else:
+            continue
+        xmin = min(xmin, start.x, end.x)
+        xmax = max(xmax, start.x, end.x)
+        ymin = min(ymin, start.y, end.y)
+        ymax = max(ymax, start.y, end.y)
 
-    if not xs:
+    if xmin > xmax:
         return (Point(0, 0), Point(0, 0))
 
-    return (Point(min(xs), min(ys)), Point(max(xs), max(ys)))
+    return (Point(xmin, ymin), Point(xmax, ymax))
 
 
-def _arc_bbox_extend(arc: ArcPathSegment, xs: list[float], ys: list[float]) -> None:
-    """Extend xs/ys lists with axis-aligned extreme points of an arc."""
+def _arc_extremes(arc: ArcPathSegment) -> list[tuple[float, float]]:
+    """Return the axis-aligned extreme points an arc sweeps through."""
     sa = arc.start_angle % 360
     ea = arc.end_angle % 360
-
-    # Determine sweep direction from start_angle to end_angle
-    # Check each cardinal direction (0°, 90°, 180°, 270°)
-    for angle in [0.0, 90.0, 180.0, 270.0]:
+    if arc.end_angle < arc.start_angle:
+        # Clockwise arc: it covers the same angles as the CCW arc from end to start
+        sa, ea = ea, sa
+
+    # Check each cardinal direction (0°, 90°, 180°, 270°); the angles are
+    # normalized once here rather than per direction
+    extremes: list[tuple[float, float]] = []
+    for angle, cos_a, sin_a in _CARDINALS:
         if _angle_in_arc(angle, sa, ea):
-            rad = math.radians(angle)
-            xs.append(arc.center.x + arc.radius * math.cos(rad))
-            ys.append(arc.center.y + arc.radius * math.sin(rad))
+            extremes.append((
+                arc.center.x + arc.radius * cos_a,
+                arc.center.y + arc.radius * sin_a,
+            ))
+    return extremes
 
 
 def _angle_in_arc(angle: float, start: float, end: float) -> bool:
-    """Check if an angle lies within the arc from start to end (CCW)."""
-    angle = angle % 360
-    start = start % 360
-    end = end % 360
+    """Check if an angle lies within the arc from start to end (CCW).
 
+    All three angles must already be reduced to [0, 360).
+    """
     if start <= end:
         return start <= angle <= end
     # Arc wraps around 360
@@ -327,15 +450,15 @@ def path_area(path: ClosedPath) -> float:
     for seg in path.segments:
         if isinstance(seg, LinePathSegment):
             # Shoelace term: (x1*y2 - x2*y1)
-            area += seg.start.x * seg.end.y - seg.end.x * seg.start.y
+            start, end = seg.start, seg.end
+            area += start.x * end.y - end.x * start.y
         elif isinstance(seg, ArcPathSegment):
             # Shoelace for the chord
-            area += (
-                seg.start_point.x * seg.end_point.y
-                - seg.end_point.x * seg.start_point.y
-            )
-            # Add circular segment area
-            area += _arc_segment_area(seg)
+            start, end = seg.start_point, seg.end_point
+            area += start.x * end.y - end.x * start.y
+            # Add circular segment area, doubled like the shoelace terms
+            # since the sum is halved below
+            area += 2.0 * _arc_segment_area(seg)
 
     return area / 2.0
 
@@ -348,12 +471,8 @@ def _arc_segment_area(arc: ArcPathSegment) -> float:
     if arc.radius < 1e-12:
         return 0.0
 
-    # Sweep angle
-    sweep = (arc.end_angle - arc.start_angle) % 360
-    if sweep > 180:
-        sweep -= 360
-
-    sweep_rad = math.radians(sweep)
+    # Signed sweep angle (positive = CCW)
+    sweep_rad = math.radians(arc.end_angle - arc.start_angle)
 
     # Circular segment area = r² * (θ - sin(θ)) / 2
     seg_area = arc.radius**2 * (sweep_rad - math.sin(sweep_rad)) / 2.0
@@ -363,64 +482,163 @@ def _arc_segment_area(arc: ArcPathSegment) -> float:
     return seg_area
 
 
-def point_in_path(point: Point, path: ClosedPath) -> bool:
+def point_in_path(
+    point: Point, path: ClosedPath, bbox: tuple[Point, Point] | None = None
+) -> bool:
     """Test if a point lies inside a closed path using ray casting.
 
-    Casts a ray in the +X direction and counts crossings with path edges.
+    Casts a ray in the +X direction and sums signed crossings with path
+    edges (the winding number), so regions a self-intersecting path wraps
+    more than once still count as inside.
+    Callers testing many points against one path can pass its
+    path_bounding_box as bbox to reject outside points without a scan.
     """
-    crossings = 0
     px, py = point.x, point.y
+    if bbox is not None:
+        lo, hi = bbox
+        if not (lo.x <= px <= hi.x and lo.y <= py <= hi.y):
+            return False
+
+    winding = 0
 
     for seg in path.segments:
         if isinstance(seg, LinePathSegment):
-            crossings += _ray_crosses_line(px, py, seg)
+            winding += _ray_crosses_line(px, py, seg)
         elif isinstance(seg, ArcPathSegment):
-            crossings += _ray_crosses_arc(px, py, seg)
+            winding += _ray_crosses_arc(px, py, seg)
 
-    return crossings % 2 == 1
+    return winding != 0
 
 
 def _ray_crosses_line(px: float, py: float, seg: LinePathSegment) -> int:
-    """Count ray (+X direction from px,py) crossings with a line segment."""
-    y1, y2 = seg.start.y, seg.end.y
-    x1, x2 = seg.start.x, seg.end.x
+    """Signed ray (+X direction from px,py) crossing with a line segment.
+
+    Returns +1 for an upward crossing, -1 for a downward one, 0 for none.
+    """
+    start, end = seg.start, seg.end
+    y1, y2 = start.y, end.y
+    x1, x2 = start.x, end.x
 
     # Check if ray's y-level intersects the segment's y-range
-    if (y1 <= py < y2) or (y2 <= py < y1):
-        # Compute x-coordinate of intersection
-        t = (py - y1) / (y2 - y1)
-        x_intersect = x1 + t * (x2 - x1)
-        if x_intersect > px:
-            return 1
+    if y1 <= py < y2:
+        direction = 1
+    elif y2 <= py < y1:
+        direction = -1
+    else:
+        return 0
+    # Compute x-coordinate of intersection
+    t = (py - y1) / (y2 - y1)
+    x_intersect = x1 + t * (x2 - x1)
+    if x_intersect > px:
+        return direction
     return 0
 
 
 def _ray_crosses_arc(px: float, py: float, arc: ArcPathSegment) -> int:
-    """Count ray (+X direction from px,py) crossings with an arc.
+    """Signed ray (+X direction from px,py) crossings with an arc.
 
     Approximates the arc as line segments for the ray casting test.
     """
-    # Approximate arc with line segments
-    num_steps = max(8, int(abs(arc.end_angle - arc.start_angle) / 5))
-    crossings = 0
-
-    angles = []
-    sweep = arc.end_angle - arc.start_angle
-    for i in range(num_steps + 1):
+    cx, cy = arc.center.x, arc.center.y
+    r = arc.radius
+
+    # Every approximating vertex lies on the circle, so a ray that misses the
+    # circle's bounding box cannot cross any of the chords
+    if py < cy - r or py >= cy + r or px >= cx + r:
+        return 0
+
+    return _winding(px, py, _arc_chords(arc))
+
+
+def _arc_chords(arc: ArcPathSegment) -> list[_Edge]:
+    """Approximate an arc with (x1, y1, x2, y2) chords for ray casting."""
+    cx, cy = arc.center.x, arc.center.y
+    r = arc.radius
+    start_angle = arc.start_angle
+    sweep = arc.end_angle - start_angle
+    num_steps = max(8, int(abs(sweep) / 5))
+
+    chords: list[_Edge] = []
+    angle = math.radians(start_angle)
+    x1 = cx + r * math.cos(angle)
+    y1 = cy + r * math.sin(angle)
+    for i in range(1, num_steps + 1):
         t = i / num_steps
-        angle = math.radians(arc.start_angle + t * sweep)
-        angles.append(angle)
-
-    for i in range(len(angles) - 1):
-        x1 = arc.center.x + arc.radius * math.cos(angles[i])
-        y1 = arc.center.y + arc.radius * math.sin(angles[i])
-        x2 = arc.center.x + arc.radius * math.cos(angles[i + 1])
-        y2 = arc.center.y + arc.radius * math.sin(angles[i + 1])
-
-        if (y1 <= py < y2) or (y2 <= py < y1):
-            t = (py - y1) / (y2 - y1)
-            x_intersect = x1 + t * (x2 - x1)
-            if x_intersect > px:
-                crossings += 1
-
-    return crossings
+        angle = math.radians(start_angle + t * sweep)
+        x2 = cx + r * math.cos(angle)
+        y2 = cy + r * math.sin(angle)
+        chords.append((x1, y1, x2, y2))
+        x1, y1 = x2, y2
+    return chords
+
+
+def path_edges(path: ClosedPath) -> list[_Edge]:
+    """Flatten a closed path into (x1, y1, x2, y2) edges for repeated ray casts.
+
+    Arcs are replaced by the same chords point_in_path uses, so
+    point_in_edges(p.x, p.y, path_edges(path)) == point_in_path(p, path).
+    """
+    edges: list[_Edge] = []
+    for seg in path.segments:
+        if isinstance(seg, LinePathSegment):
+            start, end = seg.start, seg.end
+            edges.append((start.x, start.y, end.x, end.y))
+        elif isinstance(seg, ArcPathSegment):
+            edges.extend(_arc_chords(seg))
+    return edges
+
+
+def point_in_edges(px: float, py: float, edges: list[_Edge]) -> bool:
+    """Ray-cast test of (px, py) against edges from path_edges."""
+    return _winding(px, py, edges) != 0
+
+
+def _winding(px: float, py: float, edges: list[_Edge]) -> int:
+    """Sum signed +X ray crossings of (px, py) with edges (upward = +1)."""
+    winding = 0
+    for x1, y1, x2, y2 in edges:
+        if y1 <= py < y2:
+            if x1 + (py - y1) / (y2 - y1) * (x2 - x1) > px:
+                winding += 1
+        elif y2 <= py < y1:
+            if x1 + (py - y1) / (y2 - y1) * (x2 - x1) > px:
+                winding -= 1
+    return winding
+
+
+def edge_bands(edges: list[_Edge], num_bands: int) -> _EdgeBands:
+    """Bucket edges into horizontal bands so a ray cast only scans its own band.
+
+    An edge is listed in every band its y-range touches, so
+    point_in_edge_bands gives the same answer as point_in_edges while
+    testing only the edges near the query's y.
+    """
+    if not edges:
+        return (0.0, 0.0, [[]])
+    y_min = min(min(e[1], e[3]) for e in edges)
+    y_max = max(max(e[1], e[3]) for e in edges)
+    num_bands = max(1, num_bands)
+    bands: list[list[_Edge]] = [[] for _ in range(num_bands)]
+    for edge in edges:
+        y1, y2 = edge[1], edge[3]
+        lo = _band_index(min(y1, y2), y_min, y_max, num_bands)
+        hi = _band_index(max(y1, y2), y_min, y_max, num_bands)
+        for i in range(lo, hi + 1):
+            bands[i].append(edge)
+    return (y_min, y_max, bands)
+
+
+def point_in_edge_bands(px: float, py: float, edge_index: _EdgeBands) -> bool:
+    """Ray-cast test of (px, py) against the band from edge_bands containing py."""
+    y_min, y_max, bands = edge_index
+    if py < y_min or py > y_max:
+        return False
+    band = bands[_band_index(py, y_min, y_max, len(bands))]
+    return point_in_edges(px, py, band)
+
+
+def _band_index(y: float, y_min: float, y_max: float, num_bands: int) -> int:
+    """Return the band holding y, for y within [y_min, y_max]."""
+    if y_max <= y_min:
+        return 0
+    return min(int((y - y_min) / (y_max - y_min) * num_bands), num_bands - 1)
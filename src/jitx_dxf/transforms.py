@@ -2,10 +2,21 @@
 
 from __future__ import annotations
 
+import functools
 import math
 
 from .models import Point, Pose
 
+# Affine map ``(a, b, c, d, tx, ty)``: (x, y) -> (a*x + b*y + tx, c*x + d*y + ty)
+type Affine = tuple[float, float, float, float, float, float]
+
+
+@functools.lru_cache(maxsize=1024)
+def _angle_cos_sin(angle_deg: float) -> tuple[float, float]:
+    """Return (cos, sin) of an angle in degrees; board angles repeat heavily."""
+    angle_rad = math.radians(angle_deg)
+    return math.cos(angle_rad), math.sin(angle_rad)
+
 
 def transform_point(pt: Point, pose: Pose) -> Point:
     """Transform a point from package-local to board coordinates.
@@ -19,9 +30,7 @@ def transform_point(pt: Point, pose: Pose) -> Point:
     if pose.flip_x:
         px = -px
 
-    angle_rad = math.radians(pose.angle)
-    cos_a = math.cos(angle_rad)
-    sin_a = math.sin(angle_rad)
+    cos_a, sin_a = _angle_cos_sin(pose.angle)
 
     rx = px * cos_a - py * sin_a
     ry = px * sin_a + py * cos_a
@@ -29,6 +38,45 @@ def transform_point(pt: Point, pose: Pose) -> Point:
     return Point(x=rx + pose.x, y=ry + pose.y)
 
 
+def pose_affine(pose: Pose) -> Affine:
+    """Return the affine map equivalent to ``transform_point(pt, pose)``.
+
+    The flip is folded into the rotation so applying the map costs four
+    multiplies and four adds per point, with no trig.
+    """
+    cos_a, sin_a = _angle_cos_sin(pose.angle)
+    mirror = -1.0 if pose.flip_x else 1.0
+    return (mirror * cos_a, -sin_a, mirror * sin_a, cos_a, pose.x, pose.y)
+
+
+def compose_affine(inner: Affine, outer: Affine) -> Affine:
+    """Return the affine map that applies ``inner`` first, then ``outer``."""
+    ia, ib, ic, id_, itx, ity = inner
+    oa, ob, oc, od, otx, oty = outer
+    return (
+        oa * ia + ob * ic,
+        oa * ib + ob * id_,
+        oc * ia + od * ic,
+        oc * ib + od * id_,
+        oa * itx + ob * ity + otx,
+        oc * itx + od * ity + oty,
+    )
+
+
+def transform_xy(x: float, y: float, affine: Affine) -> tuple[float, float]:
+    """Map a single ``(x, y)`` coordinate pair without building a Point."""
+    a, b, c, d, tx, ty = affine
+    return (a * x + b * y + tx, c * x + d * y + ty)
+
+
+def transform_points(
+    points: list[Point], affine: Affine
+) -> list[tuple[float, float]]:
+    """Map package-local points to board ``(x, y)`` tuples in one pass."""
+    a, b, c, d, tx, ty = affine
+    return [(a * p.x + b * p.y + tx, c * p.x + d * p.y + ty) for p in points]
+
+
 def transform_angle(angle_deg: float, pose: Pose) -> float:
     """Transform an angle from package-local to board coordinates."""
     if pose.flip_x:
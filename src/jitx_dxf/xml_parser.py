@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import functools
 import xml.etree.ElementTree as ET
+from sys import intern
 
 from .models import (
     ArcSegment,
@@ -27,22 +29,40 @@ from .models import (
 )
 
 
-def _attr(elem: ET.Element, name: str, default: str = "0") -> str:
-    """Get an XML attribute as a non-None string."""
-    val = elem.get(name)
-    return val if val is not None else default
+def parse_point(elem: ET.Element) -> Point:
+    return Point(float(elem.get("X", "0")), float(elem.get("Y", "0")))
 
 
-def parse_point(elem: ET.Element) -> Point:
-    return Point(x=float(_attr(elem, "X")), y=float(_attr(elem, "Y")))
+def _parse_points(elem: ET.Element) -> list[Point]:
+    """Parse all POINT children of elem, in document order."""
+    # Inlined parse_point: polygons and tracks hold most of a board's points
+    return [
+        Point(float(p.get("X", "0")), float(p.get("Y", "0")))
+        for p in elem.findall("POINT")
+    ]
 
 
 def parse_pose(elem: ET.Element) -> Pose:
+    get = elem.get
+    return _pose(get("X", "0"), get("Y", "0"), get("ANGLE"), get("FLIPX"))
+
+
+@functools.lru_cache(maxsize=1024)
+def _pose(x: str, y: str, angle: str | None, flip: str | None) -> Pose:
+    """Build a Pose from raw POSE attribute strings.
+
+    Boards repeat the same poses heavily (identity RECTANGLE poses, text
+    offsets, pad grids), so identical attribute strings share one Pose;
+    sharing is safe because Pose is frozen.
+    """
+    # Positional construction: keyword calls cost noticeably more per object
+    if angle is None and flip is None:
+        return Pose(float(x), float(y), 0.0, False)
     return Pose(
-        x=float(_attr(elem, "X")),
-        y=float(_attr(elem, "Y")),
-        angle=float(_attr(elem, "ANGLE")),
-        flip_x=_attr(elem, "FLIPX", "false").lower() == "true",
+        float(x),
+        float(y),
+        0.0 if angle is None else float(angle),
+        flip is not None and flip.lower() == "true",
     )
 
 
@@ -52,31 +72,38 @@ def parse_board_boundary(
     lines: list[LineSegment] = []
     arcs: list[ArcSegment] = []
     for bb in board.findall("BOARD-BOUNDARY"):
-        line_elem = bb.find("LINE")
-        arc_elem = bb.find("ARC")
-        if line_elem is not None:
-            points = [parse_point(p) for p in line_elem.findall("POINT")]
-            width = float(line_elem.get("WIDTH", "0.0"))
-            if len(points) == 2:
-                lines.append(
-                    LineSegment(p1=points[0], p2=points[1], width=width)
-                )
-        elif arc_elem is not None:
-            arcs.append(
-                ArcSegment(
-                    center=Point(
-                        x=float(_attr(arc_elem, "X")),
-                        y=float(_attr(arc_elem, "Y")),
-                    ),
-                    radius=float(_attr(arc_elem, "RADIUS")),
-                    start_angle=float(_attr(arc_elem, "START_ANGLE")),
-                    end_angle=float(_attr(arc_elem, "END_ANGLE")),
-                    width=float(arc_elem.get("WIDTH", "0.0")),
-                )
-            )
+        _parse_boundary_element(bb, lines, arcs)
     return lines, arcs
 
 
+def _parse_boundary_element(
+    bb: ET.Element, lines: list[LineSegment], arcs: list[ArcSegment]
+) -> None:
+    """Append the LINE or ARC of one BOARD-BOUNDARY element."""
+    line_elem = bb.find("LINE")
+    arc_elem = bb.find("ARC")
+    if line_elem is not None:
+        points = _parse_points(line_elem)
+        width = float(line_elem.get("WIDTH", "0.0"))
+        if len(points) == 2:
+            lines.append(
+                LineSegment(points[0], points[1], width)
+            )
+    elif arc_elem is not None:
+        arcs.append(
+            ArcSegment(
+                center=Point(
+                    x=float(arc_elem.get("X", "0")),
+                    y=float(arc_elem.get("Y", "0")),
+                ),
+                radius=float(arc_elem.get("RADIUS", "0")),
+                start_angle=float(arc_elem.get("START_ANGLE", "0")),
+                end_angle=float(arc_elem.get("END_ANGLE", "0")),
+                width=float(arc_elem.get("WIDTH", "0.0")),
+            )
+        )
+
+
 def _parse_hole_radius(pad_elem: ET.Element) -> float:
     """Extract drill hole radius from a PAD's HOLE child, if present."""
     hole_elem = pad_elem.find("HOLE")
@@ -88,7 +115,7 @@ def _parse_hole_radius(pad_elem: ET.Element) -> float:
 
 
 def parse_package(pkg_elem: ET.Element) -> Package:
-    name = _attr(pkg_elem, "NAME")
+    name = pkg_elem.get("NAME", "0")
     pads: list[CirclePad] = []
     rectangle_pads: list[RectanglePad] = []
     polygon_pads: list[PolygonPad] = []
@@ -100,7 +127,7 @@ def parse_package(pkg_elem: ET.Element) -> Package:
         if pose_elem is None:
             continue
         pose = parse_pose(pose_elem)
-        side = pad_elem.get("SIDE", "Top")
+        side = intern(pad_elem.get("SIDE", "Top"))
         hole_radius = _parse_hole_radius(pad_elem)
         circle = pad_elem.find("CIRCLE")
         rectangle = pad_elem.find("RECTANGLE")
@@ -108,9 +135,9 @@ def parse_package(pkg_elem: ET.Element) -> Package:
         if circle is not None:
             pads.append(
                 CirclePad(
-                    name=_attr(pad_elem, "NAME"),
+                    name=pad_elem.get("NAME", "0"),
                     center=Point(x=pose.x, y=pose.y),
-                    radius=float(_attr(circle, "RADIUS")),
+                    radius=float(circle.get("RADIUS", "0")),
                     side=side,
                     hole_radius=hole_radius,
                 )
@@ -120,9 +147,9 @@ def parse_package(pkg_elem: ET.Element) -> Package:
             rect_pose = parse_pose(rect_pose_elem) if rect_pose_elem is not None else Pose(0.0, 0.0, 0.0, False)
             rectangle_pads.append(
                 RectanglePad(
-                    name=_attr(pad_elem, "NAME"),
-                    width=float(_attr(rectangle, "WIDTH")),
-                    height=float(_attr(rectangle, "HEIGHT")),
+                    name=pad_elem.get("NAME", "0"),
+                    width=float(rectangle.get("WIDTH", "0")),
+                    height=float(rectangle.get("HEIGHT", "0")),
                     rect_pose=rect_pose,
                     pad_pose=pose,
                     side=side,
@@ -130,10 +157,10 @@ def parse_package(pkg_elem: ET.Element) -> Package:
                 )
             )
         elif polygon is not None:
-            points = [parse_point(p) for p in polygon.findall("POINT")]
+            points = _parse_points(polygon)
             polygon_pads.append(
                 PolygonPad(
-                    name=_attr(pad_elem, "NAME"),
+                    name=pad_elem.get("NAME", "0"),
                     points=points,
                     pose=pose,
                     side=side,
@@ -145,27 +172,23 @@ def parse_package(pkg_elem: ET.Element) -> Package:
         layer_spec = shape_elem.find("LAYER-SPECIFIER")
         if layer_spec is None:
             continue
-        layer_name = _attr(layer_spec, "NAME")
-        side = layer_spec.get("SIDE", "Top")
+        layer_name = intern(layer_spec.get("NAME", "0"))
+        side = intern(layer_spec.get("SIDE", "Top"))
 
         polygon_elem = shape_elem.find("POLYGON")
         if polygon_elem is not None:
-            points = [parse_point(p) for p in polygon_elem.findall("POINT")]
+            points = _parse_points(polygon_elem)
             polygons.append(
-                PolygonShape(points=points, layer_name=layer_name, side=side)
+                PolygonShape(points, layer_name, side)
             )
 
         line_elem = shape_elem.find("LINE")
         if line_elem is not None:
-            pts = [parse_point(p) for p in line_elem.findall("POINT")]
+            pts = _parse_points(line_elem)
             width = float(line_elem.get("WIDTH", "0.0"))
             if len(pts) == 2:
                 lines.append(
-                    LineShape(
-                        line=LineSegment(p1=pts[0], p2=pts[1], width=width),
-                        layer_name=layer_name,
-                        side=side,
-                    )
+                    LineShape(LineSegment(pts[0], pts[1], width), layer_name, side)
                 )
 
     return Package(name=name, pads=pads, rectangle_pads=rectangle_pads, polygon_pads=polygon_pads, polygons=polygons, lines=lines)
@@ -183,9 +206,9 @@ def parse_instance(inst_elem: ET.Element) -> Instance:
             text_pose_elem = text_elem.find("POSE")
             assert text_pose_elem is not None
             des_text = DesignatorText(
-                string=_attr(text_elem, "STRING", ""),
+                string=text_elem.get("STRING", ""),
                 size=float(text_elem.get("SIZE", "1.0")),
-                anchor=_attr(text_elem, "ANCHOR", "C"),
+                anchor=text_elem.get("ANCHOR", "C"),
                 pose=parse_pose(text_pose_elem),
             )
     # Parse instance-level SHAPE children (value labels, custom geometry)
@@ -196,8 +219,8 @@ def parse_instance(inst_elem: ET.Element) -> Instance:
         layer_spec = shape_elem.find("LAYER-SPECIFIER")
         if layer_spec is None:
             continue
-        layer_name = layer_spec.get("NAME", "")
-        side = layer_spec.get("SIDE", "Top")
+        layer_name = intern(layer_spec.get("NAME", ""))
+        side = intern(layer_spec.get("SIDE", "Top"))
         text_elem = shape_elem.find("TEXT")
         if text_elem is not None:
             text_pose_elem = text_elem.find("POSE")
@@ -211,27 +234,23 @@ def parse_instance(inst_elem: ET.Element) -> Instance:
                 ))
         polygon_elem = shape_elem.find("POLYGON")
         if polygon_elem is not None:
-            points = [parse_point(p) for p in polygon_elem.findall("POINT")]
+            points = _parse_points(polygon_elem)
             inst_polygons.append(
-                PolygonShape(points=points, layer_name=layer_name, side=side)
+                PolygonShape(points, layer_name, side)
             )
         line_elem = shape_elem.find("LINE")
         if line_elem is not None:
-            pts = [parse_point(p) for p in line_elem.findall("POINT")]
+            pts = _parse_points(line_elem)
             width = float(line_elem.get("WIDTH", "0.0"))
             if len(pts) == 2:
                 inst_lines.append(
-                    LineShape(
-                        line=LineSegment(p1=pts[0], p2=pts[1], width=width),
-                        layer_name=layer_name,
-                        side=side,
-                    )
+                    LineShape(LineSegment(pts[0], pts[1], width), layer_name, side)
                 )
 
     return Instance(
-        designator=_attr(inst_elem, "DESIGNATOR", ""),
-        package_name=_attr(inst_elem, "PACKAGE", ""),
-        side=inst_elem.get("SIDE", "Top"),
+        designator=inst_elem.get("DESIGNATOR", ""),
+        package_name=intern(inst_elem.get("PACKAGE", "")),
+        side=intern(inst_elem.get("SIDE", "Top")),
         pose=pose,
         designator_text=des_text,
         shapes_text=inst_texts,
@@ -244,32 +263,35 @@ def parse_board_shapes(board: ET.Element) -> tuple[list[PolygonShape], list[Line
     polygons: list[PolygonShape] = []
     lines: list[LineShape] = []
     for shape_elem in board.findall("SHAPE"):
-        layer_spec = shape_elem.find("LAYER-SPECIFIER")
-        if layer_spec is None:
-            continue
-        layer_name = layer_spec.get("NAME", "")
-        side = layer_spec.get("SIDE", "Top")
-        polygon_elem = shape_elem.find("POLYGON")
-        if polygon_elem is not None:
-            points = [parse_point(p) for p in polygon_elem.findall("POINT")]
-            polygons.append(
-                PolygonShape(points=points, layer_name=layer_name, side=side)
-            )
-        line_elem = shape_elem.find("LINE")
-        if line_elem is not None:
-            pts = [parse_point(p) for p in line_elem.findall("POINT")]
-            width = float(line_elem.get("WIDTH", "0.0"))
-            if len(pts) == 2:
-                lines.append(
-                    LineShape(
-                        line=LineSegment(p1=pts[0], p2=pts[1], width=width),
-                        layer_name=layer_name,
-                        side=side,
-                    )
-                )
+        _parse_board_shape(shape_elem, polygons, lines)
     return polygons, lines
 
 
+def _parse_board_shape(
+    shape_elem: ET.Element, polygons: list[PolygonShape], lines: list[LineShape]
+) -> None:
+    """Append the POLYGON and/or LINE of one board-level SHAPE element."""
+    layer_spec = shape_elem.find("LAYER-SPECIFIER")
+    if layer_spec is None:
+        return
+    layer_name = intern(layer_spec.get("NAME", ""))
+    side = intern(layer_spec.get("SIDE", "Top"))
+    polygon_elem = shape_elem.find("POLYGON")
+    if polygon_elem is not None:
+        points = _parse_points(polygon_elem)
+        polygons.append(
+            PolygonShape(points, layer_name, side)
+        )
+    line_elem = shape_elem.find("LINE")
+    if line_elem is not None:
+        pts = _parse_points(line_elem)
+        width = float(line_elem.get("WIDTH", "0.0"))
+        if len(pts) == 2:
+            lines.append(
+                LineShape(LineSegment(pts[0], pts[1], width), layer_name, side)
+            )
+
+
 def _parse_layer_index(shape_elem: ET.Element) -> int:
     """Extract the layer index from a SHAPE's LAYER-INDEX child."""
     layer_idx = shape_elem.find("LAYER-INDEX")
@@ -281,57 +303,69 @@ def _parse_layer_index(shape_elem: ET.Element) -> int:
 def parse_tracks(board: ET.Element) -> list[CopperShape]:
     tracks: list[CopperShape] = []
     for track_elem in board.findall("TRACK"):
-        net = track_elem.get("NET", "")
-        for shape_elem in track_elem.findall("SHAPE"):
-            idx = _parse_layer_index(shape_elem)
-            polygon_elem = shape_elem.find("POLYGON")
-            line_elem = shape_elem.find("LINE")
-            arc_elem = shape_elem.find("ARC")
-            if polygon_elem is not None:
-                points = [parse_point(p) for p in polygon_elem.findall("POINT")]
-                tracks.append(CopperPolygon(layer_index=idx, net=net, points=points))
-            elif line_elem is not None:
-                pts = [parse_point(p) for p in line_elem.findall("POINT")]
-                width = float(line_elem.get("WIDTH", "0.0"))
-                if len(pts) == 2:
-                    tracks.append(CopperLine(
-                        layer_index=idx, net=net,
-                        p1=pts[0], p2=pts[1], width=width,
-                    ))
-            elif arc_elem is not None:
-                tracks.append(CopperArc(
-                    layer_index=idx, net=net,
-                    center=Point(
-                        x=float(_attr(arc_elem, "X")),
-                        y=float(_attr(arc_elem, "Y")),
-                    ),
-                    radius=float(_attr(arc_elem, "RADIUS")),
-                    start_angle=float(_attr(arc_elem, "START_ANGLE")),
-                    end_angle=float(_attr(arc_elem, "END_ANGLE")),
-                    width=float(arc_elem.get("WIDTH", "0.0")),
-                ))
+        _parse_track(track_elem, tracks)
     return tracks
 
 
+def _parse_track(track_elem: ET.Element, tracks: list[CopperShape]) -> None:
+    """Append the copper shapes of one TRACK element."""
+    net = intern(track_elem.get("NET", ""))
+    for shape_elem in track_elem.findall("SHAPE"):
+        idx = _parse_layer_index(shape_elem)
+        polygon_elem = shape_elem.find("POLYGON")
+        line_elem = shape_elem.find("LINE")
+        arc_elem = shape_elem.find("ARC")
+        if polygon_elem is not None:
+            points = _parse_points(polygon_elem)
+            tracks.append(CopperPolygon(idx, net, points))
+        elif line_elem is not None:
+            pts = _parse_points(line_elem)
+            width = float(line_elem.get("WIDTH", "0.0"))
+            if len(pts) == 2:
+                tracks.append(CopperLine(idx, net, pts[0], pts[1], width))
+        elif arc_elem is not None:
+            tracks.append(CopperArc(
+                layer_index=idx, net=net,
+                center=Point(
+                    x=float(arc_elem.get("X", "0")),
+                    y=float(arc_elem.get("Y", "0")),
+                ),
+                radius=float(arc_elem.get("RADIUS", "0")),
+                start_angle=float(arc_elem.get("START_ANGLE", "0")),
+                end_angle=float(arc_elem.get("END_ANGLE", "0")),
+                width=float(arc_elem.get("WIDTH", "0.0")),
+            ))
+
+
 def parse_fills(board: ET.Element) -> list[CopperPolygon]:
     fills: list[CopperPolygon] = []
     for fill_elem in board.findall("FILL"):
-        net = fill_elem.get("NET", "")
-        for shape_elem in fill_elem.findall("SHAPE"):
-            idx = _parse_layer_index(shape_elem)
-            polygon_elem = shape_elem.find("POLYGON")
-            if polygon_elem is not None:
-                points = [parse_point(p) for p in polygon_elem.findall("POINT")]
-                fills.append(CopperPolygon(layer_index=idx, net=net, points=points))
+        _parse_fill(fill_elem, fills)
     return fills
 
 
+def _parse_fill(fill_elem: ET.Element, fills: list[CopperPolygon]) -> None:
+    """Append the copper polygons of one FILL element."""
+    net = intern(fill_elem.get("NET", ""))
+    for shape_elem in fill_elem.findall("SHAPE"):
+        idx = _parse_layer_index(shape_elem)
+        polygon_elem = shape_elem.find("POLYGON")
+        if polygon_elem is not None:
+            points = _parse_points(polygon_elem)
+            fills.append(CopperPolygon(idx, net, points))
+
+
 def parse_stackup_names(board: ET.Element) -> dict[int, str]:
     """Parse stackup to build a mapping of conductor layer index -> name."""
-    names: dict[int, str] = {}
     stackup = board.find("STACKUP")
     if stackup is None:
-        return names
+        return {}
+    return _parse_stackup(stackup)
+
+
+def _parse_stackup(stackup: ET.Element) -> dict[int, str]:
+    """Map conductor layer index -> name for one STACKUP element."""
+    names: dict[int, str] = {}
     conductor_idx = 0
     for layer in stackup.findall("STACKUP-LAYER"):
         if layer.get("MATERIAL-TYPE") == "CONDUCTOR":
@@ -343,54 +377,103 @@ def parse_stackup_names(board: ET.Element) -> dict[int, str]:
 def parse_vias(board: ET.Element) -> list[Via]:
     vias: list[Via] = []
     for via_elem in board.findall("VIA"):
-        point_elem = via_elem.find("POINT")
-        if point_elem is None:
-            continue
-        start_layer = via_elem.find("START-LAYER")
-        end_layer = via_elem.find("END-LAYER")
-        start_side = "Top"
-        end_side = "Bottom"
-        if start_layer is not None:
-            li = start_layer.find("LAYER-INDEX")
-            if li is not None:
-                start_side = li.get("SIDE", "Top")
-        if end_layer is not None:
-            li = end_layer.find("LAYER-INDEX")
-            if li is not None:
-                end_side = li.get("SIDE", "Bottom")
-        vias.append(
-            Via(
-                center=parse_point(point_elem),
-                diameter=float(via_elem.get("DIAMETER", "0.0")),
-                hole_diameter=float(via_elem.get("HOLE-DIAMETER", "0.0")),
-                net=via_elem.get("NET", ""),
-                start_side=start_side,
-                end_side=end_side,
-            )
-        )
+        _parse_via(via_elem, vias)
     return vias
 
 
-def parse_xml(xml_path: str) -> BoardData:
-    tree = ET.parse(xml_path)
-    root = tree.getroot()
-    board = root.find("BOARD")
-    if board is None:
-        raise ValueError(f"No <BOARD> element found in {xml_path}")
+def _parse_via(via_elem: ET.Element, vias: list[Via]) -> None:
+    """Append one VIA element, skipping it if it has no POINT."""
+    point_elem = via_elem.find("POINT")
+    if point_elem is None:
+        return
+    start_layer = via_elem.find("START-LAYER")
+    end_layer = via_elem.find("END-LAYER")
+    start_side = "Top"
+    end_side = "Bottom"
+    if start_layer is not None:
+        li = start_layer.find("LAYER-INDEX")
+        if li is not None:
+            start_side = intern(li.get("SIDE", "Top"))
+    if end_layer is not None:
+        li = end_layer.find("LAYER-INDEX")
+        if li is not None:
+            end_side = intern(li.get("SIDE", "Bottom"))
+    vias.append(
+        Via(
+            center=parse_point(point_elem),
+            diameter=float(via_elem.get("DIAMETER", "0.0")),
+            hole_diameter=float(via_elem.get("HOLE-DIAMETER", "0.0")),
+            net=intern(via_elem.get("NET", "")),
+            start_side=start_side,
+            end_side=end_side,
+        )
+    )
 
-    boundary_lines, boundary_arcs = parse_board_boundary(board)
 
+def parse_xml(xml_path: str) -> BoardData:
+    """Parse a JITX board XML file into BoardData.
+
+    The document is streamed: each direct child of the first <BOARD> is
+    parsed as soon as its end tag arrives and then dropped, so memory stays
+    bounded by the largest single child rather than the whole tree.
+    """
+    boundary_lines: list[LineSegment] = []
+    boundary_arcs: list[ArcSegment] = []
     packages: dict[str, Package] = {}
-    for pkg_elem in board.findall("PACKAGE"):
-        pkg = parse_package(pkg_elem)
-        packages[pkg.name] = pkg
+    instances: list[Instance] = []
+    board_polygon_shapes: list[PolygonShape] = []
+    board_line_shapes: list[LineShape] = []
+    tracks: list[CopperShape] = []
+    fills: list[CopperPolygon] = []
+    vias: list[Via] = []
+    layer_names: dict[int, str] | None = None
+
+    root: ET.Element | None = None
+    board: ET.Element | None = None
+    in_board = False
+    depth = 0
+    for event, elem in ET.iterparse(xml_path, events=("start", "end")):
+        if event == "start":
+            depth += 1
+            if depth == 1:
+                root = elem
+            elif depth == 2 and board is None and elem.tag == "BOARD":
+                board = elem
+                in_board = True
+            continue
+
+        depth -= 1
+        if depth == 2 and in_board:
+            # A complete direct child of BOARD
+            tag = elem.tag
+            if tag == "PACKAGE":
+                pkg = parse_package(elem)
+                packages[pkg.name] = pkg
+            elif tag == "INST":
+                instances.append(parse_instance(elem))
+            elif tag == "TRACK":
+                _parse_track(elem, tracks)
+            elif tag == "SHAPE":
+                _parse_board_shape(elem, board_polygon_shapes, board_line_shapes)
+            elif tag == "VIA":
+                _parse_via(elem, vias)
+            elif tag == "FILL":
+                _parse_fill(elem, fills)
+            elif tag == "BOARD-BOUNDARY":
+                _parse_boundary_element(elem, boundary_lines, boundary_arcs)
+            elif tag == "STACKUP" and layer_names is None:
+                layer_names = _parse_stackup(elem)
+            elem.clear()
+            board.remove(elem)
+        elif depth == 1:
+            # A complete child of the root (BOARD, SCHEMATIC, ...)
+            if elem is board:
+                in_board = False
+            elem.clear()
+            root.remove(elem)
 
-    instances = [parse_instance(inst) for inst in board.findall("INST")]
-    board_polygon_shapes, board_line_shapes = parse_board_shapes(board)
-    tracks = parse_tracks(board)
-    fills = parse_fills(board)
-    vias = parse_vias(board)
-    layer_names = parse_stackup_names(board)
+    if board is None:
+        raise ValueError(f"No <BOARD> element found in {xml_path}")
 
     return BoardData(
         boundary_lines=boundary_lines,
@@ -402,5 +485,5 @@ def parse_xml(xml_path: str) -> BoardData:
         tracks=tracks,
         fills=fills,
         vias=vias,
-        layer_names=layer_names,
+        layer_names=layer_names if layer_names is not None else {},
     )
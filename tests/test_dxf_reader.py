@@ -4,9 +4,12 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import ezdxf
 import pytest
 
+from jitx_dxf import dxf_reader
 from jitx_dxf.dxf_reader import classify_entities, read_dxf
+from jitx_dxf.path_assembler import lwpolyline_to_closed_path
 
 FIXTURES = Path(__file__).parent / "fixtures"
 
@@ -40,6 +43,33 @@ class TestReadDxf:
         assert inv.entity_counts.get("LWPOLYLINE", 0) > 0
         assert inv.bounding_box is not None
 
+    def test_shared_document(self):
+        """A preloaded document gives the same results without re-reading the file."""
+        path = str(FIXTURES / "beeper_flex_outline.dxf")
+        doc = ezdxf.readfile(path)
+        assert read_dxf(path, doc=doc) == read_dxf(path)
+        shared = classify_entities(path, doc=doc)
+        assert shared.unit_scale == classify_entities(path).unit_scale
+        assert shared.outline is not None
+
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "beeper_flex_outline.dxf",
+            "hawk_outline.dxf",
+            "hawk_outline_screwholes.dxf",
+            "ottercast_logo.dxf",
+        ],
+    )
+    def test_streamed_inventory_matches(self, monkeypatch, name):
+        """Large files are streamed; the inventory matches a full load."""
+        path = str(FIXTURES / name)
+        full = read_dxf(path)
+        monkeypatch.setattr(dxf_reader, "_STREAM_THRESHOLD_BYTES", 0)
+        monkeypatch.setattr(dxf_reader, "_read_doc", None)  # must not load
+        streamed = read_dxf(path)
+        assert streamed == full
+
 
 class TestClassifyEntities:
     """Test DXF entity classification."""
@@ -99,3 +129,14 @@ class TestClassifyEntities:
         result = classify_entities(str(FIXTURES / "ottercast_logo.dxf"))
         # SPLINEs are skipped, but LWPOLYLINE paths should be found
         assert result is not None
+
+    def test_largest_outline_counts_multiply_wound_paths(self):
+        """A path traced twice can out-area a path with a bigger bounding box."""
+        square = lwpolyline_to_closed_path(
+            [(0, 0), (10, 0), (10, 10), (0, 10)], [0.0] * 4, "A"
+        )
+        twice = lwpolyline_to_closed_path(
+            [(20, 0), (28, 0), (28, 8), (20, 8)] * 2, [0.0] * 8, "B"
+        )
+        result = dxf_reader._classify_by_heuristics([square, twice], [], [], [], 1.0)
+        assert result.outline is twice
@@ -8,10 +8,12 @@ import pytest
 
 from jitx_dxf.dxf_reader import classify_entities
 from jitx_dxf.jitx_codegen import (
+    _fmt,
     generate_board_code,
     generate_cutouts_snippet,
     generate_holes_snippet,
     generate_outline_snippet,
+    write_board_code,
 )
 
 FIXTURES = Path(__file__).parent / "fixtures"
@@ -81,6 +83,14 @@ class TestGenerateBoardCode:
         # They should be different (hawk outline is already centered,
         # so they might be very similar — just check they don't crash)
 
+    def test_write_matches_generate(self, tmp_path):
+        """Streaming to a file should produce the same code as the string API."""
+        classified = classify_entities(str(FIXTURES / "hawk_outline_screwholes.dxf"))
+        out_file = tmp_path / "board.py"
+        with out_file.open("w") as f:
+            write_board_code(f, classified, class_name="HawkBoard")
+        assert out_file.read_text() == generate_board_code(classified, class_name="HawkBoard")
+
 
 class TestSnippets:
     """Test snippet generation."""
@@ -107,3 +117,24 @@ class TestSnippets:
         empty = ClassifiedEntities()
         snippet = generate_outline_snippet(empty)
         assert "No outline" in snippet
+
+
+class TestFmt:
+    """Test float formatting for generated code."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (0.0, "0.0"),
+            (3.0, "3.0"),
+            (-12.0, "-12.0"),
+            (2.5, "2.5"),
+            (1.23456, "1.2346"),
+            (0.1 + 0.2, "0.3"),
+            (1e-7, "0.0"),
+            (-0.00004, "0.0"),
+            (-0.00005, "-0.0001"),
+        ],
+    )
+    def test_fmt(self, value, expected):
+        assert _fmt(value) == expected
@@ -10,15 +10,33 @@ import pytest
 from jitx_dxf.models import ArcPathSegment, ClosedPath, LinePathSegment, Point
 from jitx_dxf.path_assembler import (
     assemble_closed_paths,
+    edge_bands,
     lwpolyline_to_closed_path,
     path_area,
     path_bounding_box,
+    path_edges,
+    point_in_edge_bands,
+    point_in_edges,
     point_in_path,
 )
 
 FIXTURES = Path(__file__).parent / "fixtures"
 
 
+def _clockwise_wrap_path() -> ClosedPath:
+    """Clockwise slot whose left end is a 60° CW bulge arc through 180°.
+
+    The arc runs from 210° to 150° on the unit circle, so its atan2 start and
+    end angles (-150°, 150°) wrap around ±180°.
+    """
+    c, s = math.cos(math.radians(30)), math.sin(math.radians(30))
+    return lwpolyline_to_closed_path(
+        [(-c, -s), (-c, s), (2, s), (2, -s)],
+        [-math.tan(math.radians(60) / 4), 0, 0, 0],
+        "",
+    )
+
+
 class TestAssembleClosedPaths:
     """Test assembling disconnected LINE/ARC segments into closed paths."""
 
@@ -68,6 +86,34 @@ class TestAssembleClosedPaths:
         paths = assemble_closed_paths([], [])
         assert paths == []
 
+    def test_dead_end_after_flipped_segment(self):
+        """An open chain that needed a flipped segment is released, not an error."""
+        lines = [
+            (Point(0, 0), Point(1, 0)),
+            (Point(2, 0), Point(1, 0)),  # entered at its end, so walked flipped
+            (Point(5, 5), Point(6, 5)),
+            (Point(6, 5), Point(6, 6)),
+            (Point(6, 6), Point(5, 5)),
+        ]
+        paths = assemble_closed_paths(lines, [])
+        assert len(paths) == 1
+        assert len(paths[0].segments) == 3
+
+    def test_spurs_do_not_block_loop(self):
+        """Open branches hanging off a loop are skipped rather than walked into."""
+        lines = [
+            (Point(0, 0), Point(-1, -1)),  # spur at (0, 0)
+            (Point(10, 5), Point(11, 6)),  # spur at (10, 5)
+            (Point(11, 6), Point(12, 6)),  # continues the second spur
+            (Point(0, 0), Point(10, 0)),
+            (Point(10, 0), Point(10, 5)),
+            (Point(10, 5), Point(0, 5)),
+            (Point(0, 5), Point(0, 0)),
+        ]
+        paths = assemble_closed_paths(lines, [])
+        assert len(paths) == 1
+        assert len(paths[0].segments) == 4
+
     def test_tolerance_matching(self):
         """Endpoints within tolerance should be considered connected."""
         lines = [
@@ -79,19 +125,27 @@ class TestAssembleClosedPaths:
         paths = assemble_closed_paths(lines, [], tolerance=0.001)
         assert len(paths) == 1
 
+    def test_tolerance_matching_across_grid_cells(self):
+        """Endpoints within tolerance that round to adjacent cells still join."""
+        lines = [
+            (Point(0, 0), Point(10.0004, 0)),
+            (Point(10.0006, 0), Point(10, 5)),  # 0.0002 away, next cell over
+            (Point(10, 5), Point(0, 5)),
+            (Point(0, 5), Point(0, -0.0006)),  # closes across a cell boundary
+        ]
+        paths = assemble_closed_paths(lines, [], tolerance=0.001)
+        assert len(paths) == 1
+        assert len(paths[0].segments) == 4
+
     def test_hawk_outline_from_dxf(self):
         """hawk_outline.dxf has 32 LINE entities forming 1 closed path."""
         import ezdxf
 
         doc = ezdxf.readfile(str(FIXTURES / "hawk_outline.dxf"))
-        msp = doc.modelspace()
-
-        lines = []
-        for entity in msp:
-            if entity.dxftype() == "LINE":
-                p1 = Point(entity.dxf.start.x, entity.dxf.start.y)
-                p2 = Point(entity.dxf.end.x, entity.dxf.end.y)
-                lines.append((p1, p2))
+        lines = [
+            (Point(e.dxf.start.x, e.dxf.start.y), Point(e.dxf.end.x, e.dxf.end.y))
+            for e in doc.modelspace().query("LINE")
+        ]
 
         assert len(lines) == 32
         paths = assemble_closed_paths(lines, [])
@@ -108,7 +162,7 @@ class TestLwpolylineToClosedPath:
         bulges = [0, 0, 0, 0]
         path = lwpolyline_to_closed_path(points, bulges, "test")
         assert len(path.segments) == 4
-        assert all(isinstance(s, LinePathSegment) for s in path.segments)
+        assert {type(s) for s in path.segments} == {LinePathSegment}
         assert path.source_layer == "test"
 
     def test_bulge_creates_arc(self):
@@ -119,6 +173,23 @@ class TestLwpolylineToClosedPath:
         assert isinstance(path.segments[0], ArcPathSegment)
         assert isinstance(path.segments[1], LinePathSegment)
 
+    @pytest.mark.parametrize(
+        ("bulge", "center_y"),
+        [
+            (math.tan(math.radians(90) / 4), 1.0),  # CCW quarter arc
+            (math.tan(math.radians(270) / 4), -1.0),  # CCW major arc
+            (-math.tan(math.radians(90) / 4), -1.0),  # CW quarter arc
+            (-math.tan(math.radians(270) / 4), 1.0),  # CW major arc
+        ],
+    )
+    def test_bulge_arc_center_side(self, bulge, center_y):
+        """The arc center lands on the correct side of the chord."""
+        path = lwpolyline_to_closed_path([(0, 0), (2, 0)], [bulge, 0], "test")
+        arc = path.segments[0]
+        assert arc.center.x == pytest.approx(1.0)
+        assert arc.center.y == pytest.approx(center_y)
+        assert arc.radius == pytest.approx(math.sqrt(2))
+
 
 class TestPathBoundingBox:
     """Test bounding box computation."""
@@ -140,6 +211,14 @@ class TestPathBoundingBox:
         assert bb_max.x == pytest.approx(5.0)
         assert bb_max.y == pytest.approx(8.0)
 
+    def test_clockwise_arc_extremes(self):
+        """A clockwise arc through 180° extends the box to the circle's left edge."""
+        bb_min, bb_max = path_bounding_box(_clockwise_wrap_path())
+        assert bb_min.x == pytest.approx(-1.0)
+        assert bb_min.y == pytest.approx(-0.5)
+        assert bb_max.x == pytest.approx(2.0)
+        assert bb_max.y == pytest.approx(0.5)
+
 
 class TestPathArea:
     """Test area computation."""
@@ -185,6 +264,12 @@ class TestPathArea:
         )
         assert abs(path_area(path)) == pytest.approx(12.0)
 
+    def test_clockwise_bulge_area(self):
+        """A clockwise path with an outward CW arc adds the full circular segment."""
+        c = math.cos(math.radians(30))
+        segment = (math.radians(60) - math.sin(math.radians(60))) / 2
+        assert path_area(_clockwise_wrap_path()) == pytest.approx(-((2 + c) + segment))
+
 
 class TestPointInPath:
     """Test point-in-path testing."""
@@ -213,3 +298,84 @@ class TestPointInPath:
         )
         assert point_in_path(Point(15, 5), path) is False
         assert point_in_path(Point(-1, 5), path) is False
+
+    def test_self_intersecting_pentagram(self):
+        """The doubly-wound center of a pentagram counts as inside."""
+        corners = [
+            Point(math.cos(math.radians(90 + 144 * i)), math.sin(math.radians(90 + 144 * i)))
+            for i in range(5)
+        ]
+        path = ClosedPath(
+            segments=[
+                LinePathSegment(start=corners[i], end=corners[(i + 1) % 5])
+                for i in range(5)
+            ],
+            source_layer="",
+        )
+        assert point_in_path(Point(0, 0.05), path) is True
+        assert point_in_path(Point(0, 0.7), path) is True
+        assert point_in_path(Point(0.9, 0.9), path) is False
+        edges = path_edges(path)
+        assert point_in_edges(0, 0.05, edges) is True
+
+    def test_clockwise_bulge_across_180(self):
+        """A CW arc whose angles wrap past ±180° is walked the short way round."""
+        path = _clockwise_wrap_path()
+        edges = path_edges(path)
+        for p, inside in [
+            (Point(-0.95, 0), True),  # in the arc's bulge
+            (Point(0, 0), True),
+            (Point(0, 0.8), False),  # inside the circle, outside the slot
+            (Point(0.5, -0.9), False),
+            (Point(-1.1, 0), False),
+        ]:
+            assert point_in_path(p, path) is inside
+            assert point_in_edges(p.x, p.y, edges) is inside
+
+    def test_bbox_matches_full_scan(self):
+        """Passing the bounding box never changes the answer."""
+        path = ClosedPath(
+            segments=[
+                LinePathSegment(start=Point(0, 0), end=Point(10, 0)),
+                ArcPathSegment(
+                    center=Point(10, 5), radius=5, start_angle=-90, end_angle=90,
+                    start_point=Point(10, 0), end_point=Point(10, 10),
+                ),
+                LinePathSegment(start=Point(10, 10), end=Point(0, 10)),
+                LinePathSegment(start=Point(0, 10), end=Point(0, 0)),
+            ],
+            source_layer="",
+        )
+        bbox = path_bounding_box(path)
+        for x in range(-2, 18):
+            for y in range(-2, 13):
+                p = Point(x + 0.5, y + 0.25)
+                assert point_in_path(p, path, bbox) == point_in_path(p, path)
+
+    def test_edges_match_point_in_path(self):
+        """Flattened edges give the same answer as point_in_path, arcs included."""
+        path = lwpolyline_to_closed_path(
+            [(0, 0), (10, 0), (10, 10), (0, 10)],
+            [0.0, 0.5, 0.0, 0.0],
+            "",
+        )
+        edges = path_edges(path)
+        for x in range(-2, 15):
+            for y in range(-2, 13):
+                p = Point(x + 0.25, y + 0.25)
+                assert point_in_edges(p.x, p.y, edges) == point_in_path(p, path)
+
+    def test_edge_bands_match_point_in_path(self):
+        """Banded edges give the same answer as point_in_path for any band count."""
+        path = lwpolyline_to_closed_path(
+            [(0, 0), (10, 0), (10, 10), (5, 4), (0, 10)],
+            [0.0, 0.5, 0.0, 0.0, 0.0],
+            "",
+        )
+        edges = path_edges(path)
+        for num_bands in (1, 3, 16):
+            bands = edge_bands(edges, num_bands)
+            for x in range(-2, 15):
+                for y in range(-2, 13):
+                    p = Point(x + 0.25, y + 0.25)
+                    assert point_in_edge_bands(p.x, p.y, bands) == point_in_path(p, path)
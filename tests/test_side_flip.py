@@ -9,19 +9,16 @@ from pathlib import Path
 
 import ezdxf
 
-from jitx_dxf.dxf_writer import convert
+from jitx_dxf.dxf_writer import convert, emit_instance
+from jitx_dxf.xml_parser import parse_xml
 
 FIXTURE = Path(__file__).parent / "fixtures" / "side_flip_test.xml"
 
 
 def _layer_counts(dxf_path: str) -> dict[str, int]:
-    """Return a Counter of {layer_name: entity_count} for the DXF."""
+    """Return {layer_name: entity_count} for the DXF."""
     doc = ezdxf.readfile(dxf_path)
-    msp = doc.modelspace()
-    counts: dict[str, int] = Counter()
-    for e in msp:
-        counts[e.dxf.layer] += 1
-    return dict(counts)
+    return dict(Counter(e.dxf.layer for e in doc.modelspace()))
 
 
 def test_top_instance_keeps_top_layers(tmp_path: Path) -> None:
@@ -93,3 +90,26 @@ def test_both_instances_unfiltered(tmp_path: Path) -> None:
     # Each instance contributes 1 custom-layer polygon
     assert counts.get("FINISH_Top", 0) == 1
     assert counts.get("FINISH_Bottom", 0) == 1
+
+
+def test_quiet_conversion(tmp_path: Path, capsys) -> None:
+    """verbose=False writes the same DXF without printing a summary."""
+    out = str(tmp_path / "out.dxf")
+    convert(str(FIXTURE), out, verbose=False)
+    assert capsys.readouterr().out == ""
+    assert _layer_counts(out).get("Pads_Top", 0) == 2
+
+
+def test_shared_templates_respect_layer_filter() -> None:
+    """One templates dict reused with different filters resolves shapes per filter."""
+    data = parse_xml(str(FIXTURE))
+    inst = data.instances[0]
+    templates: dict = {}
+
+    filtered = ezdxf.new().modelspace()
+    emit_instance(filtered, inst, data.packages, {"Courtyard_Top"}, templates)
+    unfiltered = ezdxf.new().modelspace()
+    emit_instance(unfiltered, inst, data.packages, None, templates)
+
+    assert {e.dxf.layer for e in filtered} == {"Courtyard_Top"}
+    assert Counter(e.dxf.layer for e in unfiltered)["Silkscreen_Top"] == 2
@@ -0,0 +1,51 @@
+"""Tests for the transforms module."""
+
+from __future__ import annotations
+
+import pytest
+
+from jitx_dxf.models import Point, Pose
+from jitx_dxf.transforms import (
+    compose_affine,
+    pose_affine,
+    transform_point,
+    transform_points,
+    transform_xy,
+)
+
+POSES = [
+    Pose(0.0, 0.0, 0.0, False),
+    Pose(1.5, -2.0, 90.0, False),
+    Pose(-3.0, 4.0, 37.5, True),
+    Pose(10.0, 0.25, 270.0, True),
+]
+
+POINTS = [Point(0.0, 0.0), Point(1.0, 0.0), Point(-0.5, 2.25), Point(3.0, -4.0)]
+
+
+class TestPoseAffine:
+    """Test affine maps against the point-by-point transform."""
+
+    @pytest.mark.parametrize("pose", POSES)
+    def test_matches_transform_point(self, pose):
+        mapped = transform_points(POINTS, pose_affine(pose))
+        for pt, (x, y) in zip(POINTS, mapped):
+            expected = transform_point(pt, pose)
+            assert x == pytest.approx(expected.x, abs=1e-12)
+            assert y == pytest.approx(expected.y, abs=1e-12)
+
+    @pytest.mark.parametrize("inner", POSES)
+    @pytest.mark.parametrize("outer", POSES)
+    def test_compose_matches_chained_transforms(self, inner, outer):
+        affine = compose_affine(pose_affine(inner), pose_affine(outer))
+        mapped = transform_points(POINTS, affine)
+        for pt, (x, y) in zip(POINTS, mapped):
+            expected = transform_point(transform_point(pt, inner), outer)
+            assert x == pytest.approx(expected.x, abs=1e-12)
+            assert y == pytest.approx(expected.y, abs=1e-12)
+
+    @pytest.mark.parametrize("pose", POSES)
+    def test_xy_matches_points(self, pose):
+        affine = pose_affine(pose)
+        mapped = transform_points(POINTS, affine)
+        assert [transform_xy(p.x, p.y, affine) for p in POINTS] == mapped
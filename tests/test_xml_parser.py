@@ -0,0 +1,74 @@
+"""Tests for the xml_parser module."""
+
+from __future__ import annotations
+
+import xml.etree.ElementTree as ET
+from dataclasses import FrozenInstanceError
+from pathlib import Path
+
+import pytest
+
+from jitx_dxf.models import Pose
+from jitx_dxf.xml_parser import parse_pose, parse_xml
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+class TestParseXml:
+    """Test streaming parse of JITX board XML."""
+
+    def test_side_flip_fixture(self):
+        data = parse_xml(str(FIXTURES / "side_flip_test.xml"))
+        assert len(data.boundary_lines) == 4
+        assert list(data.packages) == ["TEST-PKG"]
+        assert [inst.designator for inst in data.instances] == ["U1", "U2"]
+        assert data.layer_names == {0: "F.Cu", 1: "B.Cu"}
+
+    def test_missing_board_raises(self, tmp_path):
+        xml = tmp_path / "empty.xml"
+        xml.write_text("<JITX-BOARD><SCHEMATIC/></JITX-BOARD>")
+        with pytest.raises(ValueError, match="No <BOARD>"):
+            parse_xml(str(xml))
+
+    def test_only_first_board_is_read(self, tmp_path):
+        xml = tmp_path / "two_boards.xml"
+        xml.write_text(
+            "<JITX-BOARD>"
+            "<SCHEMATIC><VIA NET='X'><POINT X='9' Y='9'/></VIA></SCHEMATIC>"
+            "<BOARD>"
+            "<STACKUP><STACKUP-LAYER NAME='A' MATERIAL-TYPE='CONDUCTOR'/></STACKUP>"
+            "<STACKUP><STACKUP-LAYER NAME='B' MATERIAL-TYPE='CONDUCTOR'/></STACKUP>"
+            "<VIA NET='GND'><POINT X='1' Y='2'/></VIA>"
+            "</BOARD>"
+            "<BOARD><VIA NET='VCC'><POINT X='3' Y='4'/></VIA></BOARD>"
+            "</JITX-BOARD>"
+        )
+        data = parse_xml(str(xml))
+        assert [via.net for via in data.vias] == ["GND"]
+        assert data.layer_names == {0: "A"}
+
+    def test_reparse_is_unaffected_by_caller_changes(self):
+        """Shared poses cannot be changed, so a later parse sees the file's values."""
+        path = str(FIXTURES / "side_flip_test.xml")
+        first = parse_xml(path)
+        pose = first.instances[0].pose
+        expected = Pose(pose.x, pose.y, pose.angle, pose.flip_x)
+        with pytest.raises(FrozenInstanceError):
+            pose.x += 100
+        assert parse_xml(path).instances[0].pose == expected
+
+
+class TestParsePose:
+    """Test POSE attribute defaults."""
+
+    @pytest.mark.parametrize(
+        ("xml", "expected"),
+        [
+            ('<POSE X="1" Y="2"/>', Pose(1.0, 2.0, 0.0, False)),
+            ('<POSE ANGLE="90"/>', Pose(0.0, 0.0, 90.0, False)),
+            ('<POSE FLIPX="TRUE"/>', Pose(0.0, 0.0, 0.0, True)),
+            ('<POSE X="1" Y="2" ANGLE="45" FLIPX="false"/>', Pose(1.0, 2.0, 45.0, False)),
+        ],
+    )
+    def test_defaults(self, xml, expected):
+        assert parse_pose(ET.fromstring(xml)) == expected